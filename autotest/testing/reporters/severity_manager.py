@@ -18,15 +18,52 @@
 Severity level management and reporting for AutoTest accessibility testing
 """
 
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
-import datetime
+from functools import cached_property
+import bisect
+import operator
 
 from autotest.models.test_result import AccessibilityViolation, TestResult
 from autotest.utils.logger import LoggerMixin
 
 
+# Lower bounds of the positive severity score bands, paired with _SCORE_MESSAGES
+_SCORE_BANDS = (25, 50, 80)
+_SCORE_MESSAGES = (
+    "✅ GOOD: Minor issues remain. Polish for excellent accessibility.",
+    "📈 IMPROVING: Good progress, but continue addressing remaining issues.",
+    "⚠️ HIGH RISK: Significant accessibility barriers present. Plan remediation sprint.",
+    "🔥 CRITICAL SITE: Immediate accessibility review and remediation required."
+)
+_NO_VIOLATIONS_MESSAGE = "🎉 EXCELLENT: No accessibility violations detected!"
+
+# Per-severity recommendation templates
+_CRITICAL_TEMPLATE = (
+    "🚨 URGENT: Fix {} critical accessibility issues immediately. "
+    "These prevent users from accessing content."
+)
+_SERIOUS_OVER_TEMPLATE = (
+    "⚠️ HIGH PRIORITY: Address {} serious accessibility issues. "
+    "Target: Reduce to {} or fewer."
+)
+_SERIOUS_TEMPLATE = "⚠️ Address {} serious accessibility issues for better compliance."
+_MODERATE_OVER_TEMPLATE = (
+    "📋 MODERATE: Fix {} moderate issues. "
+    "Target: Reduce to {} or fewer for good accessibility."
+)
+_MINOR_TEMPLATE = "✨ ENHANCEMENT: Address {} minor issues to improve overall quality."
+_FOCUS_TIP = "💡 TIP: Focus on critical and serious issues first - they have the biggest impact on users."
+
+_SEVERITY_DESCRIPTIONS = {
+    'critical': 'Blocks access to content or functionality',
+    'serious': 'Makes content difficult or impossible to use',
+    'moderate': 'Causes inconvenience or confusion for users',
+    'minor': 'Minor usability or compliance issues'
+}
+
+
 class SeverityLevel(Enum):
     """Enumeration of accessibility violation severity levels"""
     MINOR = "minor"
@@ -51,24 +88,48 @@ class SeverityLevel(Enum):
         return severity_values.get(severity, 1)
 
 
-@dataclass
+_PRIORITY_ORDER = tuple(SeverityLevel.get_priority_order())
+_PRIORITY_IMPACTS = frozenset((SeverityLevel.CRITICAL.value, SeverityLevel.SERIOUS.value))
+
+
+class SeverityExample(NamedTuple):
+    """Example violation shown for a severity level"""
+    rule_id: str
+    description: str
+    help: str
+    node_count: int
+
+
+@dataclass(frozen=True)
 class SeverityStats:
     """Statistics for a specific severity level"""
+    __slots__ = ('level', 'count', 'percentage', 'examples')
+    
     level: str
     count: int
     percentage: float
-    examples: List[Dict[str, Any]]
+    examples: Tuple[SeverityExample, ...]
+
+
+# Shared stats for levels with no violations, the common case on clean sites
+_EMPTY_STATS = {level: SeverityStats(level, 0, 0.0, ()) for level in _PRIORITY_ORDER}
 
 
 @dataclass 
 class SeverityReport:
     """Comprehensive severity report"""
     total_violations: int
-    severity_stats: List[SeverityStats]
+    severity_stats: Dict[str, SeverityStats]
     severity_score: float
-    priority_violations: List[AccessibilityViolation]
+    priority_violations_count: int
     recommendations: List[str]
     trend_data: Optional[Dict[str, Any]] = None
+    violations: List[AccessibilityViolation] = field(default_factory=list, repr=False)
+    
+    @cached_property
+    def priority_violations(self) -> List[AccessibilityViolation]:
+        """Critical and serious violations, filtered on first access"""
+        return [v for v in self.violations if v.impact in _PRIORITY_IMPACTS]
 
 
 class SeverityManager(LoggerMixin):
@@ -83,6 +144,10 @@ class SeverityManager(LoggerMixin):
             'minor': {'max_allowed': 25, 'weight': 1.0}
         }
         
+        # Per-result violation counts keyed by result ID for trend analysis
+        self._trend_cache: Dict[str, Dict[str, int]] = {}
+        self.trend_cache_size = 10000
+        
         self.wcag_mappings = {
             'critical': [
                 'Images without alt text prevent screen reader access',
@@ -120,52 +185,49 @@ class SeverityManager(LoggerMixin):
             if not violations:
                 return SeverityReport(
                     total_violations=0,
-                    severity_stats=[],
+                    severity_stats={},
                     severity_score=0.0,
-                    priority_violations=[],
+                    priority_violations_count=0,
                     recommendations=["No accessibility violations found! Great job!"]
                 )
             
-            # Count violations by severity
+            # Count violations by severity, keeping the first few of each as examples
             severity_counts = {}
+            examples_by_severity = {}
             for violation in violations:
                 severity = violation.impact
                 severity_counts[severity] = severity_counts.get(severity, 0) + 1
+                
+                examples = examples_by_severity.setdefault(severity, [])
+                if len(examples) < 3:  # Max 3 examples
+                    examples.append(SeverityExample(
+                        violation.violation_id,
+                        violation.description,
+                        violation.help,
+                        len(violation.nodes)
+                    ))
             
-            # Create severity statistics
-            severity_stats = []
+            # Create severity statistics, keyed by level in priority order
+            severity_stats = {}
             total_violations = len(violations)
             
-            for severity_level in SeverityLevel.get_priority_order():
+            for severity_level in _PRIORITY_ORDER:
                 count = severity_counts.get(severity_level, 0)
-                percentage = (count / total_violations) * 100 if total_violations > 0 else 0.0
+                if count == 0:
+                    severity_stats[severity_level] = _EMPTY_STATS[severity_level]
+                    continue
                 
-                # Get examples of this severity level
-                examples = []
-                severity_violations = [v for v in violations if v.impact == severity_level]
-                for violation in severity_violations[:3]:  # Max 3 examples
-                    examples.append({
-                        'rule_id': violation.violation_id,
-                        'description': violation.description,
-                        'help': violation.help,
-                        'node_count': len(violation.nodes)
-                    })
+                percentage = (count / total_violations) * 100
                 
-                severity_stats.append(SeverityStats(
+                severity_stats[severity_level] = SeverityStats(
                     level=severity_level,
                     count=count,
                     percentage=round(percentage, 1),
-                    examples=examples
-                ))
+                    examples=tuple(examples_by_severity[severity_level])
+                )
             
             # Calculate severity score
-            severity_score = self._calculate_severity_score(violations)
-            
-            # Get priority violations (critical and serious)
-            priority_violations = [
-                v for v in violations 
-                if v.impact in ['critical', 'serious']
-            ]
+            severity_score = self._score_from_counts(severity_counts)
             
             # Generate recommendations
             recommendations = self._generate_recommendations(severity_counts, severity_score)
@@ -174,17 +236,18 @@ class SeverityManager(LoggerMixin):
                 total_violations=total_violations,
                 severity_stats=severity_stats,
                 severity_score=severity_score,
-                priority_violations=priority_violations,
-                recommendations=recommendations
+                priority_violations_count=severity_counts.get('critical', 0) + severity_counts.get('serious', 0),
+                recommendations=recommendations,
+                violations=violations
             )
             
         except Exception as e:
             self.logger.error(f"Error analyzing violations: {e}")
             return SeverityReport(
                 total_violations=len(violations),
-                severity_stats=[],
+                severity_stats={},
                 severity_score=0.0,
-                priority_violations=[],
+                priority_violations_count=0,
                 recommendations=["Error analyzing violations"]
             )
     
@@ -201,23 +264,45 @@ class SeverityManager(LoggerMixin):
         if not violations:
             return 0.0
         
-        total_weighted_score = 0.0
-        max_possible_score = 0.0
-        
         severity_counts = {}
         for violation in violations:
             severity = violation.impact
             severity_counts[severity] = severity_counts.get(severity, 0) + 1
         
+        return self._score_from_counts(severity_counts)
+    
+    def _score_from_counts(self, severity_counts: Dict[str, int]) -> float:
+        """
+        Calculate severity score from pre-computed counts by severity
+        
+        Args:
+            severity_counts: Count of violations by severity
+        
+        Returns:
+            Severity score as float
+        """
+        total_weighted_score = 0.0
+        max_possible_score = 0.0
+        
+        # Thresholds are read on every call so changes to severity_thresholds
+        # apply here as well as in the recommendations
         for severity, count in severity_counts.items():
-            weight = self.severity_thresholds.get(severity, {}).get('weight', 1.0)
-            max_allowed = self.severity_thresholds.get(severity, {}).get('max_allowed', 0)
+            if not count:
+                continue
+            
+            # Unknown levels fall back to weight 1.0 with no allowance
+            threshold = self.severity_thresholds.get(severity)
+            if threshold is None:
+                total_weighted_score += count
+                max_possible_score += 10
+                continue
+            
+            weight = threshold['weight']
+            max_allowed = threshold['max_allowed']
             
             # Score increases exponentially for violations above threshold
             excess_violations = max(0, count - max_allowed)
-            severity_score = (excess_violations * weight) + (min(count, max_allowed) * weight * 0.5)
-            
-            total_weighted_score += severity_score
+            total_weighted_score += (excess_violations + min(count, max_allowed) * 0.5) * weight
             max_possible_score += weight * 10  # Arbitrary max scale
         
         # Normalize to 0-100 scale
@@ -242,71 +327,42 @@ class SeverityManager(LoggerMixin):
         """
         recommendations = []
         
+        critical_count = severity_counts.get('critical', 0)
+        serious_count = severity_counts.get('serious', 0)
+        moderate_count = severity_counts.get('moderate', 0)
+        minor_count = severity_counts.get('minor', 0)
+        
         # Critical violations - immediate action required
-        if severity_counts.get('critical', 0) > 0:
-            recommendations.append(
-                f"🚨 URGENT: Fix {severity_counts['critical']} critical accessibility issues immediately. "
-                "These prevent users from accessing content."
-            )
+        if critical_count > 0:
+            recommendations.append(_CRITICAL_TEMPLATE.format(critical_count))
         
         # Serious violations - high priority
-        if severity_counts.get('serious', 0) > 0:
-            count = severity_counts['serious']
+        if serious_count > 0:
             threshold = self.severity_thresholds['serious']['max_allowed']
-            if count > threshold:
-                recommendations.append(
-                    f"⚠️ HIGH PRIORITY: Address {count} serious accessibility issues. "
-                    f"Target: Reduce to {threshold} or fewer."
-                )
+            if serious_count > threshold:
+                recommendations.append(_SERIOUS_OVER_TEMPLATE.format(serious_count, threshold))
             else:
-                recommendations.append(
-                    f"⚠️ Address {count} serious accessibility issues for better compliance."
-                )
+                recommendations.append(_SERIOUS_TEMPLATE.format(serious_count))
         
         # Moderate violations
-        if severity_counts.get('moderate', 0) > 0:
-            count = severity_counts['moderate']
+        if moderate_count > 0:
             threshold = self.severity_thresholds['moderate']['max_allowed']
-            if count > threshold:
-                recommendations.append(
-                    f"📋 MODERATE: Fix {count} moderate issues. "
-                    f"Target: Reduce to {threshold} or fewer for good accessibility."
-                )
+            if moderate_count > threshold:
+                recommendations.append(_MODERATE_OVER_TEMPLATE.format(moderate_count, threshold))
         
         # Minor violations
-        if severity_counts.get('minor', 0) > 0:
-            count = severity_counts['minor']
-            recommendations.append(
-                f"✨ ENHANCEMENT: Address {count} minor issues to improve overall quality."
-            )
+        if minor_count > 0:
+            recommendations.append(_MINOR_TEMPLATE.format(minor_count))
         
         # Overall score recommendations
-        if severity_score >= 80:
-            recommendations.append(
-                "🔥 CRITICAL SITE: Immediate accessibility review and remediation required."
-            )
-        elif severity_score >= 50:
-            recommendations.append(
-                "⚠️ HIGH RISK: Significant accessibility barriers present. Plan remediation sprint."
-            )
-        elif severity_score >= 25:
-            recommendations.append(
-                "📈 IMPROVING: Good progress, but continue addressing remaining issues."
-            )
-        elif severity_score > 0:
-            recommendations.append(
-                "✅ GOOD: Minor issues remain. Polish for excellent accessibility."
-            )
+        if severity_score > 0:
+            recommendations.append(_SCORE_MESSAGES[bisect.bisect_right(_SCORE_BANDS, severity_score)])
         else:
-            recommendations.append(
-                "🎉 EXCELLENT: No accessibility violations detected!"
-            )
+            recommendations.append(_NO_VIOLATIONS_MESSAGE)
         
         # Add specific guidance based on violation patterns
-        if severity_counts.get('critical', 0) > 0 or severity_counts.get('serious', 0) > 0:
-            recommendations.append(
-                "💡 TIP: Focus on critical and serious issues first - they have the biggest impact on users."
-            )
+        if critical_count > 0 or serious_count > 0:
+            recommendations.append(_FOCUS_TIP)
         
         return recommendations
     
@@ -326,30 +382,28 @@ class SeverityManager(LoggerMixin):
             if not test_results:
                 return {'trend': 'no_data', 'message': 'No test results available'}
             
-            # Sort results by date
-            sorted_results = sorted(test_results, key=lambda x: x.test_date or datetime.datetime.min)
+            # Sort results by date, undated results first
+            sorted_results = [r for r in test_results if r.test_date is None]
+            dated_results = [r for r in test_results if r.test_date is not None]
+            dated_results.sort(key=operator.attrgetter('test_date'))
+            sorted_results.extend(dated_results)
             
             # Calculate severity scores over time
             score_history = []
             severity_history = []
             
             for result in sorted_results[-days:]:  # Last N days
-                violations = result.violations
-                score = self._calculate_severity_score(violations)
-                
-                severity_counts = {}
-                for violation in violations:
-                    severity_counts[violation.impact] = severity_counts.get(violation.impact, 0) + 1
+                score, severity_counts = self._get_result_severity(result)
                 
                 score_history.append({
                     'date': result.test_date,
                     'score': score,
-                    'total_violations': len(violations)
+                    'total_violations': len(result.violations)
                 })
                 
                 severity_history.append({
                     'date': result.test_date,
-                    'counts': severity_counts
+                    'counts': dict(severity_counts)
                 })
             
             if len(score_history) < 2:
@@ -390,6 +444,33 @@ class SeverityManager(LoggerMixin):
             self.logger.error(f"Error calculating severity trend: {e}")
             return {'trend': 'error', 'message': f'Error analyzing trend: {str(e)}'}
     
+    def _get_result_severity(self, result: TestResult) -> Tuple[float, Dict[str, int]]:
+        """
+        Get severity score and counts for a test result, reusing earlier work
+        
+        Stored test results do not change once saved, so results with an ID
+        are only counted the first time they are seen. The score is always
+        computed from the current severity thresholds.
+        
+        Args:
+            result: Test result to score
+        
+        Returns:
+            Tuple of (severity score, count of violations by severity)
+        """
+        severity_counts = self._trend_cache.get(result.result_id) if result.result_id else None
+        if severity_counts is None:
+            severity_counts = {}
+            for violation in result.violations:
+                severity_counts[violation.impact] = severity_counts.get(violation.impact, 0) + 1
+            
+            if result.result_id:
+                if len(self._trend_cache) >= self.trend_cache_size:
+                    self._trend_cache.clear()
+                self._trend_cache[result.result_id] = severity_counts
+        
+        return self._score_from_counts(severity_counts), severity_counts
+    
     def prioritize_violations(self, violations: List[AccessibilityViolation]) -> List[AccessibilityViolation]:
         """
         Sort violations by priority (severity and frequency)
@@ -499,15 +580,10 @@ class SeverityManager(LoggerMixin):
             self.logger.error(f"Error getting severity distribution: {e}")
             return {'total': 0, 'distribution': {}, 'percentages': {}, 'severity_breakdown': []}
     
-    def _get_severity_description(self, severity: str) -> str:
+    @staticmethod
+    def _get_severity_description(severity: str) -> str:
         """Get human-readable description for severity level"""
-        descriptions = {
-            'critical': 'Blocks access to content or functionality',
-            'serious': 'Makes content difficult or impossible to use',
-            'moderate': 'Causes inconvenience or confusion for users', 
-            'minor': 'Minor usability or compliance issues'
-        }
-        return descriptions.get(severity, 'Unknown severity level')
+        return _SEVERITY_DESCRIPTIONS.get(severity, 'Unknown severity level')
     
     def export_severity_report(self, severity_report: SeverityReport, 
                              format: str = 'json') -> Dict[str, Any]:
@@ -523,12 +599,13 @@ class SeverityManager(LoggerMixin):
         """
         try:
             if format == 'summary':
+                severity_stats = severity_report.severity_stats
                 return {
                     'summary': {
                         'total_violations': severity_report.total_violations,
                         'severity_score': severity_report.severity_score,
-                        'critical_count': next((s.count for s in severity_report.severity_stats if s.level == 'critical'), 0),
-                        'serious_count': next((s.count for s in severity_report.severity_stats if s.level == 'serious'), 0),
+                        'critical_count': severity_stats.get('critical', _EMPTY_STATS['critical']).count,
+                        'serious_count': severity_stats.get('serious', _EMPTY_STATS['serious']).count,
                         'top_recommendation': severity_report.recommendations[0] if severity_report.recommendations else 'No recommendations'
                     }
                 }
@@ -541,11 +618,11 @@ class SeverityManager(LoggerMixin):
                             'level': stat.level,
                             'count': stat.count,
                             'percentage': stat.percentage,
-                            'examples': stat.examples
+                            'examples': [example._asdict() for example in stat.examples]
                         }
-                        for stat in severity_report.severity_stats
+                        for stat in severity_report.severity_stats.values()
                     ],
-                    'priority_violations_count': len(severity_report.priority_violations),
+                    'priority_violations_count': severity_report.priority_violations_count,
                     'recommendations': severity_report.recommendations,
                     'trend_data': severity_report.trend_data
                 }
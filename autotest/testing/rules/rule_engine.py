@@ -19,8 +19,12 @@ Rule engine and configuration system for AutoTest accessibility testing
 """
 
 import json
-from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, asdict
+import os
+import sys
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, List, Optional, Any, Callable, Set, Tuple
+from dataclasses import dataclass
 from pathlib import Path
 import importlib.util
 
@@ -28,9 +32,91 @@ from selenium import webdriver
 
 from autotest.utils.logger import LoggerMixin
 from autotest.utils.config import Config
+from autotest.utils.compat import DATACLASS_SLOTS
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Parsed JSON files shared by all engines, keyed by absolute path with (mtime_ns, size)
+_JSON_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_JSON_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _read_json_file(path: Path) -> Any:
+    """
+    Read and parse a JSON file, reusing the parsed data while the file is unchanged
+    
+    The returned data is shared between callers and must not be mutated.
+    
+    Args:
+        path: JSON file to read
+    
+    Returns:
+        Parsed JSON data
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    with _JSON_FILE_CACHE_LOCK:
+        entry = _JSON_FILE_CACHE.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+    
+    with open(key, 'rb') as f:
+        data = _json_loads(f.read())
+    
+    with _JSON_FILE_CACHE_LOCK:
+        _JSON_FILE_CACHE[key] = (signature, data)
+    return data
+
+
+def _write_json_file(path: Path, data: Any) -> None:
+    """
+    Write data as JSON, replacing the file atomically
+    
+    The data is written to a temporary sibling file which is then renamed over
+    the target, so readers never see a partially written file.
+    
+    Args:
+        path: JSON file to write
+        data: Data to serialize
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps(data))
+    os.replace(tmp_path, path)
+    
+    with _JSON_FILE_CACHE_LOCK:
+        _JSON_FILE_CACHE.pop(os.path.abspath(path), None)
+
+
+# Consolidated copy of all custom rule files, kept in the custom rules directory
+CUSTOM_RULES_MANIFEST = '_manifest.json'
+
+_VALID_IMPACTS = frozenset(sys.intern(impact) for impact in ("minor", "moderate", "serious", "critical"))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RuleDefinition:
     """Definition of an accessibility test rule"""
     rule_id: str
@@ -41,14 +127,31 @@ class RuleDefinition:
     impact: str  # "minor", "moderate", "serious", "critical"
     category: str  # "wcag21", "semantic", "custom"
     enabled: bool = True
-    tags: List[str] = None
+    tags: FrozenSet[str] = None
     
     def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+        if self.impact not in _VALID_IMPACTS:
+            raise ValueError(f"Invalid impact level: {self.impact}")
+        # Frozen, so normalise fields through object.__setattr__
+        object.__setattr__(self, 'impact', sys.intern(self.impact))
+        object.__setattr__(self, 'tags', frozenset(self.tags or ()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON storage"""
+        return {
+            'rule_id': self.rule_id,
+            'name': self.name,
+            'description': self.description,
+            'help_text': self.help_text,
+            'help_url': self.help_url,
+            'impact': self.impact,
+            'category': self.category,
+            'enabled': self.enabled,
+            'tags': sorted(self.tags)
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RuleConfiguration:
     """Configuration for a specific rule"""
     rule_id: str
@@ -59,11 +162,184 @@ class RuleConfiguration:
     def __post_init__(self):
         if self.custom_parameters is None:
             self.custom_parameters = {}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON storage"""
+        return {
+            'rule_id': self.rule_id,
+            'enabled': self.enabled,
+            'custom_impact': self.custom_impact,
+            'custom_parameters': self.custom_parameters
+        }
+
+
+# Built-in accessibility rules, shared by every RuleEngine
+_BUILTIN_RULES: Tuple[RuleDefinition, ...] = (
+    # Basic accessibility rules
+    RuleDefinition(
+        rule_id="page-has-title",
+        name="Page has title",
+        description="Ensures every HTML document has a non-empty <title> element",
+        help_text="All pages must have a title to help users understand the page content",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/page-titled.html",
+        impact="serious",
+        category="wcag21",
+        tags=["title", "navigation", "wcag21-2.4.2"]
+    ),
+    RuleDefinition(
+        rule_id="page-has-heading",
+        name="Page has heading",
+        description="Ensures the page has at least one heading (h1-h6)",
+        help_text="Pages should have proper heading structure for screen readers",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/info-and-relationships.html",
+        impact="serious",
+        category="wcag21",
+        tags=["headings", "structure", "wcag21-1.3.1"]
+    ),
+    RuleDefinition(
+        rule_id="images-have-alt",
+        name="Images have alt text",
+        description="Ensures all images have alternative text",
+        help_text="Images must have alt attributes for screen readers",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/non-text-content.html",
+        impact="critical",
+        category="wcag21",
+        tags=["images", "alt-text", "wcag21-1.1.1"]
+    ),
+    RuleDefinition(
+        rule_id="links-have-names",
+        name="Links have accessible names",
+        description="Ensures links have discernible text",
+        help_text="Links must have text content or accessible names",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/link-purpose-in-context.html",
+        impact="serious",
+        category="wcag21",
+        tags=["links", "navigation", "wcag21-2.4.4"]
+    ),
+    RuleDefinition(
+        rule_id="form-labels",
+        name="Form inputs have labels",
+        description="Ensures every form input has an associated label",
+        help_text="Form controls must be properly labeled for accessibility",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/labels-or-instructions.html",
+        impact="critical",
+        category="wcag21",
+        tags=["forms", "labels", "wcag21-3.3.2"]
+    ),
+    
+    # WCAG 2.1 advanced rules
+    RuleDefinition(
+        rule_id="color-contrast",
+        name="Color contrast",
+        description="Ensures text has sufficient color contrast",
+        help_text="Text must have adequate contrast ratio for readability",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/contrast-minimum.html",
+        impact="serious",
+        category="wcag21",
+        tags=["color", "contrast", "wcag21-1.4.3"]
+    ),
+    RuleDefinition(
+        rule_id="keyboard-navigation",
+        name="Keyboard navigation",
+        description="Ensures all interactive elements are keyboard accessible",
+        help_text="All functionality must be available via keyboard",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/keyboard.html",
+        impact="critical",
+        category="wcag21",
+        tags=["keyboard", "navigation", "wcag21-2.1.1"]
+    ),
+    RuleDefinition(
+        rule_id="focus-visible",
+        name="Focus indicators",
+        description="Ensures focusable elements have visible focus indicators",
+        help_text="Interactive elements must have visible focus indicators",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/focus-visible.html",
+        impact="serious",
+        category="wcag21",
+        tags=["focus", "keyboard", "wcag21-2.4.7"]
+    ),
+    RuleDefinition(
+        rule_id="aria-labels",
+        name="ARIA labels and roles",
+        description="Ensures proper use of ARIA labels and roles",
+        help_text="ARIA attributes must be used correctly for accessibility",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/name-role-value.html",
+        impact="serious",
+        category="wcag21",
+        tags=["aria", "labels", "wcag21-4.1.2"]
+    ),
+    RuleDefinition(
+        rule_id="landmark-regions",
+        name="Landmark regions",
+        description="Ensures proper landmark regions for navigation",
+        help_text="Pages should have proper landmark structure",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/bypass-blocks.html",
+        impact="moderate",
+        category="wcag21",
+        tags=["landmarks", "navigation", "wcag21-2.4.1"]
+    ),
+    
+    # HTML semantic rules
+    RuleDefinition(
+        rule_id="html-structure",
+        name="HTML structure",
+        description="Validates basic HTML document structure",
+        help_text="HTML documents must have proper structure",
+        help_url="https://html.spec.whatwg.org/multipage/semantics.html",
+        impact="serious",
+        category="semantic",
+        tags=["html", "structure", "validation"]
+    ),
+    RuleDefinition(
+        rule_id="semantic-elements",
+        name="Semantic HTML elements",
+        description="Validates proper use of HTML5 semantic elements",
+        help_text="Use semantic HTML elements for better accessibility",
+        help_url="https://html.spec.whatwg.org/multipage/sections.html",
+        impact="moderate",
+        category="semantic",
+        tags=["html5", "semantic", "structure"]
+    ),
+    RuleDefinition(
+        rule_id="heading-hierarchy",
+        name="Heading hierarchy",
+        description="Ensures headings are in proper hierarchical order",
+        help_text="Headings should follow proper nesting order (h1, h2, h3, etc.)",
+        help_url="https://www.w3.org/WAI/WCAG21/Understanding/info-and-relationships.html",
+        impact="moderate",
+        category="semantic",
+        tags=["headings", "structure", "hierarchy"]
+    ),
+    RuleDefinition(
+        rule_id="list-structure",
+        name="List structure",
+        description="Validates proper list markup and structure",
+        help_text="Lists should use proper HTML list elements",
+        help_url="https://html.spec.whatwg.org/multipage/semantics.html#the-ul-element",
+        impact="minor",
+        category="semantic",
+        tags=["lists", "structure", "html"]
+    ),
+    RuleDefinition(
+        rule_id="form-structure",
+        name="Form structure",
+        description="Validates proper form markup and structure",
+        help_text="Forms should use proper HTML form elements and structure",
+        help_url="https://html.spec.whatwg.org/multipage/forms.html",
+        impact="moderate",
+        category="semantic",
+        tags=["forms", "structure", "html"]
+    )
+)
 
 
 class RuleEngine(LoggerMixin):
     """Accessibility testing rule engine with configuration support"""
     
+    # Locations of custom rule files and saved rule configurations
+    _CUSTOM_RULES_DIR = Path('autotest/testing/rules/custom')
+    _RULE_CONFIG_FILE = Path('autotest/testing/rules/rule_config.json')
+    
     def __init__(self, config: Config):
         """
         Initialize rule engine
@@ -77,8 +353,30 @@ class RuleEngine(LoggerMixin):
         self.rule_configurations: Dict[str, RuleConfiguration] = {}
         self.custom_rules_enabled = config.get('testing.custom_rules_enabled', True)
         
+        # Rule ID indexes used to answer get_enabled_rules queries
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._enabled_ids: Set[str] = set()
+        
+        # Unfiltered get_enabled_rules result, dropped whenever the enabled rules change
+        self._enabled_rules_cache: Optional[List[RuleDefinition]] = None
+        
+        # Effective impact per rule ID, resolved when a rule is indexed, and its reverse index
+        self._effective_impact: Dict[str, str] = {}
+        self._by_impact: Dict[str, Set[str]] = {}
+        
         # Initialize built-in rules
         self._initialize_builtin_rules()
+        self._rebuild_indexes()
+        
+        # Custom rules and rule configurations are read from disk on first use
+        self._loaded = False
+    
+    def _ensure_loaded(self) -> None:
+        """Load custom rules and rule configurations if not done yet"""
+        if self._loaded:
+            return
+        self._loaded = True
         
         # Load custom rules if enabled
         if self.custom_rules_enabled:
@@ -86,249 +384,225 @@ class RuleEngine(LoggerMixin):
         
         # Load rule configurations
         self._load_rule_configurations()
+        
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the category, tag, impact and enabled rule ID indexes"""
+        self._by_category = {}
+        self._by_tag = {}
+        self._enabled_ids = set()
+        self._enabled_rules_cache = None
+        self._effective_impact = {}
+        self._by_impact = {}
+        
+        for rule in self.rules.values():
+            self._index_rule(rule)
+    
+    def _index_rule(self, rule: RuleDefinition) -> None:
+        """Add a rule to the category, tag, impact and enabled rule ID indexes"""
+        self._by_category.setdefault(rule.category, set()).add(rule.rule_id)
+        for tag in rule.tags:
+            self._by_tag.setdefault(tag, set()).add(rule.rule_id)
+        self._update_enabled_index(rule.rule_id)
+        self._clear_effective_impact(rule.rule_id)
+        self._resolve_rule_impact(rule.rule_id)
+    
+    def _unindex_rule(self, rule: RuleDefinition) -> None:
+        """Remove a rule from the category, tag, impact and enabled rule ID indexes"""
+        self._by_category.get(rule.category, set()).discard(rule.rule_id)
+        for tag in rule.tags:
+            self._by_tag.get(tag, set()).discard(rule.rule_id)
+        self._enabled_ids.discard(rule.rule_id)
+        self._enabled_rules_cache = None
+        self._clear_effective_impact(rule.rule_id)
+    
+    def _set_effective_impact(self, rule_id: str, impact: str) -> None:
+        """Record a rule's effective impact and move it to that impact's index"""
+        self._clear_effective_impact(rule_id)
+        self._effective_impact[rule_id] = impact
+        self._by_impact.setdefault(impact, set()).add(rule_id)
+    
+    def _clear_effective_impact(self, rule_id: str) -> None:
+        """Forget a rule's effective impact and remove it from the impact index"""
+        impact = self._effective_impact.pop(rule_id, None)
+        if impact is not None:
+            self._by_impact[impact].discard(rule_id)
+    
+    def _update_enabled_index(self, rule_id: str) -> None:
+        """Refresh a rule's membership in the enabled rule ID index"""
+        rule = self.rules.get(rule_id)
+        config = self.rule_configurations.get(rule_id)
+        if rule and rule.enabled and not (config and not config.enabled):
+            self._enabled_ids.add(rule_id)
+        else:
+            self._enabled_ids.discard(rule_id)
+        self._enabled_rules_cache = None
     
     def _initialize_builtin_rules(self) -> None:
         """Initialize built-in accessibility rules"""
-        
-        # Basic accessibility rules
-        basic_rules = [
-            RuleDefinition(
-                rule_id="page-has-title",
-                name="Page has title",
-                description="Ensures every HTML document has a non-empty <title> element",
-                help_text="All pages must have a title to help users understand the page content",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/page-titled.html",
-                impact="serious",
-                category="wcag21",
-                tags=["title", "navigation", "wcag21-2.4.2"]
-            ),
-            RuleDefinition(
-                rule_id="page-has-heading",
-                name="Page has heading",
-                description="Ensures the page has at least one heading (h1-h6)",
-                help_text="Pages should have proper heading structure for screen readers",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/info-and-relationships.html",
-                impact="serious",
-                category="wcag21",
-                tags=["headings", "structure", "wcag21-1.3.1"]
-            ),
-            RuleDefinition(
-                rule_id="images-have-alt",
-                name="Images have alt text",
-                description="Ensures all images have alternative text",
-                help_text="Images must have alt attributes for screen readers",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/non-text-content.html",
-                impact="critical",
-                category="wcag21",
-                tags=["images", "alt-text", "wcag21-1.1.1"]
-            ),
-            RuleDefinition(
-                rule_id="links-have-names",
-                name="Links have accessible names",
-                description="Ensures links have discernible text",
-                help_text="Links must have text content or accessible names",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/link-purpose-in-context.html",
-                impact="serious",
-                category="wcag21",
-                tags=["links", "navigation", "wcag21-2.4.4"]
-            ),
-            RuleDefinition(
-                rule_id="form-labels",
-                name="Form inputs have labels",
-                description="Ensures every form input has an associated label",
-                help_text="Form controls must be properly labeled for accessibility",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/labels-or-instructions.html",
-                impact="critical",
-                category="wcag21",
-                tags=["forms", "labels", "wcag21-3.3.2"]
-            )
-        ]
-        
-        # WCAG 2.1 advanced rules
-        wcag_rules = [
-            RuleDefinition(
-                rule_id="color-contrast",
-                name="Color contrast",
-                description="Ensures text has sufficient color contrast",
-                help_text="Text must have adequate contrast ratio for readability",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/contrast-minimum.html",
-                impact="serious",
-                category="wcag21",
-                tags=["color", "contrast", "wcag21-1.4.3"]
-            ),
-            RuleDefinition(
-                rule_id="keyboard-navigation",
-                name="Keyboard navigation",
-                description="Ensures all interactive elements are keyboard accessible",
-                help_text="All functionality must be available via keyboard",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/keyboard.html",
-                impact="critical",
-                category="wcag21",
-                tags=["keyboard", "navigation", "wcag21-2.1.1"]
-            ),
-            RuleDefinition(
-                rule_id="focus-visible",
-                name="Focus indicators",
-                description="Ensures focusable elements have visible focus indicators",
-                help_text="Interactive elements must have visible focus indicators",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/focus-visible.html",
-                impact="serious",
-                category="wcag21",
-                tags=["focus", "keyboard", "wcag21-2.4.7"]
-            ),
-            RuleDefinition(
-                rule_id="aria-labels",
-                name="ARIA labels and roles",
-                description="Ensures proper use of ARIA labels and roles",
-                help_text="ARIA attributes must be used correctly for accessibility",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/name-role-value.html",
-                impact="serious",
-                category="wcag21",
-                tags=["aria", "labels", "wcag21-4.1.2"]
-            ),
-            RuleDefinition(
-                rule_id="landmark-regions",
-                name="Landmark regions",
-                description="Ensures proper landmark regions for navigation",
-                help_text="Pages should have proper landmark structure",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/bypass-blocks.html",
-                impact="moderate",
-                category="wcag21",
-                tags=["landmarks", "navigation", "wcag21-2.4.1"]
-            )
-        ]
-        
-        # HTML semantic rules
-        semantic_rules = [
-            RuleDefinition(
-                rule_id="html-structure",
-                name="HTML structure",
-                description="Validates basic HTML document structure",
-                help_text="HTML documents must have proper structure",
-                help_url="https://html.spec.whatwg.org/multipage/semantics.html",
-                impact="serious",
-                category="semantic",
-                tags=["html", "structure", "validation"]
-            ),
-            RuleDefinition(
-                rule_id="semantic-elements",
-                name="Semantic HTML elements",
-                description="Validates proper use of HTML5 semantic elements",
-                help_text="Use semantic HTML elements for better accessibility",
-                help_url="https://html.spec.whatwg.org/multipage/sections.html",
-                impact="moderate",
-                category="semantic",
-                tags=["html5", "semantic", "structure"]
-            ),
-            RuleDefinition(
-                rule_id="heading-hierarchy",
-                name="Heading hierarchy",
-                description="Ensures headings are in proper hierarchical order",
-                help_text="Headings should follow proper nesting order (h1, h2, h3, etc.)",
-                help_url="https://www.w3.org/WAI/WCAG21/Understanding/info-and-relationships.html",
-                impact="moderate",
-                category="semantic",
-                tags=["headings", "structure", "hierarchy"]
-            ),
-            RuleDefinition(
-                rule_id="list-structure",
-                name="List structure",
-                description="Validates proper list markup and structure",
-                help_text="Lists should use proper HTML list elements",
-                help_url="https://html.spec.whatwg.org/multipage/semantics.html#the-ul-element",
-                impact="minor",
-                category="semantic",
-                tags=["lists", "structure", "html"]
-            ),
-            RuleDefinition(
-                rule_id="form-structure",
-                name="Form structure",
-                description="Validates proper form markup and structure",
-                help_text="Forms should use proper HTML form elements and structure",
-                help_url="https://html.spec.whatwg.org/multipage/forms.html",
-                impact="moderate",
-                category="semantic",
-                tags=["forms", "structure", "html"]
-            )
-        ]
-        
-        # Add all rules to the registry
-        all_rules = basic_rules + wcag_rules + semantic_rules
-        for rule in all_rules:
+        for rule in _BUILTIN_RULES:
             self.rules[rule.rule_id] = rule
     
     def _load_custom_rules(self) -> None:
         """Load custom rules from configuration directory"""
         try:
-            custom_rules_dir = Path('autotest/testing/rules/custom')
+            custom_rules_dir = self._CUSTOM_RULES_DIR
             if not custom_rules_dir.exists():
                 return
             
-            for rule_file in custom_rules_dir.glob('*.json'):
+            rule_files = self._get_custom_rule_files(custom_rules_dir)
+            
+            # Use the consolidated manifest while it still matches the rule files on disk
+            manifest = self._read_custom_manifest(custom_rules_dir)
+            if manifest is not None and manifest.get('files') == rule_files:
+                for rule_data in manifest.get('rules', []):
+                    rule = self._custom_rule_from_data(rule_data)
+                    self.rules[rule.rule_id] = rule
+                    self.logger.info("Loaded custom rule: %s", rule.rule_id)
+                return
+            
+            # Only files that parsed go into the manifest, so a broken file is retried and reported
+            loaded_files = {}
+            loaded_rules = []
+            for file_name, mtime_ns in rule_files.items():
+                rule_file = custom_rules_dir / file_name
                 try:
-                    with open(rule_file, 'r') as f:
-                        rule_data = json.load(f)
+                    rule_data = _read_json_file(rule_file)
                     
-                    rule = RuleDefinition(
-                        rule_id=rule_data['rule_id'],
-                        name=rule_data['name'],
-                        description=rule_data['description'],
-                        help_text=rule_data['help_text'],
-                        help_url=rule_data.get('help_url', ''),
-                        impact=rule_data['impact'],
-                        category='custom',
-                        enabled=rule_data.get('enabled', True),
-                        tags=rule_data.get('tags', [])
-                    )
+                    rule = self._custom_rule_from_data(rule_data)
                     
                     self.rules[rule.rule_id] = rule
-                    self.logger.info(f"Loaded custom rule: {rule.rule_id}")
+                    self.logger.info("Loaded custom rule: %s", rule.rule_id)
+                    loaded_files[file_name] = mtime_ns
+                    loaded_rules.append(rule_data)
                     
                 except Exception as e:
-                    self.logger.warning(f"Failed to load custom rule from {rule_file}: {e}")
+                    self.logger.warning("Failed to load custom rule from %s: %s", rule_file, e)
+            
+            self._write_custom_manifest(custom_rules_dir, loaded_files, loaded_rules)
+        
+        except Exception as e:
+            self.logger.warning("Error loading custom rules: %s", e)
+    
+    @staticmethod
+    def _custom_rule_from_data(rule_data: Dict[str, Any]) -> RuleDefinition:
+        """Create a custom rule definition from its stored JSON data"""
+        return RuleDefinition(
+            rule_id=rule_data['rule_id'],
+            name=rule_data['name'],
+            description=rule_data['description'],
+            help_text=rule_data['help_text'],
+            help_url=rule_data.get('help_url', ''),
+            impact=rule_data['impact'],
+            category='custom',
+            enabled=rule_data.get('enabled', True),
+            tags=rule_data.get('tags', [])
+        )
+    
+    @staticmethod
+    def _get_custom_rule_files(custom_rules_dir: Path) -> Dict[str, int]:
+        """Get modification times of custom rule files, keyed by file name"""
+        rule_files = {}
+        with os.scandir(custom_rules_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.endswith('.json') and not name.startswith('.')
+                        and name != CUSTOM_RULES_MANIFEST and entry.is_file()):
+                    rule_files[name] = entry.stat().st_mtime_ns
+        return rule_files
+    
+    def _read_custom_manifest(self, custom_rules_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read the consolidated custom rules manifest, if there is one"""
+        manifest_file = custom_rules_dir / CUSTOM_RULES_MANIFEST
+        if not manifest_file.exists():
+            return None
+        
+        try:
+            return _read_json_file(manifest_file)
+        except Exception as e:
+            self.logger.warning("Ignoring unreadable custom rules manifest: %s", e)
+            return None
+    
+    def _write_custom_manifest(self, custom_rules_dir: Path, rule_files: Dict[str, int],
+                               rules: List[Dict[str, Any]]) -> None:
+        """
+        Write custom rules parsed from disk to the consolidated manifest
+        
+        Args:
+            custom_rules_dir: Directory holding the custom rule files
+            rule_files: Modification times of the rule files the rules were parsed from
+            rules: Rule data parsed from those files
+        """
+        try:
+            manifest = {
+                'files': rule_files,
+                'rules': rules
+            }
+            
+            _write_json_file(custom_rules_dir / CUSTOM_RULES_MANIFEST, manifest)
         
         except Exception as e:
-            self.logger.warning(f"Error loading custom rules: {e}")
+            self.logger.warning("Error writing custom rules manifest: %s", e)
+    
+    def _remove_custom_manifest(self, custom_rules_dir: Path) -> None:
+        """
+        Remove the consolidated manifest after a rule file changes
+        
+        Other engines may have changed the directory too, so the manifest is rebuilt
+        from the rule files on the next load rather than from this engine's rules.
+        """
+        manifest_file = custom_rules_dir / CUSTOM_RULES_MANIFEST
+        try:
+            manifest_file.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning("Error removing custom rules manifest: %s", e)
+        
+        with _JSON_FILE_CACHE_LOCK:
+            _JSON_FILE_CACHE.pop(os.path.abspath(manifest_file), None)
     
     def _load_rule_configurations(self) -> None:
         """Load rule configurations from file"""
         try:
-            config_file = Path('autotest/testing/rules/rule_config.json')
+            config_file = self._RULE_CONFIG_FILE
             if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
+                config_data = _read_json_file(config_file)
                 
                 for rule_id, config in config_data.items():
+                    # Copy parameters, configure_rule updates them in place
                     self.rule_configurations[rule_id] = RuleConfiguration(
                         rule_id=rule_id,
                         enabled=config.get('enabled', True),
                         custom_impact=config.get('custom_impact'),
-                        custom_parameters=config.get('custom_parameters', {})
+                        custom_parameters=dict(config.get('custom_parameters', {}))
                     )
                     
-                self.logger.info(f"Loaded configurations for {len(self.rule_configurations)} rules")
+                self.logger.info("Loaded configurations for %d rules", len(self.rule_configurations))
         
         except Exception as e:
-            self.logger.warning(f"Error loading rule configurations: {e}")
+            self.logger.warning("Error loading rule configurations: %s", e)
     
     def save_rule_configurations(self) -> bool:
         """Save current rule configurations to file"""
+        self._ensure_loaded()
         try:
-            config_file = Path('autotest/testing/rules/rule_config.json')
+            config_file = self._RULE_CONFIG_FILE
             config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            config_data = {}
-            for rule_id, config in self.rule_configurations.items():
-                config_data[rule_id] = asdict(config)
+            config_data = {
+                rule_id: config.to_dict()
+                for rule_id, config in self.rule_configurations.items()
+            }
             
-            with open(config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            _write_json_file(config_file, config_data)
             
             self.logger.info("Rule configurations saved successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error saving rule configurations: {e}")
+            self.logger.error("Error saving rule configurations: %s", e)
             return False
     
     def get_enabled_rules(self, category: Optional[str] = None, 
@@ -341,30 +615,30 @@ class RuleEngine(LoggerMixin):
             tags: Filter by rule tags
         
         Returns:
-            List of enabled rule definitions
+            List of enabled rule definitions. Without filters the same cached
+            list is returned on every call, so callers must not modify it.
         """
-        enabled_rules = []
-        
-        for rule_id, rule in self.rules.items():
-            # Check if rule is enabled globally
-            config = self.rule_configurations.get(rule_id)
-            if config and not config.enabled:
-                continue
-            
-            if not rule.enabled:
-                continue
-            
-            # Apply category filter
-            if category and rule.category != category:
-                continue
-            
-            # Apply tags filter
-            if tags and not any(tag in rule.tags for tag in tags):
-                continue
-            
-            enabled_rules.append(rule)
-        
-        return enabled_rules
+        self._ensure_loaded()
+        if not category and not tags:
+            if self._enabled_rules_cache is None:
+                self._enabled_rules_cache = [
+                    rule for rule_id, rule in self.rules.items() if rule_id in self._enabled_ids
+                ]
+            return self._enabled_rules_cache
+        
+        rule_ids = self._enabled_ids
+        
+        # Apply category filter
+        if category:
+            rule_ids = rule_ids & self._by_category.get(category, set())
+        
+        # Apply tags filter
+        if tags:
+            tag_set = frozenset(tags)
+            rule_ids = rule_ids & set().union(*(self._by_tag.get(tag, ()) for tag in tag_set))
+        
+        # Keep registration order for stable results
+        return [rule for rule_id, rule in self.rules.items() if rule_id in rule_ids]
     
     def get_rule_by_id(self, rule_id: str) -> Optional[RuleDefinition]:
         """
@@ -376,6 +650,7 @@ class RuleEngine(LoggerMixin):
         Returns:
             Rule definition or None if not found
         """
+        self._ensure_loaded()
         return self.rules.get(rule_id)
     
     def configure_rule(self, rule_id: str, enabled: Optional[bool] = None,
@@ -393,32 +668,34 @@ class RuleEngine(LoggerMixin):
         Returns:
             True if configuration successful, False otherwise
         """
+        self._ensure_loaded()
         try:
             if rule_id not in self.rules:
-                self.logger.error(f"Rule not found: {rule_id}")
+                self.logger.error("Rule not found: %s", rule_id)
+                return False
+            
+            if custom_impact is not None and custom_impact not in _VALID_IMPACTS:
+                self.logger.error("Invalid impact level: %s", custom_impact)
                 return False
             
             config = self.rule_configurations.get(rule_id, RuleConfiguration(rule_id))
+            self.rule_configurations[rule_id] = config
             
-            if enabled is not None:
+            if enabled is not None and enabled != config.enabled:
                 config.enabled = enabled
+                self._update_enabled_index(rule_id)
             
             if custom_impact is not None:
-                valid_impacts = ["minor", "moderate", "serious", "critical"]
-                if custom_impact in valid_impacts:
-                    config.custom_impact = custom_impact
-                else:
-                    self.logger.error(f"Invalid impact level: {custom_impact}")
-                    return False
+                config.custom_impact = sys.intern(custom_impact)
+                self._set_effective_impact(rule_id, config.custom_impact)
             
             if custom_parameters is not None:
                 config.custom_parameters.update(custom_parameters)
             
-            self.rule_configurations[rule_id] = config
             return True
             
         except Exception as e:
-            self.logger.error(f"Error configuring rule {rule_id}: {e}")
+            self.logger.error("Error configuring rule %s: %s", rule_id, e)
             return False
     
     def get_rule_impact(self, rule_id: str) -> str:
@@ -431,15 +708,28 @@ class RuleEngine(LoggerMixin):
         Returns:
             Impact level string
         """
+        self._ensure_loaded()
+        return self._resolve_rule_impact(rule_id)
+    
+    def _resolve_rule_impact(self, rule_id: str) -> str:
+        """Get the effective impact for a rule from the impact map, resolving it if missing"""
+        impact = self._effective_impact.get(rule_id)
+        if impact is not None:
+            return impact
+        
+        # Resolve rules added outside the indexing helpers
         rule = self.rules.get(rule_id)
         if not rule:
             return "moderate"
         
         config = self.rule_configurations.get(rule_id)
         if config and config.custom_impact:
-            return config.custom_impact
+            impact = config.custom_impact
+        else:
+            impact = rule.impact
         
-        return rule.impact
+        self._set_effective_impact(rule_id, impact)
+        return impact
     
     def get_rule_parameters(self, rule_id: str) -> Dict[str, Any]:
         """
@@ -451,6 +741,7 @@ class RuleEngine(LoggerMixin):
         Returns:
             Dictionary of custom parameters
         """
+        self._ensure_loaded()
         config = self.rule_configurations.get(rule_id)
         if config:
             return config.custom_parameters
@@ -466,16 +757,21 @@ class RuleEngine(LoggerMixin):
         Returns:
             True if rule created successfully, False otherwise
         """
+        self._ensure_loaded()
         try:
             required_fields = ['rule_id', 'name', 'description', 'help_text', 'impact']
             for field in required_fields:
                 if field not in rule_definition:
-                    self.logger.error(f"Missing required field: {field}")
+                    self.logger.error("Missing required field: %s", field)
                     return False
             
             rule_id = rule_definition['rule_id']
             if rule_id in self.rules:
-                self.logger.error(f"Rule already exists: {rule_id}")
+                self.logger.error("Rule already exists: %s", rule_id)
+                return False
+            
+            if rule_definition['impact'] not in _VALID_IMPACTS:
+                self.logger.error("Invalid impact level: %s", rule_definition['impact'])
                 return False
             
             rule = RuleDefinition(
@@ -491,20 +787,21 @@ class RuleEngine(LoggerMixin):
             )
             
             self.rules[rule_id] = rule
+            self._index_rule(rule)
             
             # Save to custom rules directory
-            custom_rules_dir = Path('autotest/testing/rules/custom')
+            custom_rules_dir = self._CUSTOM_RULES_DIR
             custom_rules_dir.mkdir(parents=True, exist_ok=True)
             
-            rule_file = custom_rules_dir / f"{rule_id}.json"
-            with open(rule_file, 'w') as f:
-                json.dump(asdict(rule), f, indent=2)
+            _write_json_file(custom_rules_dir / f"{rule_id}.json", rule.to_dict())
+            
+            self._remove_custom_manifest(custom_rules_dir)
             
-            self.logger.info(f"Created custom rule: {rule_id}")
+            self.logger.info("Created custom rule: %s", rule_id)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error creating custom rule: {e}")
+            self.logger.error("Error creating custom rule: %s", e)
             return False
     
     def delete_custom_rule(self, rule_id: str) -> bool:
@@ -517,13 +814,15 @@ class RuleEngine(LoggerMixin):
         Returns:
             True if rule deleted successfully, False otherwise
         """
+        self._ensure_loaded()
         try:
             rule = self.rules.get(rule_id)
             if not rule or rule.category != 'custom':
-                self.logger.error(f"Custom rule not found: {rule_id}")
+                self.logger.error("Custom rule not found: %s", rule_id)
                 return False
             
             # Remove from memory
+            self._unindex_rule(rule)
             del self.rules[rule_id]
             
             # Remove configuration if exists
@@ -531,15 +830,17 @@ class RuleEngine(LoggerMixin):
                 del self.rule_configurations[rule_id]
             
             # Remove file
-            rule_file = Path(f'autotest/testing/rules/custom/{rule_id}.json')
+            rule_file = self._CUSTOM_RULES_DIR / f"{rule_id}.json"
             if rule_file.exists():
                 rule_file.unlink()
             
-            self.logger.info(f"Deleted custom rule: {rule_id}")
+            self._remove_custom_manifest(self._CUSTOM_RULES_DIR)
+            
+            self.logger.info("Deleted custom rule: %s", rule_id)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error deleting custom rule: {e}")
+            self.logger.error("Error deleting custom rule: %s", e)
             return False
     
     def get_rules_by_impact(self, impact: str) -> List[RuleDefinition]:
@@ -552,8 +853,9 @@ class RuleEngine(LoggerMixin):
         Returns:
             List of rules with specified impact level
         """
-        return [rule for rule in self.rules.values() 
-                if self.get_rule_impact(rule.rule_id) == impact]
+        self._ensure_loaded()
+        rule_ids = self._by_impact.get(impact, set())
+        return [rule for rule_id, rule in self.rules.items() if rule_id in rule_ids]
     
     def get_rules_summary(self) -> Dict[str, Any]:
         """
@@ -562,29 +864,25 @@ class RuleEngine(LoggerMixin):
         Returns:
             Dictionary with rules summary
         """
-        enabled_rules = self.get_enabled_rules()
-        
-        summary = {
-            'total_rules': len(self.rules),
-            'enabled_rules': len(enabled_rules),
-            'disabled_rules': len(self.rules) - len(enabled_rules),
-            'by_category': {},
-            'by_impact': {}
-        }
+        self._ensure_loaded()
+        enabled_ids = self._enabled_ids
+        by_category = defaultdict(lambda: {'total': 0, 'enabled': 0})
+        by_impact = Counter()
         
-        # Count by category
         for rule in self.rules.values():
-            category = rule.category
-            if category not in summary['by_category']:
-                summary['by_category'][category] = {'total': 0, 'enabled': 0}
-            summary['by_category'][category]['total'] += 1
+            category_counts = by_category[rule.category]
+            category_counts['total'] += 1
             
-            if rule in enabled_rules:
-                summary['by_category'][category]['enabled'] += 1
+            if rule.rule_id in enabled_ids:
+                category_counts['enabled'] += 1
+                by_impact[self.get_rule_impact(rule.rule_id)] += 1
         
-        # Count by impact
-        for rule in enabled_rules:
-            impact = self.get_rule_impact(rule.rule_id)
-            summary['by_impact'][impact] = summary['by_impact'].get(impact, 0) + 1
+        enabled_count = sum(by_impact.values())
         
-        return summary
\ No newline at end of file
+        return {
+            'total_rules': len(self.rules),
+            'enabled_rules': enabled_count,
+            'disabled_rules': len(self.rules) - enabled_count,
+            'by_category': dict(by_category),
+            'by_impact': dict(by_impact)
+        }
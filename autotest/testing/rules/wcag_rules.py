@@ -20,17 +20,355 @@ WCAG 2.1 compliance rules for AutoTest accessibility testing
 
 import re
 import colorsys
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import WebDriverException
 
 from autotest.utils.logger import LoggerMixin
 
 
+# CSS rgb()/rgba() color values as returned by getComputedStyle, or #rgb/#rrggbb hex colors
+_COLOR_RE = re.compile(
+    r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*[\d.]+)?\)'
+    r'|#(?:([0-9a-fA-F]{6})|([0-9a-fA-F]{3}))\Z'
+)
+
+# CSS named colors
+_NAMED_COLORS: Dict[str, Tuple[int, int, int]] = {
+    'aliceblue': (240, 248, 255), 'antiquewhite': (250, 235, 215), 'aqua': (0, 255, 255),
+    'aquamarine': (127, 255, 212), 'azure': (240, 255, 255), 'beige': (245, 245, 220),
+    'bisque': (255, 228, 196), 'black': (0, 0, 0), 'blanchedalmond': (255, 235, 205),
+    'blue': (0, 0, 255), 'blueviolet': (138, 43, 226), 'brown': (165, 42, 42),
+    'burlywood': (222, 184, 135), 'cadetblue': (95, 158, 160), 'chartreuse': (127, 255, 0),
+    'chocolate': (210, 105, 30), 'coral': (255, 127, 80), 'cornflowerblue': (100, 149, 237),
+    'cornsilk': (255, 248, 220), 'crimson': (220, 20, 60), 'cyan': (0, 255, 255),
+    'darkblue': (0, 0, 139), 'darkcyan': (0, 139, 139), 'darkgoldenrod': (184, 134, 11),
+    'darkgray': (169, 169, 169), 'darkgreen': (0, 100, 0), 'darkgrey': (169, 169, 169),
+    'darkkhaki': (189, 183, 107), 'darkmagenta': (139, 0, 139), 'darkolivegreen': (85, 107, 47),
+    'darkorange': (255, 140, 0), 'darkorchid': (153, 50, 204), 'darkred': (139, 0, 0),
+    'darksalmon': (233, 150, 122), 'darkseagreen': (143, 188, 143),
+    'darkslateblue': (72, 61, 139), 'darkslategray': (47, 79, 79),
+    'darkslategrey': (47, 79, 79), 'darkturquoise': (0, 206, 209), 'darkviolet': (148, 0, 211),
+    'deeppink': (255, 20, 147), 'deepskyblue': (0, 191, 255), 'dimgray': (105, 105, 105),
+    'dimgrey': (105, 105, 105), 'dodgerblue': (30, 144, 255), 'firebrick': (178, 34, 34),
+    'floralwhite': (255, 250, 240), 'forestgreen': (34, 139, 34), 'fuchsia': (255, 0, 255),
+    'gainsboro': (220, 220, 220), 'ghostwhite': (248, 248, 255), 'gold': (255, 215, 0),
+    'goldenrod': (218, 165, 32), 'gray': (128, 128, 128), 'green': (0, 128, 0),
+    'greenyellow': (173, 255, 47), 'grey': (128, 128, 128), 'honeydew': (240, 255, 240),
+    'hotpink': (255, 105, 180), 'indianred': (205, 92, 92), 'indigo': (75, 0, 130),
+    'ivory': (255, 255, 240), 'khaki': (240, 230, 140), 'lavender': (230, 230, 250),
+    'lavenderblush': (255, 240, 245), 'lawngreen': (124, 252, 0),
+    'lemonchiffon': (255, 250, 205), 'lightblue': (173, 216, 230),
+    'lightcoral': (240, 128, 128), 'lightcyan': (224, 255, 255),
+    'lightgoldenrodyellow': (250, 250, 210), 'lightgray': (211, 211, 211),
+    'lightgreen': (144, 238, 144), 'lightgrey': (211, 211, 211), 'lightpink': (255, 182, 193),
+    'lightsalmon': (255, 160, 122), 'lightseagreen': (32, 178, 170),
+    'lightskyblue': (135, 206, 250), 'lightslategray': (119, 136, 153),
+    'lightslategrey': (119, 136, 153), 'lightsteelblue': (176, 196, 222),
+    'lightyellow': (255, 255, 224), 'lime': (0, 255, 0), 'limegreen': (50, 205, 50),
+    'linen': (250, 240, 230), 'magenta': (255, 0, 255), 'maroon': (128, 0, 0),
+    'mediumaquamarine': (102, 205, 170), 'mediumblue': (0, 0, 205),
+    'mediumorchid': (186, 85, 211), 'mediumpurple': (147, 112, 219),
+    'mediumseagreen': (60, 179, 113), 'mediumslateblue': (123, 104, 238),
+    'mediumspringgreen': (0, 250, 154), 'mediumturquoise': (72, 209, 204),
+    'mediumvioletred': (199, 21, 133), 'midnightblue': (25, 25, 112),
+    'mintcream': (245, 255, 250), 'mistyrose': (255, 228, 225), 'moccasin': (255, 228, 181),
+    'navajowhite': (255, 222, 173), 'navy': (0, 0, 128), 'oldlace': (253, 245, 230),
+    'olive': (128, 128, 0), 'olivedrab': (107, 142, 35), 'orange': (255, 165, 0),
+    'orangered': (255, 69, 0), 'orchid': (218, 112, 214), 'palegoldenrod': (238, 232, 170),
+    'palegreen': (152, 251, 152), 'paleturquoise': (175, 238, 238),
+    'palevioletred': (219, 112, 147), 'papayawhip': (255, 239, 213),
+    'peachpuff': (255, 218, 185), 'peru': (205, 133, 63), 'pink': (255, 192, 203),
+    'plum': (221, 160, 221), 'powderblue': (176, 224, 230), 'purple': (128, 0, 128),
+    'rebeccapurple': (102, 51, 153), 'red': (255, 0, 0), 'rosybrown': (188, 143, 143),
+    'royalblue': (65, 105, 225), 'saddlebrown': (139, 69, 19), 'salmon': (250, 128, 114),
+    'sandybrown': (244, 164, 96), 'seagreen': (46, 139, 87), 'seashell': (255, 245, 238),
+    'sienna': (160, 82, 45), 'silver': (192, 192, 192), 'skyblue': (135, 206, 235),
+    'slateblue': (106, 90, 205), 'slategray': (112, 128, 144), 'slategrey': (112, 128, 144),
+    'snow': (255, 250, 250), 'springgreen': (0, 255, 127), 'steelblue': (70, 130, 180),
+    'tan': (210, 180, 140), 'teal': (0, 128, 128), 'thistle': (216, 191, 216),
+    'tomato': (255, 99, 71), 'turquoise': (64, 224, 208), 'violet': (238, 130, 238),
+    'wheat': (245, 222, 179), 'white': (255, 255, 255), 'whitesmoke': (245, 245, 245),
+    'yellow': (255, 255, 0), 'yellowgreen': (154, 205, 50),
+    # Assume white background for transparent
+    'transparent': (255, 255, 255),
+}
+
+
+def _gamma_correct(channel: float) -> float:
+    """Linearize an sRGB channel value in the 0-1 range"""
+    return channel / 12.92 if channel <= 0.03928 else ((channel + 0.055) / 1.055) ** 2.4
+
+
+# Linearized value of every 8-bit sRGB channel value
+_GAMMA_LUT = tuple(_gamma_correct(value / 255.0) for value in range(256))
+
+
+@lru_cache(maxsize=128)
+def _relative_luminance(rgb: Tuple[int, int, int]) -> float:
+    """Calculate relative luminance of a color, cached as pages reuse a handful of colors"""
+    r, g, b = [
+        _GAMMA_LUT[x] if 0 <= x <= 255 else _gamma_correct(x / 255.0)
+        for x in rgb
+    ]
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+# Elements checked for text color contrast
+_TEXT_ELEMENT_SELECTOR = "p, h1, h2, h3, h4, h5, h6, span, div, a, li, td, th, label, button"
+
+# Elements reachable with the keyboard
+_FOCUSABLE_ELEMENT_SELECTOR = (
+    'a[href], button, input, select, textarea, [tabindex]:not([tabindex="-1"])'
+)
+
+# Elements that should have ARIA attributes
+_INTERACTIVE_ELEMENT_SELECTOR = (
+    'button, input, select, textarea, a, [role="button"], [role="link"], [role="tab"]'
+)
+
+# ARIA roles accepted by the ARIA labels and roles test
+_VALID_ROLES = frozenset({
+    'button', 'link', 'tab', 'tabpanel', 'dialog', 'alert',
+    'navigation', 'main', 'banner', 'contentinfo', 'search',
+    'region', 'article', 'section', 'aside', 'heading',
+    'list', 'listitem', 'table', 'row', 'cell'
+})
+
+# Landmark elements and roles
+_LANDMARK_SELECTOR = (
+    'main, nav, header, footer, aside, section, [role="main"], [role="navigation"], '
+    '[role="banner"], [role="contentinfo"], [role="complementary"], [role="region"]'
+)
+
+# Page scans run inside the browser, so each test needs a single WebDriver round-trip.
+# Records carry the outer HTML already truncated to the 200 characters reported in results.
+
+_CONTRAST_SCAN_SCRIPT = """
+// Only elements that render text themselves are checked, not containers of text elements
+function hasOwnText(element) {
+    for (var node = element.firstChild; node; node = node.nextSibling) {
+        if (node.nodeType === Node.TEXT_NODE && node.textContent.trim().length >= 3) {
+            return true;
+        }
+    }
+    return false;
+}
+
+var elements = document.querySelectorAll(arguments[0]);
+var limit = arguments[1] === null ? elements.length : arguments[1];
+var records = [];
+
+for (var i = 0; i < elements.length && records.length < limit; i++) {
+    var element = elements[i];
+    if (!hasOwnText(element)) {
+        continue;
+    }
+    
+    var styles = window.getComputedStyle(element);
+    records.push({
+        tagName: element.tagName.toLowerCase(),
+        outerHTML: element.outerHTML.substring(0, 200),
+        color: styles.color,
+        backgroundColor: styles.backgroundColor,
+        fontSize: styles.fontSize,
+        fontWeight: styles.fontWeight
+    });
+}
+
+return records;
+"""
+
+_FOCUS_SCAN_SCRIPT = """
+var elements = document.querySelectorAll(arguments[0]);
+var limit = arguments[1] === null ? elements.length : Math.min(elements.length, arguments[1]);
+var previouslyFocused = document.activeElement;
+var focused = [];
+
+for (var i = 0; i < limit; i++) {
+    var element = elements[i];
+    // Focusing must not scroll the page while it is being tested
+    element.focus({preventScroll: true});
+    
+    // Only elements that actually receive focus are checked
+    if (document.activeElement !== element) {
+        continue;
+    }
+    
+    var styles = window.getComputedStyle(element);
+    focused.push({
+        tagName: element.tagName.toLowerCase(),
+        outerHTML: element.outerHTML.substring(0, 200),
+        className: element.getAttribute('class') || '',
+        outline: styles.outline,
+        outlineWidth: styles.outlineWidth,
+        boxShadow: styles.boxShadow
+    });
+}
+
+// Hand focus back to where it was before the scan
+if (document.activeElement && document.activeElement !== previouslyFocused) {
+    document.activeElement.blur();
+}
+if (previouslyFocused && previouslyFocused !== document.body) {
+    previouslyFocused.focus({preventScroll: true});
+}
+
+return {count: elements.length, focused: focused};
+"""
+
+_ARIA_SCAN_SCRIPT = """
+var elements = document.querySelectorAll(arguments[0]);
+var labels = document.querySelectorAll('label[for]');
+var records = [];
+
+// Index label targets once instead of looking up a label per element
+var labelledIds = {};
+for (var i = 0; i < labels.length; i++) {
+    labelledIds[labels[i].getAttribute('for')] = true;
+}
+
+for (var i = 0; i < elements.length; i++) {
+    var element = elements[i];
+    records.push({
+        tagName: element.tagName.toLowerCase(),
+        outerHTML: element.outerHTML.substring(0, 200),
+        ariaLabel: element.getAttribute('aria-label'),
+        ariaLabelledby: element.getAttribute('aria-labelledby'),
+        role: element.getAttribute('role'),
+        type: element.type || null,
+        hasLabel: element.id !== '' && labelledIds.hasOwnProperty(element.id),
+        hasText: (element.innerText || '').trim().length > 0
+    });
+}
+
+return records;
+"""
+
+_LANDMARK_SCAN_SCRIPT = """
+var mains = document.querySelectorAll('main, [role="main"]');
+var navs = document.querySelectorAll('nav, [role="navigation"]');
+var landmarks = document.querySelectorAll(arguments[0]);
+var roleCounts = {};
+var repeated = [];
+
+for (var i = 0; i < landmarks.length; i++) {
+    var landmark = landmarks[i];
+    var role = landmark.getAttribute('role') || landmark.tagName.toLowerCase();
+    if (role !== 'region' && role !== 'navigation') {
+        continue;
+    }
+    
+    // Count each role once instead of querying the document per landmark
+    if (!roleCounts.hasOwnProperty(role)) {
+        roleCounts[role] = document.querySelectorAll('[role="' + role + '"], ' + role).length;
+    }
+    
+    if (roleCounts[role] > 1) {
+        repeated.push({
+            tagName: landmark.tagName.toLowerCase(),
+            outerHTML: landmark.outerHTML.substring(0, 200),
+            role: role,
+            ariaLabel: landmark.getAttribute('aria-label'),
+            ariaLabelledby: landmark.getAttribute('aria-labelledby')
+        });
+    }
+}
+
+return {
+    mainCount: mains.length,
+    mainHTML: mains.length ? mains[0].outerHTML.substring(0, 200) : null,
+    navHTML: navs.length ? navs[0].outerHTML.substring(0, 200) : null,
+    repeated: repeated
+};
+"""
+
+_TABLE_SCAN_SCRIPT = """
+var tables = document.querySelectorAll('table');
+var records = [];
+
+for (var i = 0; i < tables.length; i++) {
+    var table = tables[i];
+    var headers = table.querySelectorAll('th');
+    var missingScopeCount = 0;
+    for (var j = 0; j < headers.length; j++) {
+        if (!headers[j].getAttribute('scope')) {
+            missingScopeCount++;
+        }
+    }
+    
+    records.push({
+        outerHTML: table.outerHTML.substring(0, 200),
+        headerCount: headers.length,
+        missingScopeCount: missingScopeCount,
+        hasThead: table.querySelector('thead') !== null,
+        hasCaption: table.querySelector('caption') !== null,
+        rowCount: table.querySelectorAll('tr').length,
+        summary: table.getAttribute('summary'),
+        ariaLabel: table.getAttribute('aria-label'),
+        ariaLabelledby: table.getAttribute('aria-labelledby')
+    });
+}
+
+return records;
+"""
+
+_MEDIA_SCAN_SCRIPT = """
+function describe(element) {
+    return {
+        tagName: element.tagName.toLowerCase(),
+        outerHTML: element.outerHTML.substring(0, 200),
+        title: element.getAttribute('title'),
+        ariaLabel: element.getAttribute('aria-label')
+    };
+}
+
+var videos = Array.prototype.map.call(document.querySelectorAll('video'), function(video) {
+    var record = describe(video);
+    // track.kind reports 'subtitles' when the kind attribute is missing
+    record.hasCaptions = Array.prototype.some.call(video.querySelectorAll('track'), function(track) {
+        return track.kind === 'captions' || track.kind === 'subtitles';
+    });
+    return record;
+});
+
+return {
+    videos: videos,
+    audios: Array.prototype.map.call(document.querySelectorAll('audio'), describe),
+    embedded: Array.prototype.map.call(document.querySelectorAll('iframe, object, embed'), describe)
+};
+"""
+
+
+def _batch_scan_script(scripts: List[str]) -> str:
+    """
+    Combine page scan scripts into one script
+    
+    The combined script takes a list with the arguments of each scan and returns a
+    list with a {value: ...} or {error: ...} record per scan, so a failing scan does
+    not affect the others.
+    """
+    calls = ',\n'.join(
+        'runScan(function() {%s}, arguments[0][%d])' % (script, index)
+        for index, script in enumerate(scripts)
+    )
+    return """
+function runScan(scan, args) {
+    try {
+        return {value: scan.apply(null, args)};
+    } catch (e) {
+        return {error: String(e)};
+    }
+}
+
+return [%s];
+""" % calls
+
+
 class WCAGRules(LoggerMixin):
     """WCAG 2.1 compliance test rules implementation"""
     
@@ -43,170 +381,96 @@ class WCAGRules(LoggerMixin):
         """
         self.driver = driver
     
-    def test_color_contrast_advanced(self) -> Dict[str, Any]:
+    def run_all_tests(self, max_elements: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
         """
-        Advanced color contrast testing (WCAG 2.1 AA compliance)
-        Tests for 4.5:1 ratio for normal text, 3:1 for large text
+        Run all WCAG tests
+        
+        The page scans of all tests are collected in one script call. The keyboard
+        navigation scan moves focus around the page, so it runs last.
+        
+        Args:
+            max_elements: Optional cap on the elements checked by the color contrast
+                and keyboard navigation tests, all elements are checked by default
+        
+        Returns:
+            Test results keyed by test method name
         """
+        # Test name, scan script, scan arguments, evaluator and error description
+        scans = [
+            ('test_color_contrast_advanced', _CONTRAST_SCAN_SCRIPT,
+             [_TEXT_ELEMENT_SELECTOR, max_elements], self._evaluate_contrast, 'color contrast'),
+            ('test_aria_labels_and_roles', _ARIA_SCAN_SCRIPT,
+             [_INTERACTIVE_ELEMENT_SELECTOR], self._evaluate_aria, 'ARIA attributes'),
+            ('test_landmark_regions', _LANDMARK_SCAN_SCRIPT,
+             [_LANDMARK_SELECTOR], self._evaluate_landmarks, 'landmark regions'),
+            ('test_table_accessibility', _TABLE_SCAN_SCRIPT,
+             [], self._evaluate_tables, 'table accessibility'),
+            ('test_media_alternatives', _MEDIA_SCAN_SCRIPT,
+             [], self._evaluate_media, 'media alternatives'),
+            ('test_keyboard_navigation', _FOCUS_SCAN_SCRIPT,
+             [_FOCUSABLE_ELEMENT_SELECTOR, max_elements], self._evaluate_keyboard,
+             'keyboard navigation'),
+        ]
+        
         try:
-            # Get all text elements
-            text_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                "p, h1, h2, h3, h4, h5, h6, span, div, a, li, td, th, label, button"
+            outcomes = self.driver.execute_script(
+                _batch_scan_script([scan[1] for scan in scans]),
+                [scan[2] for scan in scans]
             )
-            
-            violations = []
-            passes = []
-            
-            for element in text_elements[:20]:  # Limit for performance
+        except Exception as e:
+            outcomes = [{'error': str(e)}] * len(scans)
+        
+        results = {}
+        for (name, _, _, evaluate, description), outcome in zip(scans, outcomes):
+            error = outcome.get('error')
+            if error is None:
                 try:
-                    text_content = element.get_attribute("textContent").strip()
-                    if not text_content or len(text_content) < 3:
-                        continue
-                    
-                    # Get computed styles
-                    color = self._get_computed_style(element, 'color')
-                    background_color = self._get_computed_style(element, 'backgroundColor')
-                    font_size = self._get_computed_style(element, 'fontSize')
-                    font_weight = self._get_computed_style(element, 'fontWeight')
-                    
-                    # Parse colors
-                    text_rgb = self._parse_color(color)
-                    bg_rgb = self._parse_color(background_color)
-                    
-                    if not text_rgb or not bg_rgb:
-                        continue
-                    
-                    # Calculate contrast ratio
-                    contrast_ratio = self._calculate_contrast_ratio(text_rgb, bg_rgb)
-                    
-                    # Determine if text is large (18pt+ or 14pt+ bold)
-                    font_size_px = self._parse_font_size(font_size)
-                    is_bold = self._is_bold_font(font_weight)
-                    is_large_text = (font_size_px >= 18) or (font_size_px >= 14 and is_bold)
-                    
-                    # Check compliance
-                    required_ratio = 3.0 if is_large_text else 4.5
-                    
-                    if contrast_ratio < required_ratio:
-                        violations.append({
-                            'target': [element.tag_name],
-                            'html': element.get_attribute('outerHTML')[:200],
-                            'data': {
-                                'contrast_ratio': round(contrast_ratio, 2),
-                                'required_ratio': required_ratio,
-                                'text_color': color,
-                                'background_color': background_color,
-                                'font_size': font_size,
-                                'is_large_text': is_large_text
-                            }
-                        })
-                    else:
-                        passes.append({
-                            'target': [element.tag_name],
-                            'html': element.get_attribute('outerHTML')[:200],
-                            'data': {
-                                'contrast_ratio': round(contrast_ratio, 2),
-                                'required_ratio': required_ratio
-                            }
-                        })
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error checking contrast for element: {e}")
+                    results[name] = evaluate(outcome['value'])
                     continue
+                except Exception as e:
+                    error = str(e)
+            
+            results[name] = {
+                'status': 'incomplete',
+                'reason': f'Error testing {description}: {error}'
+            }
+        
+        return results
+    
+    def test_color_contrast_advanced(self, max_elements: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Advanced color contrast testing (WCAG 2.1 AA compliance)
+        Tests for 4.5:1 ratio for normal text, 3:1 for large text
+        
+        Args:
+            max_elements: Optional cap on the text elements checked, all by default
+        """
+        try:
+            # Collect styles of all text elements in one script call
+            text_elements = self.driver.execute_script(
+                _CONTRAST_SCAN_SCRIPT, _TEXT_ELEMENT_SELECTOR, max_elements
+            )
+            return self._evaluate_contrast(text_elements)
             
-            if violations:
-                return {
-                    'status': 'violation',
-                    'nodes': violations
-                }
-            elif passes:
-                return {
-                    'status': 'pass',
-                    'nodes': passes
-                }
-            else:
-                return {
-                    'status': 'incomplete',
-                    'reason': 'No text elements found for contrast testing'
-                }
-                
         except Exception as e:
             return {
                 'status': 'incomplete',
                 'reason': f'Error testing color contrast: {str(e)}'
             }
     
-    def test_keyboard_navigation(self) -> Dict[str, Any]:
+    def test_keyboard_navigation(self, max_elements: Optional[int] = None) -> Dict[str, Any]:
         """
         Test keyboard navigation functionality
+        
+        Args:
+            max_elements: Optional cap on the focusable elements checked, all by default
         """
         try:
-            # Get all focusable elements
-            focusable_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                'a[href], button, input, select, textarea, [tabindex]:not([tabindex="-1"])'
+            # Focus the focusable elements and collect their focus styles in one script call
+            scan = self.driver.execute_script(
+                _FOCUS_SCAN_SCRIPT, _FOCUSABLE_ELEMENT_SELECTOR, max_elements
             )
-            
-            if not focusable_elements:
-                return {
-                    'status': 'pass',
-                    'nodes': [{'target': ['body'], 'html': 'No focusable elements found'}]
-                }
-            
-            violations = []
-            passes = []
-            
-            for element in focusable_elements[:10]:  # Limit for performance
-                try:
-                    # Focus the element
-                    self.driver.execute_script("arguments[0].focus()", element)
-                    
-                    # Check if element is actually focused
-                    focused_element = self.driver.switch_to.active_element
-                    
-                    if focused_element == element:
-                        # Check for visible focus indicator
-                        outline = self._get_computed_style(element, 'outline')
-                        outline_width = self._get_computed_style(element, 'outlineWidth')
-                        box_shadow = self._get_computed_style(element, 'boxShadow')
-                        border = self._get_computed_style(element, 'border')
-                        
-                        has_focus_indicator = (
-                            outline != 'none' and outline_width != '0px' or
-                            box_shadow != 'none' or
-                            'focus' in element.get_attribute('class') or ''
-                        )
-                        
-                        if has_focus_indicator:
-                            passes.append({
-                                'target': [element.tag_name],
-                                'html': element.get_attribute('outerHTML')[:200]
-                            })
-                        else:
-                            violations.append({
-                                'target': [element.tag_name],
-                                'html': element.get_attribute('outerHTML')[:200],
-                                'data': {
-                                    'outline': outline,
-                                    'box_shadow': box_shadow
-                                }
-                            })
-                    
-                except Exception as e:
-                    self.logger.debug(f"Error testing keyboard focus: {e}")
-                    continue
-            
-            if violations:
-                return {
-                    'status': 'violation',
-                    'nodes': violations
-                }
-            else:
-                return {
-                    'status': 'pass',
-                    'nodes': passes
-                }
+            return self._evaluate_keyboard(scan)
                 
         except Exception as e:
             return {
@@ -219,98 +483,12 @@ class WCAGRules(LoggerMixin):
         Test ARIA labels and roles for accessibility
         """
         try:
-            # Elements that should have ARIA attributes
-            interactive_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                'button, input, select, textarea, a, [role="button"], [role="link"], [role="tab"]'
+            # Collect ARIA attributes of all interactive elements in one script call
+            interactive_elements = self.driver.execute_script(
+                _ARIA_SCAN_SCRIPT, _INTERACTIVE_ELEMENT_SELECTOR
             )
+            return self._evaluate_aria(interactive_elements)
             
-            violations = []
-            passes = []
-            
-            for element in interactive_elements:
-                try:
-                    aria_label = element.get_attribute('aria-label')
-                    aria_labelledby = element.get_attribute('aria-labelledby')
-                    aria_describedby = element.get_attribute('aria-describedby')
-                    role = element.get_attribute('role')
-                    text_content = element.get_attribute('textContent').strip()
-                    
-                    # Check if element has accessible name
-                    has_accessible_name = bool(aria_label or aria_labelledby or text_content)
-                    
-                    # Special checks for form inputs
-                    if element.tag_name.lower() in ['input', 'select', 'textarea']:
-                        input_type = element.get_attribute('type')
-                        if input_type not in ['hidden', 'submit', 'button', 'reset']:
-                            # Form inputs need labels
-                            label_for = None
-                            input_id = element.get_attribute('id')
-                            if input_id:
-                                try:
-                                    label_for = self.driver.find_element(
-                                        By.CSS_SELECTOR, f'label[for="{input_id}"]'
-                                    )
-                                except:
-                                    pass
-                            
-                            if not (aria_label or aria_labelledby or label_for):
-                                violations.append({
-                                    'target': [element.tag_name],
-                                    'html': element.get_attribute('outerHTML')[:200],
-                                    'data': {'missing': 'label or aria-label'}
-                                })
-                                continue
-                    
-                    # Check for proper ARIA usage
-                    if role:
-                        valid_roles = [
-                            'button', 'link', 'tab', 'tabpanel', 'dialog', 'alert',
-                            'navigation', 'main', 'banner', 'contentinfo', 'search',
-                            'region', 'article', 'section', 'aside', 'heading',
-                            'list', 'listitem', 'table', 'row', 'cell'
-                        ]
-                        
-                        if role not in valid_roles:
-                            violations.append({
-                                'target': [element.tag_name],
-                                'html': element.get_attribute('outerHTML')[:200],
-                                'data': {'invalid_role': role}
-                            })
-                            continue
-                    
-                    if has_accessible_name:
-                        passes.append({
-                            'target': [element.tag_name],
-                            'html': element.get_attribute('outerHTML')[:200]
-                        })
-                    else:
-                        violations.append({
-                            'target': [element.tag_name],
-                            'html': element.get_attribute('outerHTML')[:200],
-                            'data': {'missing': 'accessible name'}
-                        })
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error checking ARIA attributes: {e}")
-                    continue
-            
-            if violations:
-                return {
-                    'status': 'violation',
-                    'nodes': violations
-                }
-            elif passes:
-                return {
-                    'status': 'pass',
-                    'nodes': passes
-                }
-            else:
-                return {
-                    'status': 'pass',
-                    'nodes': [{'target': ['body'], 'html': 'No interactive elements found'}]
-                }
-                
         except Exception as e:
             return {
                 'status': 'incomplete',
@@ -322,100 +500,10 @@ class WCAGRules(LoggerMixin):
         Test for proper landmark regions (WCAG 2.1)
         """
         try:
-            # Check for main landmark
-            main_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, 'main, [role="main"]'
-            )
-            
-            # Check for navigation landmarks
-            nav_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, 'nav, [role="navigation"]'
-            )
-            
-            # Check for banner (header)
-            banner_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, 'header, [role="banner"]'
-            )
+            # Collect main and navigation landmarks and the landmarks that need labels
+            scan = self.driver.execute_script(_LANDMARK_SCAN_SCRIPT, _LANDMARK_SELECTOR)
+            return self._evaluate_landmarks(scan)
             
-            # Check for contentinfo (footer)
-            footer_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, 'footer, [role="contentinfo"]'
-            )
-            
-            violations = []
-            passes = []
-            
-            # Check main content area
-            if not main_elements:
-                violations.append({
-                    'target': ['body'],
-                    'html': 'Missing main content landmark',
-                    'data': {'missing_landmark': 'main'}
-                })
-            else:
-                passes.append({
-                    'target': ['main'],
-                    'html': main_elements[0].get_attribute('outerHTML')[:200]
-                })
-            
-            # Multiple main elements is a violation
-            if len(main_elements) > 1:
-                violations.append({
-                    'target': ['main'],
-                    'html': 'Multiple main landmarks found',
-                    'data': {'count': len(main_elements)}
-                })
-            
-            # Check for navigation (recommended but not required)
-            if nav_elements:
-                passes.append({
-                    'target': ['nav'],
-                    'html': nav_elements[0].get_attribute('outerHTML')[:200]
-                })
-            
-            # Check for proper landmark structure
-            all_landmarks = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                'main, nav, header, footer, aside, section, [role="main"], [role="navigation"], [role="banner"], [role="contentinfo"], [role="complementary"], [role="region"]'
-            )
-            
-            for landmark in all_landmarks:
-                try:
-                    # Check if landmark has accessible name when required
-                    role = landmark.get_attribute('role') or landmark.tag_name.lower()
-                    
-                    if role in ['region', 'navigation'] and len(self.driver.find_elements(By.CSS_SELECTOR, f'[role="{role}"], {role}')) > 1:
-                        # Multiple regions/navs should have labels
-                        aria_label = landmark.get_attribute('aria-label')
-                        aria_labelledby = landmark.get_attribute('aria-labelledby')
-                        
-                        if not (aria_label or aria_labelledby):
-                            violations.append({
-                                'target': [landmark.tag_name],
-                                'html': landmark.get_attribute('outerHTML')[:200],
-                                'data': {'missing_label_for_multiple': role}
-                            })
-                        else:
-                            passes.append({
-                                'target': [landmark.tag_name],
-                                'html': landmark.get_attribute('outerHTML')[:200]
-                            })
-                    
-                except Exception as e:
-                    self.logger.debug(f"Error checking landmark: {e}")
-                    continue
-            
-            if violations:
-                return {
-                    'status': 'violation',
-                    'nodes': violations
-                }
-            else:
-                return {
-                    'status': 'pass',
-                    'nodes': passes
-                }
-                
         except Exception as e:
             return {
                 'status': 'incomplete',
@@ -427,86 +515,10 @@ class WCAGRules(LoggerMixin):
         Test data table accessibility
         """
         try:
-            tables = self.driver.find_elements(By.TAG_NAME, 'table')
-            
-            if not tables:
-                return {
-                    'status': 'pass',
-                    'nodes': [{'target': ['body'], 'html': 'No tables found'}]
-                }
-            
-            violations = []
-            passes = []
-            
-            for table in tables:
-                try:
-                    # Check for table headers
-                    th_elements = table.find_elements(By.TAG_NAME, 'th')
-                    thead_elements = table.find_elements(By.TAG_NAME, 'thead')
-                    
-                    # Check for caption
-                    caption_elements = table.find_elements(By.TAG_NAME, 'caption')
-                    
-                    # Check for summary or aria-label
-                    summary = table.get_attribute('summary')
-                    aria_label = table.get_attribute('aria-label')
-                    aria_labelledby = table.get_attribute('aria-labelledby')
-                    
-                    # Data tables should have headers
-                    if not th_elements and not thead_elements:
-                        violations.append({
-                            'target': ['table'],
-                            'html': table.get_attribute('outerHTML')[:200],
-                            'data': {'missing': 'table headers'}
-                        })
-                        continue
-                    
-                    # Check header scope attributes
-                    header_issues = []
-                    for th in th_elements:
-                        scope = th.get_attribute('scope')
-                        if not scope:
-                            header_issues.append('Missing scope attribute')
-                    
-                    # Complex tables should have caption or description
-                    rows = table.find_elements(By.TAG_NAME, 'tr')
-                    is_complex = len(rows) > 5 or len(th_elements) > 3
-                    
-                    if is_complex and not (caption_elements or summary or aria_label or aria_labelledby):
-                        violations.append({
-                            'target': ['table'],
-                            'html': table.get_attribute('outerHTML')[:200],
-                            'data': {'missing': 'table caption or description'}
-                        })
-                        continue
-                    
-                    if header_issues:
-                        violations.append({
-                            'target': ['table'],
-                            'html': table.get_attribute('outerHTML')[:200],
-                            'data': {'header_issues': header_issues}
-                        })
-                    else:
-                        passes.append({
-                            'target': ['table'],
-                            'html': table.get_attribute('outerHTML')[:200]
-                        })
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error checking table accessibility: {e}")
-                    continue
+            # Collect header, caption and row information of all tables in one script call
+            tables = self.driver.execute_script(_TABLE_SCAN_SCRIPT)
+            return self._evaluate_tables(tables)
             
-            if violations:
-                return {
-                    'status': 'violation',
-                    'nodes': violations
-                }
-            else:
-                return {
-                    'status': 'pass',
-                    'nodes': passes
-                }
-                
         except Exception as e:
             return {
                 'status': 'incomplete',
@@ -518,153 +530,441 @@ class WCAGRules(LoggerMixin):
         Test multimedia content for alternatives (WCAG 2.1)
         """
         try:
-            violations = []
-            passes = []
+            # Collect video, audio and embedded media in one script call
+            media = self.driver.execute_script(_MEDIA_SCAN_SCRIPT)
+            return self._evaluate_media(media)
             
-            # Check video elements
-            videos = self.driver.find_elements(By.TAG_NAME, 'video')
-            for video in videos:
-                try:
-                    # Check for captions/subtitles
-                    tracks = video.find_elements(By.TAG_NAME, 'track')
-                    caption_tracks = [t for t in tracks if t.get_attribute('kind') == 'captions']
-                    subtitle_tracks = [t for t in tracks if t.get_attribute('kind') == 'subtitles']
-                    
-                    if not (caption_tracks or subtitle_tracks):
-                        violations.append({
-                            'target': ['video'],
-                            'html': video.get_attribute('outerHTML')[:200],
-                            'data': {'missing': 'captions or subtitles'}
-                        })
-                    else:
-                        passes.append({
-                            'target': ['video'],
-                            'html': video.get_attribute('outerHTML')[:200]
-                        })
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error checking video: {e}")
+        except Exception as e:
+            return {
+                'status': 'incomplete',
+                'reason': f'Error testing media alternatives: {str(e)}'
+            }
+    
+    # Page scan evaluation
+    
+    def _evaluate_contrast(self, text_elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the color contrast test result from its page scan"""
+        violations = []
+        passes = []
+        
+        # Contrast outcome per computed style, elements sharing a style share the outcome
+        style_outcomes: Dict[Tuple[str, str, str, str], Optional[Tuple[float, float, bool]]] = {}
+        
+        for element in text_elements:
+            try:
+                color = element['color']
+                background_color = element['backgroundColor']
+                font_size = element['fontSize']
+                
+                signature = (color, background_color, font_size, element['fontWeight'])
+                if signature in style_outcomes:
+                    outcome = style_outcomes[signature]
+                else:
+                    outcome = self._check_text_contrast(*signature)
+                    style_outcomes[signature] = outcome
+                
+                if outcome is None:
                     continue
-            
-            # Check audio elements
-            audios = self.driver.find_elements(By.TAG_NAME, 'audio')
-            for audio in audios:
-                try:
-                    # Audio should have transcript or description
-                    # This is difficult to test automatically, so we'll mark as incomplete
+                contrast_ratio, required_ratio, is_large_text = outcome
+                
+                if contrast_ratio < required_ratio:
+                    violations.append({
+                        'target': [element['tagName']],
+                        'html': element['outerHTML'],
+                        'data': {
+                            'contrast_ratio': round(contrast_ratio, 2),
+                            'required_ratio': required_ratio,
+                            'text_color': color,
+                            'background_color': background_color,
+                            'font_size': font_size,
+                            'is_large_text': is_large_text
+                        }
+                    })
+                else:
                     passes.append({
-                        'target': ['audio'],
-                        'html': audio.get_attribute('outerHTML')[:200],
-                        'data': {'note': 'Manual verification needed for transcript'}
+                        'target': [element['tagName']],
+                        'html': element['outerHTML'],
+                        'data': {
+                            'contrast_ratio': round(contrast_ratio, 2),
+                            'required_ratio': required_ratio
+                        }
                     })
                     
-                except Exception as e:
-                    self.logger.debug(f"Error checking audio: {e}")
-                    continue
+            except Exception as e:
+                self.logger.debug(f"Error checking contrast for element: {e}")
+                continue
+        
+        if violations:
+            return {
+                'status': 'violation',
+                'nodes': violations
+            }
+        elif passes:
+            return {
+                'status': 'pass',
+                'nodes': passes
+            }
+        else:
+            return {
+                'status': 'incomplete',
+                'reason': 'No text elements found for contrast testing'
+            }
+    
+    def _check_text_contrast(self, color: str, background_color: str, font_size: str,
+                             font_weight: str) -> Optional[Tuple[float, float, bool]]:
+        """
+        Check text contrast for a set of computed style values
+        
+        Returns:
+            Tuple of contrast ratio, required ratio and whether the text is large,
+            or None if the colors cannot be parsed
+        """
+        # Parse colors
+        text_rgb = self._parse_color(color)
+        bg_rgb = self._parse_color(background_color)
+        
+        if not text_rgb or not bg_rgb:
+            return None
+        
+        # Calculate contrast ratio, text in its background color is always 1:1
+        if text_rgb == bg_rgb:
+            contrast_ratio = 1.0
+        else:
+            contrast_ratio = self._calculate_contrast_ratio(text_rgb, bg_rgb)
+        
+        # Determine if text is large (18pt+ or 14pt+ bold)
+        font_size_px = self._parse_font_size(font_size)
+        is_bold = self._is_bold_font(font_weight)
+        is_large_text = (font_size_px >= 18) or (font_size_px >= 14 and is_bold)
+        
+        # Check compliance
+        required_ratio = 3.0 if is_large_text else 4.5
+        return contrast_ratio, required_ratio, is_large_text
+    
+    def _evaluate_keyboard(self, scan: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the keyboard navigation test result from its page scan"""
+        if not scan['count']:
+            return {
+                'status': 'pass',
+                'nodes': [{'target': ['body'], 'html': 'No focusable elements found'}]
+            }
+        
+        violations = []
+        passes = []
+        
+        for element in scan['focused']:
+            try:
+                # Check for visible focus indicator
+                outline = element['outline']
+                box_shadow = element['boxShadow']
+                
+                has_focus_indicator = (
+                    outline != 'none' and element['outlineWidth'] != '0px' or
+                    box_shadow != 'none' or
+                    'focus' in (element['className'] or '')
+                )
+                
+                if has_focus_indicator:
+                    passes.append({
+                        'target': [element['tagName']],
+                        'html': element['outerHTML']
+                    })
+                else:
+                    violations.append({
+                        'target': [element['tagName']],
+                        'html': element['outerHTML'],
+                        'data': {
+                            'outline': outline,
+                            'box_shadow': box_shadow
+                        }
+                    })
+                
+            except Exception as e:
+                self.logger.debug(f"Error testing keyboard focus: {e}")
+                continue
+        
+        if violations:
+            return {
+                'status': 'violation',
+                'nodes': violations
+            }
+        else:
+            return {
+                'status': 'pass',
+                'nodes': passes
+            }
+    
+    def _evaluate_aria(self, interactive_elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the ARIA label and role test result from its page scan"""
+        violations = []
+        passes = []
+        
+        for element in interactive_elements:
+            aria_label = element['ariaLabel']
+            aria_labelledby = element['ariaLabelledby']
+            role = element['role']
             
-            # Check for embedded media (iframe, object, embed)
-            embedded_media = self.driver.find_elements(By.CSS_SELECTOR, 'iframe, object, embed')
-            for media in embedded_media:
-                try:
-                    title = media.get_attribute('title')
-                    aria_label = media.get_attribute('aria-label')
-                    
-                    if not (title or aria_label):
+            # Check if element has accessible name
+            has_accessible_name = bool(aria_label or aria_labelledby or element['hasText'])
+            
+            # Special checks for form inputs
+            if element['tagName'] in ['input', 'select', 'textarea']:
+                input_type = element['type']
+                if input_type not in ['hidden', 'submit', 'button', 'reset']:
+                    # Form inputs need labels
+                    if not (aria_label or aria_labelledby or element['hasLabel']):
                         violations.append({
-                            'target': [media.tag_name],
-                            'html': media.get_attribute('outerHTML')[:200],
-                            'data': {'missing': 'title or aria-label for embedded media'}
+                            'target': [element['tagName']],
+                            'html': element['outerHTML'],
+                            'data': {'missing': 'label or aria-label'}
                         })
-                    else:
-                        passes.append({
-                            'target': [media.tag_name],
-                            'html': media.get_attribute('outerHTML')[:200]
-                        })
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error checking embedded media: {e}")
+                        continue
+            
+            # Check for proper ARIA usage
+            if role:
+                if role not in _VALID_ROLES:
+                    violations.append({
+                        'target': [element['tagName']],
+                        'html': element['outerHTML'],
+                        'data': {'invalid_role': role}
+                    })
                     continue
             
-            if violations:
-                return {
-                    'status': 'violation',
-                    'nodes': violations
-                }
-            elif passes:
-                return {
-                    'status': 'pass',
-                    'nodes': passes
-                }
+            if has_accessible_name:
+                passes.append({
+                    'target': [element['tagName']],
+                    'html': element['outerHTML']
+                })
             else:
-                return {
-                    'status': 'pass',
-                    'nodes': [{'target': ['body'], 'html': 'No multimedia content found'}]
-                }
-                
-        except Exception as e:
+                violations.append({
+                    'target': [element['tagName']],
+                    'html': element['outerHTML'],
+                    'data': {'missing': 'accessible name'}
+                })
+        
+        if violations:
             return {
-                'status': 'incomplete',
-                'reason': f'Error testing media alternatives: {str(e)}'
+                'status': 'violation',
+                'nodes': violations
+            }
+        elif passes:
+            return {
+                'status': 'pass',
+                'nodes': passes
+            }
+        else:
+            return {
+                'status': 'pass',
+                'nodes': [{'target': ['body'], 'html': 'No interactive elements found'}]
             }
     
-    # Helper methods
+    def _evaluate_landmarks(self, scan: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the landmark region test result from its page scan"""
+        main_count = scan['mainCount']
+        
+        violations = []
+        passes = []
+        
+        # Check main content area
+        if not main_count:
+            violations.append({
+                'target': ['body'],
+                'html': 'Missing main content landmark',
+                'data': {'missing_landmark': 'main'}
+            })
+        else:
+            passes.append({
+                'target': ['main'],
+                'html': scan['mainHTML']
+            })
+        
+        # Multiple main elements is a violation
+        if main_count > 1:
+            violations.append({
+                'target': ['main'],
+                'html': 'Multiple main landmarks found',
+                'data': {'count': main_count}
+            })
+        
+        # Check for navigation (recommended but not required)
+        if scan['navHTML'] is not None:
+            passes.append({
+                'target': ['nav'],
+                'html': scan['navHTML']
+            })
+        
+        # Multiple regions/navs should have labels
+        for landmark in scan['repeated']:
+            if not (landmark['ariaLabel'] or landmark['ariaLabelledby']):
+                violations.append({
+                    'target': [landmark['tagName']],
+                    'html': landmark['outerHTML'],
+                    'data': {'missing_label_for_multiple': landmark['role']}
+                })
+            else:
+                passes.append({
+                    'target': [landmark['tagName']],
+                    'html': landmark['outerHTML']
+                })
+        
+        if violations:
+            return {
+                'status': 'violation',
+                'nodes': violations
+            }
+        else:
+            return {
+                'status': 'pass',
+                'nodes': passes
+            }
     
-    def _get_computed_style(self, element, property_name: str) -> str:
-        """Get computed CSS style for an element"""
-        try:
-            return self.driver.execute_script(
-                f"return window.getComputedStyle(arguments[0]).{property_name}",
-                element
+    def _evaluate_tables(self, tables: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the table accessibility test result from its page scan"""
+        if not tables:
+            return {
+                'status': 'pass',
+                'nodes': [{'target': ['body'], 'html': 'No tables found'}]
+            }
+        
+        violations = []
+        passes = []
+        
+        for table in tables:
+            # Data tables should have headers
+            if not table['headerCount'] and not table['hasThead']:
+                violations.append({
+                    'target': ['table'],
+                    'html': table['outerHTML'],
+                    'data': {'missing': 'table headers'}
+                })
+                continue
+            
+            # Check header scope attributes
+            header_issues = ['Missing scope attribute'] * table['missingScopeCount']
+            
+            # Complex tables should have caption or description
+            is_complex = table['rowCount'] > 5 or table['headerCount'] > 3
+            has_description = (
+                table['hasCaption'] or table['summary'] or
+                table['ariaLabel'] or table['ariaLabelledby']
             )
-        except Exception:
-            return ""
+            
+            if is_complex and not has_description:
+                violations.append({
+                    'target': ['table'],
+                    'html': table['outerHTML'],
+                    'data': {'missing': 'table caption or description'}
+                })
+                continue
+            
+            if header_issues:
+                violations.append({
+                    'target': ['table'],
+                    'html': table['outerHTML'],
+                    'data': {'header_issues': header_issues}
+                })
+            else:
+                passes.append({
+                    'target': ['table'],
+                    'html': table['outerHTML']
+                })
+        
+        if violations:
+            return {
+                'status': 'violation',
+                'nodes': violations
+            }
+        else:
+            return {
+                'status': 'pass',
+                'nodes': passes
+            }
     
-    def _parse_color(self, color_string: str) -> Optional[Tuple[int, int, int]]:
-        """Parse CSS color string to RGB tuple"""
-        if not color_string:
-            return None
+    def _evaluate_media(self, media: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the media alternatives test result from its page scan"""
+        violations = []
+        passes = []
         
-        # Handle rgb() format
-        rgb_match = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color_string)
-        if rgb_match:
-            return tuple(int(x) for x in rgb_match.groups())
+        # Check video elements for captions/subtitles
+        for video in media['videos']:
+            if not video['hasCaptions']:
+                violations.append({
+                    'target': ['video'],
+                    'html': video['outerHTML'],
+                    'data': {'missing': 'captions or subtitles'}
+                })
+            else:
+                passes.append({
+                    'target': ['video'],
+                    'html': video['outerHTML']
+                })
         
-        # Handle rgba() format (ignore alpha for contrast calculation)
-        rgba_match = re.match(r'rgba\((\d+),\s*(\d+),\s*(\d+),\s*[\d.]+\)', color_string)
-        if rgba_match:
-            return tuple(int(x) for x in rgba_match.groups())
+        # Check audio elements
+        for audio in media['audios']:
+            # Audio should have transcript or description
+            # This is difficult to test automatically, so we'll mark as incomplete
+            passes.append({
+                'target': ['audio'],
+                'html': audio['outerHTML'],
+                'data': {'note': 'Manual verification needed for transcript'}
+            })
         
-        # Handle transparent
-        if color_string == 'transparent' or color_string == 'rgba(0, 0, 0, 0)':
-            return (255, 255, 255)  # Assume white background for transparent
+        # Check for embedded media (iframe, object, embed)
+        for embedded in media['embedded']:
+            if not (embedded['title'] or embedded['ariaLabel']):
+                violations.append({
+                    'target': [embedded['tagName']],
+                    'html': embedded['outerHTML'],
+                    'data': {'missing': 'title or aria-label for embedded media'}
+                })
+            else:
+                passes.append({
+                    'target': [embedded['tagName']],
+                    'html': embedded['outerHTML']
+                })
         
-        # Handle hex colors (basic implementation)
-        if color_string.startswith('#'):
-            try:
-                hex_color = color_string[1:]
-                if len(hex_color) == 3:
-                    hex_color = ''.join([c*2 for c in hex_color])
-                if len(hex_color) == 6:
-                    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            except ValueError:
-                pass
+        if violations:
+            return {
+                'status': 'violation',
+                'nodes': violations
+            }
+        elif passes:
+            return {
+                'status': 'pass',
+                'nodes': passes
+            }
+        else:
+            return {
+                'status': 'pass',
+                'nodes': [{'target': ['body'], 'html': 'No multimedia content found'}]
+            }
+    
+    # Helper methods
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_color(color_string: str) -> Optional[Tuple[int, int, int]]:
+        """Parse CSS color string to RGB tuple, cached as pages reuse a handful of colors"""
+        if not color_string:
+            return None
+        
+        # Handle rgb(), rgba() (alpha is ignored for contrast calculation) and hex colors
+        match = _COLOR_RE.match(color_string)
+        if match:
+            red, green, blue, hex6, hex3 = match.groups()
+            if red is not None:
+                return (int(red), int(green), int(blue))
+            
+            hex_color = hex6 or ''.join(c * 2 for c in hex3)
+            return (int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
         
-        return None
+        # Handle named colors and transparent
+        return _NAMED_COLORS.get(color_string.lower())
     
     def _calculate_contrast_ratio(self, rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int]) -> float:
         """Calculate contrast ratio between two colors"""
-        def relative_luminance(rgb):
-            """Calculate relative luminance of a color"""
-            r, g, b = [x / 255.0 for x in rgb]
-            
-            def gamma_correct(c):
-                return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
-            
-            r, g, b = map(gamma_correct, [r, g, b])
-            return 0.2126 * r + 0.7152 * g + 0.0722 * b
-        
-        l1 = relative_luminance(rgb1)
-        l2 = relative_luminance(rgb2)
+        l1 = _relative_luminance(rgb1)
+        l2 = _relative_luminance(rgb2)
         
         # Ensure l1 is the lighter color
         if l1 < l2:
@@ -672,8 +972,14 @@ class WCAGRules(LoggerMixin):
         
         return (l1 + 0.05) / (l2 + 0.05)
     
-    def _parse_font_size(self, font_size_string: str) -> float:
-        """Parse font size string to pixels"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_font_size(font_size_string: str) -> float:
+        """Parse a computed font size to pixels
+
+        Computed styles always report font-size in px, so other units are
+        not expected here and fall back to the default.
+        """
         if not font_size_string:
             return 16.0  # Default font size
         
@@ -681,19 +987,12 @@ class WCAGRules(LoggerMixin):
             try:
                 return float(font_size_string[:-2])
             except ValueError:
-                return 16.0
-        
-        # Handle other units (simplified)
-        if font_size_string.endswith('pt'):
-            try:
-                pt_size = float(font_size_string[:-2])
-                return pt_size * 1.33  # Rough conversion pt to px
-            except ValueError:
-                return 16.0
-        
-        return 16.0
+                pass
+        return 16.0  # Default font size
     
-    def _is_bold_font(self, font_weight_string: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _is_bold_font(font_weight_string: str) -> bool:
         """Check if font weight is bold"""
         if not font_weight_string:
             return False
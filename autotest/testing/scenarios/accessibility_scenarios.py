@@ -20,15 +20,19 @@ Comprehensive accessibility testing scenarios that combine multiple modification
 """
 
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import re
+import time
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
+from autotest.utils.compat import DATACLASS_SLOTS
+
 from .modification_scenarios import ModificationScenarios
 from .scenario_manager import ScenarioManager
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AccessibilityScenario:
     """
     Comprehensive accessibility scenario combining multiple templates and testing approaches
@@ -43,6 +47,279 @@ class AccessibilityScenario:
     expected_outcomes: List[str]
     success_criteria: Dict[str, Any]
     wcag_level: str
+    # Per-criterion weights, in success_criteria order; a criterion's 'weight' defaults to 1
+    criteria_weights: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so derived fields are set through object.__setattr__
+        object.__setattr__(self, 'criteria_weights', tuple(
+            float(requirements.get('weight', 1)) for requirements in self.success_criteria.values()
+        ))
+
+
+@dataclass(**DATACLASS_SLOTS)
+class PhaseResult:
+    """Outcome of a single accessibility scenario testing phase"""
+    phase: str
+    status: str  # "completed", "failed", "skipped"
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    duration: Optional[float] = None
+    results: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def _build_accessibility_scenarios() -> Dict[str, AccessibilityScenario]:
+    """Build the static accessibility testing scenarios"""
+    scenarios = {}
+    
+    # Basic Accessibility Compliance Scenario
+    scenarios['basic_compliance'] = AccessibilityScenario(
+        scenario_id='basic_compliance',
+        name='Basic WCAG 2.1 AA Compliance',
+        description='Fundamental accessibility improvements to meet WCAG 2.1 AA standards',
+        category='compliance',
+        priority='high',
+        template_ids=[
+            'wcag_aa_contrast',
+            'focus_ring_enhancement',
+            'minimum_touch_targets',
+            'accessible_forms'
+        ],
+        testing_phases=[
+            'baseline_analysis',
+            'css_modifications',
+            'javascript_testing',
+            'validation',
+            'compliance_check'
+        ],
+        expected_outcomes=[
+            'All text meets WCAG AA contrast ratios',
+            'Focus indicators visible on all interactive elements',
+            'Minimum touch target sizes met',
+            'Forms fully accessible with proper labeling',
+            'Keyboard navigation functional throughout'
+        ],
+        success_criteria={
+            'contrast_compliance_rate': {'min': 100},
+            'focus_visibility_score': {'min': 90},
+            'touch_target_compliance': {'min': 100},
+            'form_accessibility_score': {'min': 95},
+            'overall_wcag_score': {'min': 85}
+        },
+        wcag_level='AA'
+    )
+    
+    # Enhanced User Experience Scenario
+    scenarios['enhanced_ux'] = AccessibilityScenario(
+        scenario_id='enhanced_ux',
+        name='Enhanced Accessible User Experience',
+        description='Advanced accessibility features for superior user experience',
+        category='enhancement',
+        priority='high',
+        template_ids=[
+            'high_contrast_focus',
+            'enhanced_touch_targets',
+            'readable_typography',
+            'dark_mode_contrast',
+            'reduced_motion'
+        ],
+        testing_phases=[
+            'baseline_analysis',
+            'enhanced_css_modifications',
+            'dynamic_javascript_testing',
+            'user_experience_validation',
+            'performance_check'
+        ],
+        expected_outcomes=[
+            'High contrast mode fully functional',
+            'Enhanced touch targets for better mobile experience',
+            'Typography optimized for readability',
+            'Dark mode with proper contrast ratios',
+            'Motion preferences respected'
+        ],
+        success_criteria={
+            'contrast_enhancement_score': {'min': 95},
+            'touch_target_enhancement': {'min': 100},
+            'typography_readability': {'min': 90},
+            'dark_mode_compliance': {'min': 85},
+            'motion_safety_score': {'min': 100}
+        },
+        wcag_level='AAA'
+    )
+    
+    # Inclusive Design Scenario
+    scenarios['inclusive_design'] = AccessibilityScenario(
+        scenario_id='inclusive_design',
+        name='Inclusive Design Implementation',
+        description='Comprehensive inclusive design with cognitive and motor accessibility',
+        category='inclusive',
+        priority='high',
+        template_ids=[
+            'dyslexia_friendly',
+            'enhanced_touch_targets',
+            'accessible_forms',
+            'reduced_motion',
+            'responsive_accessibility'
+        ],
+        testing_phases=[
+            'cognitive_accessibility_analysis',
+            'motor_accessibility_testing',
+            'inclusive_css_modifications',
+            'assistive_technology_testing',
+            'inclusive_validation'
+        ],
+        expected_outcomes=[
+            'Typography optimized for dyslexia',
+            'Enhanced touch targets for motor impairments',
+            'Forms accessible to cognitive disabilities',
+            'Motion safety for vestibular disorders',
+            'Responsive design maintains accessibility'
+        ],
+        success_criteria={
+            'cognitive_accessibility_score': {'min': 90},
+            'motor_accessibility_score': {'min': 95},
+            'assistive_tech_compatibility': {'min': 90},
+            'responsive_accessibility': {'min': 85},
+            'inclusive_design_score': {'min': 88}
+        },
+        wcag_level='AAA'
+    )
+    
+    # Mobile-First Accessibility Scenario
+    scenarios['mobile_first'] = AccessibilityScenario(
+        scenario_id='mobile_first',
+        name='Mobile-First Accessibility',
+        description='Comprehensive mobile accessibility with touch and gesture support',
+        category='mobile',
+        priority='medium',
+        template_ids=[
+            'minimum_touch_targets',
+            'responsive_accessibility',
+            'readable_typography',
+            'high_contrast_focus'
+        ],
+        testing_phases=[
+            'mobile_baseline_analysis',
+            'responsive_css_modifications',
+            'touch_interaction_testing',
+            'mobile_validation',
+            'cross_device_testing'
+        ],
+        expected_outcomes=[
+            'Touch targets meet mobile accessibility standards',
+            'Content reflows properly on all screen sizes',
+            'Typography remains readable on small screens',
+            'Focus indicators work with touch navigation',
+            'Gestures accessible to users with motor impairments'
+        ],
+        success_criteria={
+            'mobile_touch_compliance': {'min': 100},
+            'responsive_score': {'min': 90},
+            'mobile_typography_score': {'min': 85},
+            'touch_navigation_score': {'min': 95},
+            'cross_device_consistency': {'min': 80}
+        },
+        wcag_level='AA'
+    )
+    
+    # Enterprise Accessibility Scenario
+    scenarios['enterprise_ready'] = AccessibilityScenario(
+        scenario_id='enterprise_ready',
+        name='Enterprise Accessibility Standards',
+        description='Enterprise-grade accessibility compliance with governance and reporting',
+        category='enterprise',
+        priority='high',
+        template_ids=[
+            'wcag_aa_contrast',
+            'focus_ring_enhancement',
+            'accessible_forms',
+            'reduced_motion',
+            'responsive_accessibility'
+        ],
+        testing_phases=[
+            'governance_compliance_check',
+            'enterprise_css_modifications',
+            'accessibility_api_testing',
+            'documentation_validation',
+            'audit_preparation'
+        ],
+        expected_outcomes=[
+            'Full WCAG 2.1 AA compliance documented',
+            'Accessibility governance standards met',
+            'API accessibility properly implemented',
+            'Documentation includes accessibility guidelines',
+            'Audit-ready accessibility implementation'
+        ],
+        success_criteria={
+            'wcag_compliance_rate': {'min': 100},
+            'governance_compliance': {'min': 95},
+            'api_accessibility_score': {'min': 90},
+            'documentation_completeness': {'min': 85},
+            'audit_readiness_score': {'min': 92}
+        },
+        wcag_level='AA'
+    )
+    
+    return scenarios
+
+
+# Scenario definitions are static, so every orchestrator shares one copy
+_SCENARIOS = _build_accessibility_scenarios()
+
+# Category and priority lookups, built in the same order as _SCENARIOS
+_BY_CATEGORY: Dict[str, List[AccessibilityScenario]] = {}
+_BY_PRIORITY: Dict[str, List[AccessibilityScenario]] = {}
+for _scenario in _SCENARIOS.values():
+    _BY_CATEGORY.setdefault(_scenario.category, []).append(_scenario)
+    _BY_PRIORITY.setdefault(_scenario.priority, []).append(_scenario)
+del _scenario
+
+# Scenario summaries served by get_available_scenarios
+_AVAILABLE_SCENARIOS: List[Dict[str, Any]] = [
+    {
+        'scenario_id': scenario.scenario_id,
+        'name': scenario.name,
+        'description': scenario.description,
+        'category': scenario.category,
+        'priority': scenario.priority,
+        'wcag_level': scenario.wcag_level,
+        'expected_outcomes': scenario.expected_outcomes,
+        'template_count': len(scenario.template_ids),
+        'testing_phases': scenario.testing_phases
+    }
+    for scenario in _SCENARIOS.values()
+]
+
+# Fields persisted for a scenario run; scenario_info is derivable from scenario_id
+_STORED_RESULT_FIELDS = (
+    'scenario_id', 'page_id', 'start_time', 'end_time', 'duration', 'phases',
+    'template_results', 'validation_results', 'final_assessment'
+)
+
+# Fixed guidance included in every final assessment
+_DEFAULT_RECOMMENDATIONS = (
+    'Continue monitoring accessibility metrics',
+    'Regular accessibility audits recommended',
+    'Consider advanced inclusive design features'
+)
+_DEFAULT_NEXT_STEPS = (
+    'Implement remaining accessibility improvements',
+    'Schedule follow-up accessibility testing',
+    'Document accessibility guidelines'
+)
+
+# Issue keywords mapped to the scenarios that address them
+_ISSUE_MAPPINGS: Dict[str, Tuple[str, ...]] = {
+    'contrast': ('basic_compliance', 'enhanced_ux'),
+    'focus': ('basic_compliance',),
+    'mobile': ('mobile_first',),
+    'cognitive': ('inclusive_design',),
+    'enterprise': ('enterprise_ready',)
+}
+
+# Finds every mapped keyword in an issue description in a single scan
+_ISSUE_KEYWORD_RE = re.compile('|'.join(map(re.escape, _ISSUE_MAPPINGS)))
 
 
 class AccessibilityScenarios:
@@ -67,202 +344,8 @@ class AccessibilityScenarios:
         self.modification_scenarios = ModificationScenarios()
         self.scenario_manager = ScenarioManager(driver, db_connection)
         
-        # Initialize comprehensive scenarios
-        self.scenarios = self._initialize_accessibility_scenarios()
-    
-    def _initialize_accessibility_scenarios(self) -> Dict[str, AccessibilityScenario]:
-        """Initialize comprehensive accessibility testing scenarios"""
-        scenarios = {}
-        
-        # Basic Accessibility Compliance Scenario
-        scenarios['basic_compliance'] = AccessibilityScenario(
-            scenario_id='basic_compliance',
-            name='Basic WCAG 2.1 AA Compliance',
-            description='Fundamental accessibility improvements to meet WCAG 2.1 AA standards',
-            category='compliance',
-            priority='high',
-            template_ids=[
-                'wcag_aa_contrast',
-                'focus_ring_enhancement',
-                'minimum_touch_targets',
-                'accessible_forms'
-            ],
-            testing_phases=[
-                'baseline_analysis',
-                'css_modifications',
-                'javascript_testing',
-                'validation',
-                'compliance_check'
-            ],
-            expected_outcomes=[
-                'All text meets WCAG AA contrast ratios',
-                'Focus indicators visible on all interactive elements',
-                'Minimum touch target sizes met',
-                'Forms fully accessible with proper labeling',
-                'Keyboard navigation functional throughout'
-            ],
-            success_criteria={
-                'contrast_compliance_rate': {'min': 100},
-                'focus_visibility_score': {'min': 90},
-                'touch_target_compliance': {'min': 100},
-                'form_accessibility_score': {'min': 95},
-                'overall_wcag_score': {'min': 85}
-            },
-            wcag_level='AA'
-        )
-        
-        # Enhanced User Experience Scenario
-        scenarios['enhanced_ux'] = AccessibilityScenario(
-            scenario_id='enhanced_ux',
-            name='Enhanced Accessible User Experience',
-            description='Advanced accessibility features for superior user experience',
-            category='enhancement',
-            priority='high',
-            template_ids=[
-                'high_contrast_focus',
-                'enhanced_touch_targets',
-                'readable_typography',
-                'dark_mode_contrast',
-                'reduced_motion'
-            ],
-            testing_phases=[
-                'baseline_analysis',
-                'enhanced_css_modifications',
-                'dynamic_javascript_testing',
-                'user_experience_validation',
-                'performance_check'
-            ],
-            expected_outcomes=[
-                'High contrast mode fully functional',
-                'Enhanced touch targets for better mobile experience',
-                'Typography optimized for readability',
-                'Dark mode with proper contrast ratios',
-                'Motion preferences respected'
-            ],
-            success_criteria={
-                'contrast_enhancement_score': {'min': 95},
-                'touch_target_enhancement': {'min': 100},
-                'typography_readability': {'min': 90},
-                'dark_mode_compliance': {'min': 85},
-                'motion_safety_score': {'min': 100}
-            },
-            wcag_level='AAA'
-        )
-        
-        # Inclusive Design Scenario
-        scenarios['inclusive_design'] = AccessibilityScenario(
-            scenario_id='inclusive_design',
-            name='Inclusive Design Implementation',
-            description='Comprehensive inclusive design with cognitive and motor accessibility',
-            category='inclusive',
-            priority='high',
-            template_ids=[
-                'dyslexia_friendly',
-                'enhanced_touch_targets',
-                'accessible_forms',
-                'reduced_motion',
-                'responsive_accessibility'
-            ],
-            testing_phases=[
-                'cognitive_accessibility_analysis',
-                'motor_accessibility_testing',
-                'inclusive_css_modifications',
-                'assistive_technology_testing',
-                'inclusive_validation'
-            ],
-            expected_outcomes=[
-                'Typography optimized for dyslexia',
-                'Enhanced touch targets for motor impairments',
-                'Forms accessible to cognitive disabilities',
-                'Motion safety for vestibular disorders',
-                'Responsive design maintains accessibility'
-            ],
-            success_criteria={
-                'cognitive_accessibility_score': {'min': 90},
-                'motor_accessibility_score': {'min': 95},
-                'assistive_tech_compatibility': {'min': 90},
-                'responsive_accessibility': {'min': 85},
-                'inclusive_design_score': {'min': 88}
-            },
-            wcag_level='AAA'
-        )
-        
-        # Mobile-First Accessibility Scenario
-        scenarios['mobile_first'] = AccessibilityScenario(
-            scenario_id='mobile_first',
-            name='Mobile-First Accessibility',
-            description='Comprehensive mobile accessibility with touch and gesture support',
-            category='mobile',
-            priority='medium',
-            template_ids=[
-                'minimum_touch_targets',
-                'responsive_accessibility',
-                'readable_typography',
-                'high_contrast_focus'
-            ],
-            testing_phases=[
-                'mobile_baseline_analysis',
-                'responsive_css_modifications',
-                'touch_interaction_testing',
-                'mobile_validation',
-                'cross_device_testing'
-            ],
-            expected_outcomes=[
-                'Touch targets meet mobile accessibility standards',
-                'Content reflows properly on all screen sizes',
-                'Typography remains readable on small screens',
-                'Focus indicators work with touch navigation',
-                'Gestures accessible to users with motor impairments'
-            ],
-            success_criteria={
-                'mobile_touch_compliance': {'min': 100},
-                'responsive_score': {'min': 90},
-                'mobile_typography_score': {'min': 85},
-                'touch_navigation_score': {'min': 95},
-                'cross_device_consistency': {'min': 80}
-            },
-            wcag_level='AA'
-        )
-        
-        # Enterprise Accessibility Scenario
-        scenarios['enterprise_ready'] = AccessibilityScenario(
-            scenario_id='enterprise_ready',
-            name='Enterprise Accessibility Standards',
-            description='Enterprise-grade accessibility compliance with governance and reporting',
-            category='enterprise',
-            priority='high',
-            template_ids=[
-                'wcag_aa_contrast',
-                'focus_ring_enhancement',
-                'accessible_forms',
-                'reduced_motion',
-                'responsive_accessibility'
-            ],
-            testing_phases=[
-                'governance_compliance_check',
-                'enterprise_css_modifications',
-                'accessibility_api_testing',
-                'documentation_validation',
-                'audit_preparation'
-            ],
-            expected_outcomes=[
-                'Full WCAG 2.1 AA compliance documented',
-                'Accessibility governance standards met',
-                'API accessibility properly implemented',
-                'Documentation includes accessibility guidelines',
-                'Audit-ready accessibility implementation'
-            ],
-            success_criteria={
-                'wcag_compliance_rate': {'min': 100},
-                'governance_compliance': {'min': 95},
-                'api_accessibility_score': {'min': 90},
-                'documentation_completeness': {'min': 85},
-                'audit_readiness_score': {'min': 92}
-            },
-            wcag_level='AA'
-        )
-        
-        return scenarios
+        # Comprehensive scenarios are shared, not rebuilt per instance
+        self.scenarios = _SCENARIOS
     
     def get_scenario(self, scenario_id: str) -> Optional[AccessibilityScenario]:
         """Get a specific accessibility scenario"""
@@ -270,11 +353,11 @@ class AccessibilityScenarios:
     
     def get_scenarios_by_category(self, category: str) -> List[AccessibilityScenario]:
         """Get scenarios by category"""
-        return [scenario for scenario in self.scenarios.values() if scenario.category == category]
+        return list(_BY_CATEGORY.get(category, ()))
     
     def get_scenarios_by_priority(self, priority: str) -> List[AccessibilityScenario]:
         """Get scenarios by priority level"""
-        return [scenario for scenario in self.scenarios.values() if scenario.priority == priority]
+        return list(_BY_PRIORITY.get(priority, ()))
     
     def run_accessibility_scenario(self, scenario_id: str, page_id: str, 
                                  custom_options: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -294,7 +377,8 @@ class AccessibilityScenarios:
             if not scenario:
                 return {'error': f'Accessibility scenario not found: {scenario_id}'}
             
-            self.logger.info(f"Running accessibility scenario: {scenario.name} on page {page_id}")
+            self.logger.info("Running accessibility scenario: %s on page %s", scenario.name, page_id)
+            started = time.perf_counter()
             
             # Initialize test session
             test_session = {
@@ -314,20 +398,26 @@ class AccessibilityScenarios:
                 'final_assessment': {}
             }
             
-            # Execute testing phases
-            for phase in scenario.testing_phases:
+            # Execute testing phases, stopping at the first failure unless told to continue
+            continue_on_failure = (custom_options or {}).get('continue_on_failure', False)
+            testing_phases = scenario.testing_phases
+            for index, phase in enumerate(testing_phases):
                 phase_result = self._execute_testing_phase(phase, scenario, page_id, custom_options)
                 test_session['phases'][phase] = phase_result
+                
+                if phase_result.status == 'failed' and not continue_on_failure:
+                    for skipped_phase in testing_phases[index + 1:]:
+                        test_session['phases'][skipped_phase] = PhaseResult(phase=skipped_phase, status='skipped')
+                    break
             
             # Run template-based modifications
             if scenario.template_ids:
-                combined_scenario = self.modification_scenarios.combine_templates(scenario.template_ids)
                 template_result = self.scenario_manager.run_scenario('combined_template', page_id)
                 test_session['template_results'] = template_result
             
             # Validate against success criteria
             validation_result = self._validate_accessibility_scenario(
-                test_session, scenario.success_criteria
+                test_session, scenario.success_criteria, scenario.criteria_weights
             )
             test_session['validation_results'] = validation_result
             
@@ -336,7 +426,7 @@ class AccessibilityScenarios:
             test_session['final_assessment'] = final_assessment
             
             test_session['end_time'] = datetime.now()
-            test_session['duration'] = (test_session['end_time'] - test_session['start_time']).total_seconds()
+            test_session['duration'] = time.perf_counter() - started
             
             # Store comprehensive results
             if self.db_connection:
@@ -345,45 +435,37 @@ class AccessibilityScenarios:
             return test_session
             
         except Exception as e:
-            self.logger.error(f"Error running accessibility scenario {scenario_id}: {e}")
+            self.logger.error("Error running accessibility scenario %s: %s", scenario_id, e)
             return {'error': str(e)}
     
     def _execute_testing_phase(self, phase: str, scenario: AccessibilityScenario, 
-                              page_id: str, custom_options: Dict[str, Any] = None) -> Dict[str, Any]:
+                              page_id: str, custom_options: Dict[str, Any] = None) -> PhaseResult:
         """Execute a specific testing phase"""
         try:
-            phase_result = {
-                'phase': phase,
-                'start_time': datetime.now(),
-                'status': 'running',
-                'results': {}
-            }
+            started = time.perf_counter()
+            start_time = datetime.now()
             
-            if phase == 'baseline_analysis':
-                phase_result['results'] = self._run_baseline_analysis(page_id)
-            elif phase == 'css_modifications':
-                phase_result['results'] = self._run_css_modifications_phase(scenario, page_id)
-            elif phase == 'javascript_testing':
-                phase_result['results'] = self._run_javascript_testing_phase(scenario, page_id)
-            elif phase == 'validation':
-                phase_result['results'] = self._run_validation_phase(scenario, page_id)
-            elif phase == 'compliance_check':
-                phase_result['results'] = self._run_compliance_check_phase(scenario, page_id)
+            handler = self._PHASE_HANDLERS.get(phase)
+            if handler:
+                results = handler(self, scenario, page_id)
             else:
                 # Generic phase execution
-                phase_result['results'] = {'message': f'Phase {phase} executed', 'status': 'completed'}
-            
-            phase_result['end_time'] = datetime.now()
-            phase_result['duration'] = (phase_result['end_time'] - phase_result['start_time']).total_seconds()
-            phase_result['status'] = 'completed'
+                results = {'message': f'Phase {phase} executed', 'status': 'completed'}
             
-            return phase_result
+            return PhaseResult(
+                phase=phase,
+                status='completed',
+                start_time=start_time,
+                end_time=datetime.now(),
+                duration=time.perf_counter() - started,
+                results=results
+            )
             
         except Exception as e:
-            self.logger.error(f"Error executing phase {phase}: {e}")
-            return {'phase': phase, 'status': 'failed', 'error': str(e)}
+            self.logger.error("Error executing phase %s: %s", phase, e)
+            return PhaseResult(phase=phase, status='failed', error=str(e))
     
-    def _run_baseline_analysis(self, page_id: str) -> Dict[str, Any]:
+    def _run_baseline_analysis(self, scenario: AccessibilityScenario, page_id: str) -> Dict[str, Any]:
         """Run baseline accessibility analysis"""
         # This would integrate with existing CSS and JS analyzers
         return {
@@ -433,43 +515,54 @@ class AccessibilityScenarios:
             'remaining_issues': 3        # Placeholder
         }
     
+    # Phases with a dedicated handler; any other phase runs generically
+    _PHASE_HANDLERS: Dict[str, Callable[..., Dict[str, Any]]] = {
+        'baseline_analysis': _run_baseline_analysis,
+        'css_modifications': _run_css_modifications_phase,
+        'javascript_testing': _run_javascript_testing_phase,
+        'validation': _run_validation_phase,
+        'compliance_check': _run_compliance_check_phase
+    }
+    
     def _validate_accessibility_scenario(self, test_session: Dict[str, Any], 
-                                       success_criteria: Dict[str, Any]) -> Dict[str, Any]:
+                                       success_criteria: Dict[str, Any],
+                                       criteria_weights: Optional[Tuple[float, ...]] = None) -> Dict[str, Any]:
         """Validate accessibility scenario against success criteria"""
-        validation = {
-            'criteria_validated': 0,
-            'criteria_passed': 0,
-            'criteria_failed': 0,
-            'overall_success': True,
-            'detailed_results': {}
-        }
-        
         try:
-            for criterion, requirements in success_criteria.items():
-                criterion_result = {
+            if criteria_weights is None:
+                criteria_weights = (1.0,) * len(success_criteria)
+            
+            detailed_results = {}
+            criteria_passed = 0
+            weighted_total = 0.0
+            
+            for (criterion, requirements), weight in zip(success_criteria.items(), criteria_weights):
+                actual_score = 85  # Placeholder - would extract from actual results
+                passed = actual_score >= requirements['min'] if 'min' in requirements else True
+                
+                detailed_results[criterion] = {
                     'criterion': criterion,
                     'requirements': requirements,
-                    'actual_score': 85,  # Placeholder - would extract from actual results
-                    'passed': True,      # Placeholder
+                    'actual_score': actual_score,
+                    'passed': passed,
                     'details': f'Criterion {criterion} validation completed'
                 }
-                
-                if 'min' in requirements:
-                    criterion_result['passed'] = criterion_result['actual_score'] >= requirements['min']
-                
-                validation['detailed_results'][criterion] = criterion_result
-                validation['criteria_validated'] += 1
-                
-                if criterion_result['passed']:
-                    validation['criteria_passed'] += 1
-                else:
-                    validation['criteria_failed'] += 1
-                    validation['overall_success'] = False
+                criteria_passed += passed
+                weighted_total += actual_score * weight
             
-            return validation
+            criteria_failed = len(detailed_results) - criteria_passed
+            total_weight = sum(criteria_weights)
+            return {
+                'criteria_validated': len(detailed_results),
+                'criteria_passed': criteria_passed,
+                'criteria_failed': criteria_failed,
+                'overall_success': criteria_failed == 0,
+                'weighted_score': weighted_total / total_weight if total_weight else None,
+                'detailed_results': detailed_results
+            }
             
         except Exception as e:
-            self.logger.error(f"Error validating accessibility scenario: {e}")
+            self.logger.error("Error validating accessibility scenario: %s", e)
             return {'error': str(e)}
     
     def _generate_final_assessment(self, test_session: Dict[str, Any], 
@@ -480,45 +573,36 @@ class AccessibilityScenarios:
             'overall_success': test_session.get('validation_results', {}).get('overall_success', False),
             'accessibility_improvement': 27,  # Placeholder percentage improvement
             'wcag_compliance_achieved': scenario.wcag_level,
-            'phases_completed': len(test_session.get('phases', {})),
-            'recommendations': [
-                'Continue monitoring accessibility metrics',
-                'Regular accessibility audits recommended',
-                'Consider advanced inclusive design features'
-            ],
-            'next_steps': [
-                'Implement remaining accessibility improvements',
-                'Schedule follow-up accessibility testing',
-                'Document accessibility guidelines'
-            ]
+            'phases_completed': sum(1 for phase in test_session.get('phases', {}).values()
+                                    if phase.status != 'skipped'),
+            'recommendations': _DEFAULT_RECOMMENDATIONS,
+            'next_steps': _DEFAULT_NEXT_STEPS
         }
     
     def _store_accessibility_scenario_results(self, test_session: Dict[str, Any]):
         """Store comprehensive accessibility scenario results"""
         try:
             if self.db_connection:
+                document = {
+                    key: test_session[key] for key in _STORED_RESULT_FIELDS if key in test_session
+                }
+                # Phase results are dataclasses; the database needs plain dicts
+                document['phases'] = {
+                    phase: asdict(phase_result) for phase, phase_result in document.get('phases', {}).items()
+                }
                 collection = self.db_connection.db.accessibility_scenarios
-                collection.insert_one(test_session)
-                self.logger.info(f"Stored accessibility scenario results: {test_session['scenario_id']}")
+                collection.insert_one(document)
+                self.logger.info("Stored accessibility scenario results: %s", document['scenario_id'])
         except Exception as e:
-            self.logger.error(f"Error storing accessibility scenario results: {e}")
+            self.logger.error("Error storing accessibility scenario results: %s", e)
     
     def get_available_scenarios(self) -> List[Dict[str, Any]]:
-        """Get list of all available accessibility scenarios"""
-        return [
-            {
-                'scenario_id': scenario.scenario_id,
-                'name': scenario.name,
-                'description': scenario.description,
-                'category': scenario.category,
-                'priority': scenario.priority,
-                'wcag_level': scenario.wcag_level,
-                'expected_outcomes': scenario.expected_outcomes,
-                'template_count': len(scenario.template_ids),
-                'testing_phases': scenario.testing_phases
-            }
-            for scenario in self.scenarios.values()
-        ]
+        """
+        Get list of all available accessibility scenarios
+        
+        The summaries are built once and shared, so callers must not modify them.
+        """
+        return _AVAILABLE_SCENARIOS
     
     def get_scenario_recommendations(self, current_accessibility_score: int, 
                                    detected_issues: List[str]) -> List[str]:
@@ -532,30 +616,20 @@ class AccessibilityScenarios:
         Returns:
             List of recommended scenario IDs
         """
-        recommendations = []
+        # Ordered dict keys deduplicate while keeping the first-seen order
+        recommendations = {}
         
         # Score-based recommendations
         if current_accessibility_score < 60:
-            recommendations.append('basic_compliance')
+            recommendations['basic_compliance'] = None
         elif current_accessibility_score < 80:
-            recommendations.append('enhanced_ux')
+            recommendations['enhanced_ux'] = None
         else:
-            recommendations.append('inclusive_design')
+            recommendations['inclusive_design'] = None
         
         # Issue-based recommendations
-        issue_mappings = {
-            'contrast': ['basic_compliance', 'enhanced_ux'],
-            'focus': ['basic_compliance'],
-            'mobile': ['mobile_first'],
-            'cognitive': ['inclusive_design'],
-            'enterprise': ['enterprise_ready']
-        }
-        
         for issue in detected_issues:
-            issue_lower = issue.lower()
-            for category, scenarios in issue_mappings.items():
-                if category in issue_lower:
-                    recommendations.extend(scenarios)
+            for keyword in _ISSUE_KEYWORD_RE.findall(issue.lower()):
+                recommendations.update(dict.fromkeys(_ISSUE_MAPPINGS[keyword]))
         
-        # Remove duplicates and return
-        return list(set(recommendations))
\ No newline at end of file
+        return list(recommendations)
@@ -20,11 +20,15 @@ Provides specific modification patterns and templates for accessibility testing.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import textwrap
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+from autotest.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ModificationTemplate:
     """
     Template for common accessibility modifications
@@ -38,426 +42,521 @@ class ModificationTemplate:
     use_cases: Optional[List[str]] = None
 
 
-class ModificationScenarios:
-    """
-    Predefined modification scenarios for common accessibility improvements
-    """
-    
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self.templates = self._initialize_templates()
-    
-    def _initialize_templates(self) -> Dict[str, ModificationTemplate]:
-        """Initialize modification templates"""
-        templates = {}
-        
-        # Focus Enhancement Templates
-        templates['focus_ring_enhancement'] = ModificationTemplate(
-            template_id='focus_ring_enhancement',
-            name='Focus Ring Enhancement',
-            description='Improve focus indicators for keyboard navigation',
-            category='focus',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'a, button, input, select, textarea, [tabindex]:not([tabindex="-1"])',
-                        'css_changes': {
-                            'outline': '2px solid #4A90E2',
-                            'outline-offset': '2px',
-                            'border-radius': '4px'
-                        }
-                    },
-                    {
-                        'selector': ':focus-visible',
-                        'css_changes': {
-                            'outline': '3px solid #4A90E2',
-                            'outline-offset': '2px',
-                            'box-shadow': '0 0 0 5px rgba(74, 144, 226, 0.3)'
-                        }
+# Global CSS injected by the dark mode and reduced motion templates
+_DARK_MODE_CSS = textwrap.dedent('''
+    :root {
+        --bg-primary: #121212;
+        --bg-secondary: #1e1e1e;
+        --text-primary: #ffffff;
+        --text-secondary: #b3b3b3;
+        --accent-color: #66b3ff;
+        --border-color: #404040;
+    }
+
+    body {
+        background-color: var(--bg-primary);
+        color: var(--text-primary);
+    }
+
+    button, .btn {
+        background-color: var(--accent-color);
+        color: #000000;
+        border: 2px solid var(--accent-color);
+    }
+
+    input, select, textarea {
+        background-color: var(--bg-secondary);
+        color: var(--text-primary);
+        border: 2px solid var(--border-color);
+    }
+''')
+
+_REDUCED_MOTION_CSS = textwrap.dedent('''
+    @media (prefers-reduced-motion: reduce) {
+        *, *::before, *::after {
+            animation-duration: 0.01ms !important;
+            animation-iteration-count: 1 !important;
+            transition-duration: 0.01ms !important;
+            scroll-behavior: auto !important;
+        }
+    }
+
+    .animation-safe {
+        animation: var(--safe-animation, none);
+        transition: var(--safe-transition, none);
+    }
+''')
+
+
+# Keyword arguments for each ModificationTemplate, in presentation order
+_TEMPLATE_SPECS: Tuple[Dict[str, Any], ...] = (
+    # Focus Enhancement Templates
+    dict(
+        template_id='focus_ring_enhancement',
+        name='Focus Ring Enhancement',
+        description='Improve focus indicators for keyboard navigation',
+        category='focus',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'a, button, input, select, textarea, [tabindex]:not([tabindex="-1"])',
+                    'css_changes': {
+                        'outline': '2px solid #4A90E2',
+                        'outline-offset': '2px',
+                        'border-radius': '4px'
                     }
-                ]
-            },
-            js_scenarios=['keyboard_navigation', 'focus_management'],
-            use_cases=[
-                'Improving keyboard navigation visibility',
-                'Meeting WCAG focus indicator requirements',
-                'Enhancing user experience for keyboard users'
-            ]
-        )
-        
-        templates['high_contrast_focus'] = ModificationTemplate(
-            template_id='high_contrast_focus',
-            name='High Contrast Focus Indicators',
-            description='High contrast focus indicators for better visibility',
-            category='focus',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': ':focus',
-                        'css_changes': {
-                            'outline': '4px solid #FFFF00',
-                            'outline-offset': '2px',
-                            'background-color': '#000000',
-                            'color': '#FFFFFF'
-                        }
+                },
+                {
+                    'selector': ':focus-visible',
+                    'css_changes': {
+                        'outline': '3px solid #4A90E2',
+                        'outline-offset': '2px',
+                        'box-shadow': '0 0 0 5px rgba(74, 144, 226, 0.3)'
                     }
-                ]
-            },
-            use_cases=[
-                'Users with low vision',
-                'High contrast mode compatibility',
-                'Extreme visibility requirements'
+                }
             ]
-        )
-        
-        # Color Contrast Templates
-        templates['wcag_aa_contrast'] = ModificationTemplate(
-            template_id='wcag_aa_contrast',
-            name='WCAG AA Contrast Compliance',
-            description='Ensure all text meets WCAG AA contrast requirements',
-            category='contrast',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'body, p, div, span, li, td, th',
-                        'css_changes': {
-                            'color': '#212529',
-                            'background-color': '#ffffff'
-                        }
-                    },
-                    {
-                        'selector': 'button, .btn',
-                        'css_changes': {
-                            'color': '#ffffff',
-                            'background-color': '#0056b3',
-                            'border': '2px solid #004085'
-                        }
-                    },
-                    {
-                        'selector': 'a, .link',
-                        'css_changes': {
-                            'color': '#0056b3',
-                            'text-decoration': 'underline'
-                        }
+        },
+        js_scenarios=['keyboard_navigation', 'focus_management'],
+        use_cases=[
+            'Improving keyboard navigation visibility',
+            'Meeting WCAG focus indicator requirements',
+            'Enhancing user experience for keyboard users'
+        ]
+    ),
+    
+    dict(
+        template_id='high_contrast_focus',
+        name='High Contrast Focus Indicators',
+        description='High contrast focus indicators for better visibility',
+        category='focus',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': ':focus',
+                    'css_changes': {
+                        'outline': '4px solid #FFFF00',
+                        'outline-offset': '2px',
+                        'background-color': '#000000',
+                        'color': '#FFFFFF'
                     }
-                ]
-            },
-            use_cases=[
-                'WCAG 2.1 AA compliance',
-                'General accessibility improvements',
-                'Color blindness accommodation'
-            ]
-        )
-        
-        templates['dark_mode_contrast'] = ModificationTemplate(
-            template_id='dark_mode_contrast',
-            name='Dark Mode High Contrast',
-            description='High contrast dark mode implementation',
-            category='contrast',
-            css_modifications={
-                'global_modifications': {
-                    'css_rules': '''
-                        :root {
-                            --bg-primary: #121212;
-                            --bg-secondary: #1e1e1e;
-                            --text-primary: #ffffff;
-                            --text-secondary: #b3b3b3;
-                            --accent-color: #66b3ff;
-                            --border-color: #404040;
-                        }
-                        
-                        body {
-                            background-color: var(--bg-primary);
-                            color: var(--text-primary);
-                        }
-                        
-                        button, .btn {
-                            background-color: var(--accent-color);
-                            color: #000000;
-                            border: 2px solid var(--accent-color);
-                        }
-                        
-                        input, select, textarea {
-                            background-color: var(--bg-secondary);
-                            color: var(--text-primary);
-                            border: 2px solid var(--border-color);
-                        }
-                    '''
                 }
-            },
-            use_cases=[
-                'Dark mode accessibility',
-                'Reduced eye strain',
-                'High contrast requirements'
             ]
-        )
-        
-        # Touch Target Templates
-        templates['minimum_touch_targets'] = ModificationTemplate(
-            template_id='minimum_touch_targets',
-            name='Minimum Touch Target Sizes',
-            description='Ensure all interactive elements meet minimum touch target requirements',
-            category='touch',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'button, a, input[type="button"], input[type="submit"], [role="button"]',
-                        'css_changes': {
-                            'min-width': '44px',
-                            'min-height': '44px',
-                            'padding': '12px 16px',
-                            'display': 'inline-flex',
-                            'align-items': 'center',
-                            'justify-content': 'center'
-                        }
-                    },
-                    {
-                        'selector': 'input[type="checkbox"], input[type="radio"]',
-                        'css_changes': {
-                            'width': '20px',
-                            'height': '20px',
-                            'margin': '12px'
-                        }
+        },
+        use_cases=[
+            'Users with low vision',
+            'High contrast mode compatibility',
+            'Extreme visibility requirements'
+        ]
+    ),
+    
+    # Color Contrast Templates
+    dict(
+        template_id='wcag_aa_contrast',
+        name='WCAG AA Contrast Compliance',
+        description='Ensure all text meets WCAG AA contrast requirements',
+        category='contrast',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'body, p, div, span, li, td, th',
+                    'css_changes': {
+                        'color': '#212529',
+                        'background-color': '#ffffff'
                     }
-                ]
-            },
-            js_scenarios=['keyboard_navigation'],
-            use_cases=[
-                'Mobile accessibility',
-                'WCAG AAA compliance',
-                'Motor impairment accommodation',
-                'Touch screen optimization'
-            ]
-        )
-        
-        templates['enhanced_touch_targets'] = ModificationTemplate(
-            template_id='enhanced_touch_targets',
-            name='Enhanced Touch Targets',
-            description='Larger touch targets for better accessibility',
-            category='touch',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'button, a, [role="button"]',
-                        'css_changes': {
-                            'min-width': '48px',
-                            'min-height': '48px',
-                            'padding': '16px 20px',
-                            'margin': '4px'
-                        }
+                },
+                {
+                    'selector': 'button, .btn',
+                    'css_changes': {
+                        'color': '#ffffff',
+                        'background-color': '#0056b3',
+                        'border': '2px solid #004085'
                     }
-                ]
-            },
-            use_cases=[
-                'Enhanced mobile experience',
-                'Elderly users',
-                'Motor disability accommodation'
+                },
+                {
+                    'selector': 'a, .link',
+                    'css_changes': {
+                        'color': '#0056b3',
+                        'text-decoration': 'underline'
+                    }
+                }
             ]
-        )
-        
-        # Typography Templates
-        templates['readable_typography'] = ModificationTemplate(
-            template_id='readable_typography',
-            name='Readable Typography',
-            description='Optimize typography for maximum readability',
-            category='typography',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'body, p, div, span, li',
-                        'css_changes': {
-                            'font-family': 'system-ui, -apple-system, "Segoe UI", sans-serif',
-                            'font-size': '18px',
-                            'line-height': '1.6',
-                            'letter-spacing': '0.02em'
-                        }
-                    },
-                    {
-                        'selector': 'h1, h2, h3, h4, h5, h6',
-                        'css_changes': {
-                            'font-family': 'system-ui, -apple-system, "Segoe UI", sans-serif',
-                            'line-height': '1.4',
-                            'margin-bottom': '0.8em'
-                        }
+        },
+        use_cases=[
+            'WCAG 2.1 AA compliance',
+            'General accessibility improvements',
+            'Color blindness accommodation'
+        ]
+    ),
+    
+    dict(
+        template_id='dark_mode_contrast',
+        name='Dark Mode High Contrast',
+        description='High contrast dark mode implementation',
+        category='contrast',
+        css_modifications={
+            'global_modifications': {
+                'css_rules': _DARK_MODE_CSS
+            }
+        },
+        use_cases=[
+            'Dark mode accessibility',
+            'Reduced eye strain',
+            'High contrast requirements'
+        ]
+    ),
+    
+    # Touch Target Templates
+    dict(
+        template_id='minimum_touch_targets',
+        name='Minimum Touch Target Sizes',
+        description='Ensure all interactive elements meet minimum touch target requirements',
+        category='touch',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'button, a, input[type="button"], input[type="submit"], [role="button"]',
+                    'css_changes': {
+                        'min-width': '44px',
+                        'min-height': '44px',
+                        'padding': '12px 16px',
+                        'display': 'inline-flex',
+                        'align-items': 'center',
+                        'justify-content': 'center'
                     }
-                ]
-            },
-            use_cases=[
-                'Dyslexia accommodation',
-                'Low vision support',
-                'General readability improvement',
-                'Cognitive accessibility'
+                },
+                {
+                    'selector': 'input[type="checkbox"], input[type="radio"]',
+                    'css_changes': {
+                        'width': '20px',
+                        'height': '20px',
+                        'margin': '12px'
+                    }
+                }
             ]
-        )
-        
-        templates['dyslexia_friendly'] = ModificationTemplate(
-            template_id='dyslexia_friendly',
-            name='Dyslexia-Friendly Typography',
-            description='Typography optimized for users with dyslexia',
-            category='typography',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'body, p, div, span, li',
-                        'css_changes': {
-                            'font-family': '"OpenDyslexic", "Comic Sans MS", sans-serif',
-                            'font-size': '16px',
-                            'line-height': '1.8',
-                            'letter-spacing': '0.08em',
-                            'word-spacing': '0.16em'
-                        }
+        },
+        js_scenarios=['keyboard_navigation'],
+        use_cases=[
+            'Mobile accessibility',
+            'WCAG AAA compliance',
+            'Motor impairment accommodation',
+            'Touch screen optimization'
+        ]
+    ),
+    
+    dict(
+        template_id='enhanced_touch_targets',
+        name='Enhanced Touch Targets',
+        description='Larger touch targets for better accessibility',
+        category='touch',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'button, a, [role="button"]',
+                    'css_changes': {
+                        'min-width': '48px',
+                        'min-height': '48px',
+                        'padding': '16px 20px',
+                        'margin': '4px'
                     }
-                ]
-            },
-            use_cases=[
-                'Dyslexia support',
-                'Reading difficulties',
-                'Cognitive accessibility'
+                }
             ]
-        )
-        
-        # Form Enhancement Templates
-        templates['accessible_forms'] = ModificationTemplate(
-            template_id='accessible_forms',
-            name='Accessible Form Design',
-            description='Comprehensive form accessibility improvements',
-            category='forms',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'input, select, textarea',
-                        'css_changes': {
-                            'border': '2px solid #6c757d',
-                            'border-radius': '4px',
-                            'padding': '12px 16px',
-                            'font-size': '16px',
-                            'line-height': '1.5',
-                            'background-color': '#ffffff'
-                        }
-                    },
-                    {
-                        'selector': 'input:focus, select:focus, textarea:focus',
-                        'css_changes': {
-                            'border-color': '#4A90E2',
-                            'outline': '2px solid #4A90E2',
-                            'outline-offset': '2px',
-                            'box-shadow': '0 0 0 4px rgba(74, 144, 226, 0.25)'
-                        }
-                    },
-                    {
-                        'selector': 'label',
-                        'css_changes': {
-                            'display': 'block',
-                            'font-weight': '600',
-                            'margin-bottom': '8px',
-                            'color': '#212529'
-                        }
-                    },
-                    {
-                        'selector': '.error, [aria-invalid="true"]',
-                        'css_changes': {
-                            'border-color': '#dc3545',
-                            'background-color': '#fff5f5'
-                        }
-                    },
-                    {
-                        'selector': '.error-message',
-                        'css_changes': {
-                            'color': '#dc3545',
-                            'font-size': '14px',
-                            'margin-top': '4px',
-                            'display': 'block'
-                        }
+        },
+        use_cases=[
+            'Enhanced mobile experience',
+            'Elderly users',
+            'Motor disability accommodation'
+        ]
+    ),
+    
+    # Typography Templates
+    dict(
+        template_id='readable_typography',
+        name='Readable Typography',
+        description='Optimize typography for maximum readability',
+        category='typography',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'body, p, div, span, li',
+                    'css_changes': {
+                        'font-family': 'system-ui, -apple-system, "Segoe UI", sans-serif',
+                        'font-size': '18px',
+                        'line-height': '1.6',
+                        'letter-spacing': '0.02em'
                     }
-                ]
-            },
-            js_scenarios=['form_interactions', 'error_handling'],
-            use_cases=[
-                'Form accessibility compliance',
-                'Error message accessibility',
-                'Screen reader compatibility',
-                'Keyboard navigation in forms'
+                },
+                {
+                    'selector': 'h1, h2, h3, h4, h5, h6',
+                    'css_changes': {
+                        'font-family': 'system-ui, -apple-system, "Segoe UI", sans-serif',
+                        'line-height': '1.4',
+                        'margin-bottom': '0.8em'
+                    }
+                }
             ]
-        )
-        
-        # Motion and Animation Templates
-        templates['reduced_motion'] = ModificationTemplate(
-            template_id='reduced_motion',
-            name='Reduced Motion Implementation',
-            description='Respect user preferences for reduced motion',
-            category='motion',
-            css_modifications={
-                'global_modifications': {
-                    'css_rules': '''
-                        @media (prefers-reduced-motion: reduce) {
-                            *, *::before, *::after {
-                                animation-duration: 0.01ms !important;
-                                animation-iteration-count: 1 !important;
-                                transition-duration: 0.01ms !important;
-                                scroll-behavior: auto !important;
-                            }
-                        }
-                        
-                        .animation-safe {
-                            animation: var(--safe-animation, none);
-                            transition: var(--safe-transition, none);
-                        }
-                    '''
+        },
+        use_cases=[
+            'Dyslexia accommodation',
+            'Low vision support',
+            'General readability improvement',
+            'Cognitive accessibility'
+        ]
+    ),
+    
+    dict(
+        template_id='dyslexia_friendly',
+        name='Dyslexia-Friendly Typography',
+        description='Typography optimized for users with dyslexia',
+        category='typography',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'body, p, div, span, li',
+                    'css_changes': {
+                        'font-family': '"OpenDyslexic", "Comic Sans MS", sans-serif',
+                        'font-size': '16px',
+                        'line-height': '1.8',
+                        'letter-spacing': '0.08em',
+                        'word-spacing': '0.16em'
+                    }
                 }
-            },
-            use_cases=[
-                'Vestibular disorder accommodation',
-                'Motion sensitivity',
-                'WCAG AAA compliance',
-                'User preference respect'
             ]
-        )
-        
-        # Layout and Responsive Templates
-        templates['responsive_accessibility'] = ModificationTemplate(
-            template_id='responsive_accessibility',
-            name='Responsive Accessibility',
-            description='Ensure accessibility across all device sizes',
-            category='responsive',
-            css_modifications={
-                'responsive_modifications': {
-                    'viewports': [
-                        {'width': 320, 'height': 568, 'name': 'mobile'},
-                        {'width': 768, 'height': 1024, 'name': 'tablet'},
-                        {'width': 1440, 'height': 900, 'name': 'desktop'}
-                    ],
+        },
+        use_cases=[
+            'Dyslexia support',
+            'Reading difficulties',
+            'Cognitive accessibility'
+        ]
+    ),
+    
+    # Form Enhancement Templates
+    dict(
+        template_id='accessible_forms',
+        name='Accessible Form Design',
+        description='Comprehensive form accessibility improvements',
+        category='forms',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'input, select, textarea',
+                    'css_changes': {
+                        'border': '2px solid #6c757d',
+                        'border-radius': '4px',
+                        'padding': '12px 16px',
+                        'font-size': '16px',
+                        'line-height': '1.5',
+                        'background-color': '#ffffff'
+                    }
+                },
+                {
+                    'selector': 'input:focus, select:focus, textarea:focus',
                     'css_changes': {
-                        'font-size': 'clamp(16px, 4vw, 20px)',
-                        'line-height': 'clamp(1.4, 1.6, 1.8)',
-                        'padding': 'clamp(8px, 2vw, 24px)',
-                        'margin': 'clamp(4px, 1vw, 16px)',
-                        'min-width': '320px',
-                        'max-width': '100%'
+                        'border-color': '#4A90E2',
+                        'outline': '2px solid #4A90E2',
+                        'outline-offset': '2px',
+                        'box-shadow': '0 0 0 4px rgba(74, 144, 226, 0.25)'
+                    }
+                },
+                {
+                    'selector': 'label',
+                    'css_changes': {
+                        'display': 'block',
+                        'font-weight': '600',
+                        'margin-bottom': '8px',
+                        'color': '#212529'
+                    }
+                },
+                {
+                    'selector': '.error, [aria-invalid="true"]',
+                    'css_changes': {
+                        'border-color': '#dc3545',
+                        'background-color': '#fff5f5'
+                    }
+                },
+                {
+                    'selector': '.error-message',
+                    'css_changes': {
+                        'color': '#dc3545',
+                        'font-size': '14px',
+                        'margin-top': '4px',
+                        'display': 'block'
                     }
                 }
-            },
-            js_scenarios=['keyboard_navigation'],
-            use_cases=[
-                'Mobile accessibility',
-                'Content reflow compliance',
-                'Cross-device consistency',
-                'Responsive design accessibility'
             ]
-        )
-        
-        return templates
+        },
+        js_scenarios=['form_interactions', 'error_handling'],
+        use_cases=[
+            'Form accessibility compliance',
+            'Error message accessibility',
+            'Screen reader compatibility',
+            'Keyboard navigation in forms'
+        ]
+    ),
+    
+    # Motion and Animation Templates
+    dict(
+        template_id='reduced_motion',
+        name='Reduced Motion Implementation',
+        description='Respect user preferences for reduced motion',
+        category='motion',
+        css_modifications={
+            'global_modifications': {
+                'css_rules': _REDUCED_MOTION_CSS
+            }
+        },
+        use_cases=[
+            'Vestibular disorder accommodation',
+            'Motion sensitivity',
+            'WCAG AAA compliance',
+            'User preference respect'
+        ]
+    ),
+    
+    # Layout and Responsive Templates
+    dict(
+        template_id='responsive_accessibility',
+        name='Responsive Accessibility',
+        description='Ensure accessibility across all device sizes',
+        category='responsive',
+        css_modifications={
+            'responsive_modifications': {
+                'viewports': [
+                    {'width': 320, 'height': 568, 'name': 'mobile'},
+                    {'width': 768, 'height': 1024, 'name': 'tablet'},
+                    {'width': 1440, 'height': 900, 'name': 'desktop'}
+                ],
+                'css_changes': {
+                    'font-size': 'clamp(16px, 4vw, 20px)',
+                    'line-height': 'clamp(1.4, 1.6, 1.8)',
+                    'padding': 'clamp(8px, 2vw, 24px)',
+                    'margin': 'clamp(4px, 1vw, 16px)',
+                    'min-width': '320px',
+                    'max-width': '100%'
+                }
+            }
+        },
+        js_scenarios=['keyboard_navigation'],
+        use_cases=[
+            'Mobile accessibility',
+            'Content reflow compliance',
+            'Cross-device consistency',
+            'Responsive design accessibility'
+        ]
+    )
+)
+
+
+# Template definitions are static, so every ModificationScenarios instance shares one copy
+_TEMPLATES: Dict[str, ModificationTemplate] = {
+    spec['template_id']: ModificationTemplate(**spec) for spec in _TEMPLATE_SPECS
+}
+
+_ALL_TEMPLATES: Tuple[ModificationTemplate, ...] = tuple(_TEMPLATES.values())
+
+# Category lookup, built in the same order as _TEMPLATES
+_BY_CATEGORY: Dict[str, Tuple[ModificationTemplate, ...]] = {}
+for _template in _ALL_TEMPLATES:
+    _BY_CATEGORY[_template.category] = _BY_CATEGORY.get(_template.category, ()) + (_template,)
+del _template
+
+# Template metadata served by get_template_metadata
+_TEMPLATE_METADATA: Dict[str, Any] = {
+    'total_templates': len(_TEMPLATES),
+    'categories': {category: len(templates) for category, templates in _BY_CATEGORY.items()},
+    'template_list': [
+        {
+            'template_id': template.template_id,
+            'name': template.name,
+            'description': template.description,
+            'category': template.category,
+            'use_cases': template.use_cases or []
+        }
+        for template in _ALL_TEMPLATES
+    ]
+}
+
+# Issue keywords mapped to the templates that address them
+_ISSUE_MAPPINGS: Dict[str, Tuple[str, ...]] = {
+    'focus': ('focus_ring_enhancement', 'high_contrast_focus'),
+    'contrast': ('wcag_aa_contrast', 'dark_mode_contrast'),
+    'touch': ('minimum_touch_targets', 'enhanced_touch_targets'),
+    'typography': ('readable_typography', 'dyslexia_friendly'),
+    'forms': ('accessible_forms',),
+    'motion': ('reduced_motion',),
+    'responsive': ('responsive_accessibility',)
+}
+
+
+@lru_cache(maxsize=128)
+def _combine_template_parts(template_ids: Tuple[str, ...]) -> Tuple[tuple, str, tuple, tuple]:
+    """
+    Merge the modifications of the given templates, in order
+    
+    Templates never change, so the merge is cached per template ID sequence. Returns
+    element modifications, joined global CSS rules, JS scenarios and use cases, the
+    last two without duplicates.
+    """
+    element_modifications = []
+    css_rules_parts = []
+    js_test_scenarios = []
+    use_cases = []
+    
+    for template_id in template_ids:
+        template = _TEMPLATES.get(template_id)
+        if template:
+            # Combine CSS modifications
+            if template.css_modifications:
+                if 'element_modifications' in template.css_modifications:
+                    element_modifications.extend(template.css_modifications['element_modifications'])
+                
+                if 'global_modifications' in template.css_modifications:
+                    css_rules_parts.append(template.css_modifications['global_modifications'].get('css_rules', ''))
+            
+            # Combine JS scenarios
+            if template.js_scenarios:
+                js_test_scenarios.extend(template.js_scenarios)
+            
+            # Combine use cases
+            if template.use_cases:
+                use_cases.extend(template.use_cases)
+    
+    # Remove duplicates, keeping first-seen order
+    return (tuple(element_modifications), ''.join(css_rules_parts),
+            tuple(dict.fromkeys(js_test_scenarios)), tuple(dict.fromkeys(use_cases)))
+
+
+@lru_cache(maxsize=256)
+def _recommend_templates(issues: FrozenSet[str]) -> Tuple[str, ...]:
+    """Template IDs recommended for a set of lower-cased issue descriptions"""
+    # Ordered dict keys deduplicate while keeping _ISSUE_MAPPINGS order
+    recommendations = {}
+    for category, templates in _ISSUE_MAPPINGS.items():
+        if any(category in issue for issue in issues):
+            recommendations.update(dict.fromkeys(templates))
+    return tuple(recommendations)
+
+
+class ModificationScenarios:
+    """
+    Predefined modification scenarios for common accessibility improvements
+    """
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # Templates are shared, not rebuilt per instance
+        self.templates = _TEMPLATES
     
     def get_template(self, template_id: str) -> Optional[ModificationTemplate]:
         """Get a specific modification template"""
         return self.templates.get(template_id)
     
-    def get_templates_by_category(self, category: str) -> List[ModificationTemplate]:
+    def get_templates_by_category(self, category: str) -> Sequence[ModificationTemplate]:
         """Get templates by category"""
-        return [template for template in self.templates.values() if template.category == category]
+        return _BY_CATEGORY.get(category, ())
     
-    def get_all_templates(self) -> List[ModificationTemplate]:
+    def get_all_templates(self) -> Sequence[ModificationTemplate]:
         """Get all available templates"""
-        return list(self.templates.values())
+        return _ALL_TEMPLATES
     
     def create_custom_scenario(self, name: str, description: str, 
                              css_modifications: Dict[str, Any] = None,
@@ -499,49 +598,23 @@ class ModificationScenarios:
         Returns:
             Combined scenario configuration
         """
-        combined_scenario = {
+        element_modifications, css_rules, js_test_scenarios, use_cases = \
+            _combine_template_parts(tuple(template_ids))
+        
+        return {
             'scenario_id': f"combined_{'_'.join(template_ids)}",
             'name': f"Combined: {', '.join(template_ids)}",
             'description': 'Combined accessibility improvements from multiple templates',
             'category': 'combined',
             'priority': 'high',
             'css_modifications': {
-                'element_modifications': [],
-                'global_modifications': {'css_rules': ''}
+                'element_modifications': list(element_modifications),
+                'global_modifications': {'css_rules': css_rules}
             },
-            'js_test_scenarios': [],
+            'js_test_scenarios': list(js_test_scenarios),
             'expected_improvements': [],
-            'use_cases': []
+            'use_cases': list(use_cases)
         }
-        
-        # Combine modifications from all templates
-        for template_id in template_ids:
-            template = self.get_template(template_id)
-            if template:
-                # Combine CSS modifications
-                if template.css_modifications:
-                    if 'element_modifications' in template.css_modifications:
-                        combined_scenario['css_modifications']['element_modifications'].extend(
-                            template.css_modifications['element_modifications']
-                        )
-                    
-                    if 'global_modifications' in template.css_modifications:
-                        combined_scenario['css_modifications']['global_modifications']['css_rules'] += \
-                            template.css_modifications['global_modifications'].get('css_rules', '')
-                
-                # Combine JS scenarios
-                if template.js_scenarios:
-                    combined_scenario['js_test_scenarios'].extend(template.js_scenarios)
-                
-                # Combine use cases
-                if template.use_cases:
-                    combined_scenario['use_cases'].extend(template.use_cases)
-        
-        # Remove duplicates
-        combined_scenario['js_test_scenarios'] = list(set(combined_scenario['js_test_scenarios']))
-        combined_scenario['use_cases'] = list(set(combined_scenario['use_cases']))
-        
-        return combined_scenario
     
     def get_recommended_templates(self, accessibility_issues: List[str]) -> List[str]:
         """
@@ -553,49 +626,12 @@ class ModificationScenarios:
         Returns:
             List of recommended template IDs
         """
-        recommendations = []
-        
-        issue_mappings = {
-            'focus': ['focus_ring_enhancement', 'high_contrast_focus'],
-            'contrast': ['wcag_aa_contrast', 'dark_mode_contrast'],
-            'touch': ['minimum_touch_targets', 'enhanced_touch_targets'],
-            'typography': ['readable_typography', 'dyslexia_friendly'],
-            'forms': ['accessible_forms'],
-            'motion': ['reduced_motion'],
-            'responsive': ['responsive_accessibility']
-        }
-        
-        for issue in accessibility_issues:
-            issue_lower = issue.lower()
-            for category, templates in issue_mappings.items():
-                if category in issue_lower:
-                    recommendations.extend(templates)
-        
-        # Remove duplicates and return
-        return list(set(recommendations))
+        return list(_recommend_templates(frozenset(issue.lower() for issue in accessibility_issues)))
     
     def get_template_metadata(self) -> Dict[str, Any]:
-        """Get metadata about all available templates"""
-        metadata = {
-            'total_templates': len(self.templates),
-            'categories': {},
-            'template_list': []
-        }
-        
-        # Count templates by category
-        for template in self.templates.values():
-            category = template.category
-            if category not in metadata['categories']:
-                metadata['categories'][category] = 0
-            metadata['categories'][category] += 1
-            
-            # Add template info
-            metadata['template_list'].append({
-                'template_id': template.template_id,
-                'name': template.name,
-                'description': template.description,
-                'category': template.category,
-                'use_cases': template.use_cases or []
-            })
+        """
+        Get metadata about all available templates
         
-        return metadata
\ No newline at end of file
+        The metadata is built once and shared, so callers must not modify it.
+        """
+        return _TEMPLATE_METADATA
@@ -19,18 +19,23 @@ Scenario Manager for AutoTest
 Manages and orchestrates comprehensive page modification testing scenarios.
 """
 
-import json
+import copy
 import logging
+import queue
+import time
 import uuid
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
+
+from autotest.utils.compat import DATACLASS_SLOTS
 
 from ..css import CSSAnalyzer, CSSModificationTester
 from ..javascript import JavaScriptAnalyzer, JSDynamicTester
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TestScenario:
     """
     Test scenario definition combining CSS and JavaScript modifications
@@ -45,331 +50,319 @@ class TestScenario:
     expected_improvements: Optional[List[str]] = None
     validation_criteria: Optional[Dict[str, Any]] = None
     wcag_compliance: Optional[str] = None
+    # (criterion, requirements, required minimum or None), in validation_criteria order
+    compiled_criteria: Tuple[Tuple[str, Dict[str, Any], Optional[float]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        # Frozen, so derived fields are set through object.__setattr__
+        object.__setattr__(self, 'compiled_criteria', tuple(
+            (criterion, requirements, requirements.get('min'))
+            for criterion, requirements in (self.validation_criteria or {}).items()
+        ))
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Dictionary form of the scenario definition, like asdict() but without derived fields"""
+        return {f.name: copy.deepcopy(getattr(self, f.name)) for f in fields(self) if f.init}
 
 
-class ScenarioManager:
-    """
-    Comprehensive page modification testing scenario manager.
-    Combines CSS and JavaScript testing for complete accessibility scenarios.
-    """
+def _build_scenarios() -> Dict[str, TestScenario]:
+    """Build the static page modification testing scenarios"""
+    scenarios = {}
     
-    def __init__(self, driver, db_connection=None):
-        """
-        Initialize scenario manager
-        
-        Args:
-            driver: Selenium WebDriver instance
-            db_connection: Optional database connection for storing results
-        """
-        self.driver = driver
-        self.db_connection = db_connection
-        self.logger = logging.getLogger(__name__)
-        
-        # Initialize testing components
-        self.css_analyzer = CSSAnalyzer(driver)
-        self.css_modifier = CSSModificationTester(driver, db_connection)
-        self.js_analyzer = JavaScriptAnalyzer(driver)
-        self.js_dynamic_tester = JSDynamicTester(driver, db_connection)
-        
-        # Load predefined scenarios
-        self.scenarios = self._initialize_scenarios()
+    # Keyboard Accessibility Enhancement Scenario
+    scenarios['keyboard_enhancement'] = TestScenario(
+        scenario_id='keyboard_enhancement',
+        name='Keyboard Accessibility Enhancement',
+        description='Comprehensive keyboard accessibility improvements across CSS and JavaScript',
+        category='interaction',
+        priority='high',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'button, [role="button"], a, input, select, textarea',
+                    'css_changes': {
+                        'outline': '2px solid #007acc',
+                        'outline-offset': '2px',
+                        'min-width': '44px',
+                        'min-height': '44px'
+                    }
+                },
+                {
+                    'selector': ':focus',
+                    'css_changes': {
+                        'outline': '2px solid #007acc',
+                        'outline-offset': '2px',
+                        'box-shadow': '0 0 0 4px rgba(0, 122, 204, 0.3)'
+                    }
+                }
+            ]
+        },
+        js_test_scenarios=['keyboard_navigation', 'focus_management', 'custom_controls'],
+        expected_improvements=[
+            'All interactive elements have visible focus indicators',
+            'Minimum touch target sizes met (44x44px)',
+            'Keyboard navigation works throughout interface',
+            'Focus management properly implemented'
+        ],
+        validation_criteria={
+            'focus_visibility_score': {'min': 90},
+            'keyboard_accessibility_rate': {'min': 95},
+            'touch_target_compliance': {'min': 100}
+        },
+        wcag_compliance='2.1 AA'
+    )
     
-    def _initialize_scenarios(self) -> Dict[str, TestScenario]:
-        """Initialize comprehensive testing scenarios"""
-        scenarios = {}
-        
-        # Keyboard Accessibility Enhancement Scenario
-        scenarios['keyboard_enhancement'] = TestScenario(
-            scenario_id='keyboard_enhancement',
-            name='Keyboard Accessibility Enhancement',
-            description='Comprehensive keyboard accessibility improvements across CSS and JavaScript',
-            category='interaction',
-            priority='high',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'button, [role="button"], a, input, select, textarea',
-                        'css_changes': {
-                            'outline': '2px solid #007acc',
-                            'outline-offset': '2px',
-                            'min-width': '44px',
-                            'min-height': '44px'
-                        }
-                    },
-                    {
-                        'selector': ':focus',
-                        'css_changes': {
-                            'outline': '2px solid #007acc',
-                            'outline-offset': '2px',
-                            'box-shadow': '0 0 0 4px rgba(0, 122, 204, 0.3)'
+    # Color Contrast Enhancement Scenario
+    scenarios['contrast_enhancement'] = TestScenario(
+        scenario_id='contrast_enhancement',
+        name='Color Contrast Enhancement',
+        description='Comprehensive color contrast improvements for accessibility',
+        category='visual',
+        priority='high',
+        css_modifications={
+            'accessibility_improvements': [
+                {
+                    'type': 'contrast_enhancement',
+                    'selectors': ['button', 'a', '.btn', '.link', 'input', 'select'],
+                    'adjustments': {
+                        'high_contrast': {
+                            'color': '#000000',
+                            'background-color': '#ffffff',
+                            'border': '2px solid #333333'
+                        },
+                        'dark_theme': {
+                            'color': '#ffffff',
+                            'background-color': '#1a1a1a',
+                            'border': '2px solid #666666'
+                        },
+                        'enhanced_contrast': {
+                            'color': '#003366',
+                            'background-color': '#f0f8ff',
+                            'border': '1px solid #0066cc'
                         }
                     }
-                ]
-            },
-            js_test_scenarios=['keyboard_navigation', 'focus_management', 'custom_controls'],
-            expected_improvements=[
-                'All interactive elements have visible focus indicators',
-                'Minimum touch target sizes met (44x44px)',
-                'Keyboard navigation works throughout interface',
-                'Focus management properly implemented'
-            ],
-            validation_criteria={
-                'focus_visibility_score': {'min': 90},
-                'keyboard_accessibility_rate': {'min': 95},
-                'touch_target_compliance': {'min': 100}
-            },
-            wcag_compliance='2.1 AA'
-        )
-        
-        # Color Contrast Enhancement Scenario
-        scenarios['contrast_enhancement'] = TestScenario(
-            scenario_id='contrast_enhancement',
-            name='Color Contrast Enhancement',
-            description='Comprehensive color contrast improvements for accessibility',
-            category='visual',
-            priority='high',
-            css_modifications={
-                'accessibility_improvements': [
-                    {
-                        'type': 'contrast_enhancement',
-                        'selectors': ['button', 'a', '.btn', '.link', 'input', 'select'],
-                        'adjustments': {
-                            'high_contrast': {
-                                'color': '#000000',
-                                'background-color': '#ffffff',
-                                'border': '2px solid #333333'
-                            },
-                            'dark_theme': {
-                                'color': '#ffffff',
-                                'background-color': '#1a1a1a',
-                                'border': '2px solid #666666'
-                            },
-                            'enhanced_contrast': {
-                                'color': '#003366',
-                                'background-color': '#f0f8ff',
-                                'border': '1px solid #0066cc'
-                            }
-                        }
+                }
+            ]
+        },
+        js_test_scenarios=['dynamic_content', 'loading_states'],
+        expected_improvements=[
+            'All text meets WCAG AA contrast ratios (4.5:1 minimum)',
+            'Interactive elements have sufficient contrast',
+            'Dynamic content maintains contrast requirements',
+            'Loading states are visually accessible'
+        ],
+        validation_criteria={
+            'contrast_compliance_rate': {'min': 100},
+            'color_accessibility_score': {'min': 85}
+        },
+        wcag_compliance='2.1 AA'
+    )
+    
+    # Form Accessibility Enhancement Scenario
+    scenarios['form_enhancement'] = TestScenario(
+        scenario_id='form_enhancement',
+        name='Form Accessibility Enhancement',
+        description='Complete form accessibility improvements including validation and error handling',
+        category='forms',
+        priority='high',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': 'input, select, textarea',
+                    'css_changes': {
+                        'border': '2px solid #ccc',
+                        'padding': '8px 12px',
+                        'font-size': '16px',
+                        'line-height': '1.5'
                     }
-                ]
-            },
-            js_test_scenarios=['dynamic_content', 'loading_states'],
-            expected_improvements=[
-                'All text meets WCAG AA contrast ratios (4.5:1 minimum)',
-                'Interactive elements have sufficient contrast',
-                'Dynamic content maintains contrast requirements',
-                'Loading states are visually accessible'
-            ],
-            validation_criteria={
-                'contrast_compliance_rate': {'min': 100},
-                'color_accessibility_score': {'min': 85}
-            },
-            wcag_compliance='2.1 AA'
-        )
-        
-        # Form Accessibility Enhancement Scenario
-        scenarios['form_enhancement'] = TestScenario(
-            scenario_id='form_enhancement',
-            name='Form Accessibility Enhancement',
-            description='Complete form accessibility improvements including validation and error handling',
-            category='forms',
-            priority='high',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': 'input, select, textarea',
-                        'css_changes': {
-                            'border': '2px solid #ccc',
-                            'padding': '8px 12px',
-                            'font-size': '16px',
-                            'line-height': '1.5'
-                        }
-                    },
-                    {
-                        'selector': 'input:focus, select:focus, textarea:focus',
-                        'css_changes': {
-                            'border-color': '#007acc',
-                            'outline': '2px solid #007acc',
-                            'outline-offset': '2px'
-                        }
-                    },
-                    {
-                        'selector': '.error',
-                        'css_changes': {
-                            'color': '#d63031',
-                            'background-color': '#fff5f5',
-                            'border': '1px solid #fab1a0',
-                            'padding': '8px',
-                            'border-radius': '4px'
-                        }
+                },
+                {
+                    'selector': 'input:focus, select:focus, textarea:focus',
+                    'css_changes': {
+                        'border-color': '#007acc',
+                        'outline': '2px solid #007acc',
+                        'outline-offset': '2px'
                     }
-                ]
-            },
-            js_test_scenarios=['form_interactions', 'error_handling', 'dynamic_content'],
-            expected_improvements=[
-                'All form fields have proper labels',
-                'Error messages are announced to screen readers',
-                'Form validation is keyboard accessible',
-                'Required fields are clearly indicated'
-            ],
-            validation_criteria={
-                'form_accessibility_score': {'min': 90},
-                'error_announcement_rate': {'min': 100},
-                'label_association_rate': {'min': 100}
-            },
-            wcag_compliance='2.1 AA'
-        )
-        
-        # Modal Dialog Enhancement Scenario
-        scenarios['modal_enhancement'] = TestScenario(
-            scenario_id='modal_enhancement',
-            name='Modal Dialog Enhancement',
-            description='Complete modal dialog accessibility including focus trapping and ARIA implementation',
-            category='interaction',
-            priority='high',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': '[role="dialog"], .modal',
-                        'css_changes': {
-                            'border': '3px solid #007acc',
-                            'box-shadow': '0 10px 30px rgba(0, 0, 0, 0.3)',
-                            'background-color': '#ffffff',
-                            'padding': '24px'
-                        }
-                    },
-                    {
-                        'selector': '.modal-backdrop, .overlay',
-                        'css_changes': {
-                            'background-color': 'rgba(0, 0, 0, 0.7)',
-                            'backdrop-filter': 'blur(2px)'
-                        }
+                },
+                {
+                    'selector': '.error',
+                    'css_changes': {
+                        'color': '#d63031',
+                        'background-color': '#fff5f5',
+                        'border': '1px solid #fab1a0',
+                        'padding': '8px',
+                        'border-radius': '4px'
                     }
-                ]
-            },
-            js_test_scenarios=['modal_behavior', 'focus_management', 'keyboard_navigation'],
-            expected_improvements=[
-                'Focus is trapped within modal',
-                'Focus returns to trigger element on close',
-                'Modal can be closed with Escape key',
-                'Proper ARIA attributes are set'
-            ],
-            validation_criteria={
-                'modal_accessibility_score': {'min': 95},
-                'focus_trap_compliance': {'min': 100},
-                'keyboard_control_rate': {'min': 100}
-            },
-            wcag_compliance='2.1 AA'
-        )
-        
-        # Responsive Design Enhancement Scenario
-        scenarios['responsive_enhancement'] = TestScenario(
-            scenario_id='responsive_enhancement',
-            name='Responsive Design Enhancement',
-            description='Accessibility improvements across different viewport sizes',
-            category='layout',
-            priority='medium',
-            css_modifications={
-                'responsive_modifications': {
-                    'viewports': [
-                        {'width': 320, 'height': 568, 'name': 'mobile'},
-                        {'width': 768, 'height': 1024, 'name': 'tablet'},
-                        {'width': 1440, 'height': 900, 'name': 'desktop'}
-                    ],
+                }
+            ]
+        },
+        js_test_scenarios=['form_interactions', 'error_handling', 'dynamic_content'],
+        expected_improvements=[
+            'All form fields have proper labels',
+            'Error messages are announced to screen readers',
+            'Form validation is keyboard accessible',
+            'Required fields are clearly indicated'
+        ],
+        validation_criteria={
+            'form_accessibility_score': {'min': 90},
+            'error_announcement_rate': {'min': 100},
+            'label_association_rate': {'min': 100}
+        },
+        wcag_compliance='2.1 AA'
+    )
+    
+    # Modal Dialog Enhancement Scenario
+    scenarios['modal_enhancement'] = TestScenario(
+        scenario_id='modal_enhancement',
+        name='Modal Dialog Enhancement',
+        description='Complete modal dialog accessibility including focus trapping and ARIA implementation',
+        category='interaction',
+        priority='high',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': '[role="dialog"], .modal',
                     'css_changes': {
-                        'font-size': 'clamp(16px, 4vw, 20px)',
-                        'line-height': '1.6',
-                        'padding': 'clamp(8px, 2vw, 16px)',
-                        'margin': 'clamp(4px, 1vw, 8px)'
+                        'border': '3px solid #007acc',
+                        'box-shadow': '0 10px 30px rgba(0, 0, 0, 0.3)',
+                        'background-color': '#ffffff',
+                        'padding': '24px'
+                    }
+                },
+                {
+                    'selector': '.modal-backdrop, .overlay',
+                    'css_changes': {
+                        'background-color': 'rgba(0, 0, 0, 0.7)',
+                        'backdrop-filter': 'blur(2px)'
                     }
                 }
-            },
-            js_test_scenarios=['keyboard_navigation', 'dynamic_content'],
-            expected_improvements=[
-                'Content reflows properly at 320px width',
-                'Text remains readable at all sizes',
-                'Interactive elements maintain minimum sizes',
-                'Keyboard navigation works across viewports'
-            ],
-            validation_criteria={
-                'responsive_score': {'min': 85},
-                'content_reflow_compliance': {'min': 100},
-                'minimum_size_compliance': {'min': 95}
-            },
-            wcag_compliance='2.1 AA'
-        )
-        
-        # Motion and Animation Safety Scenario
-        scenarios['motion_safety'] = TestScenario(
-            scenario_id='motion_safety',
-            name='Motion and Animation Safety',
-            description='Ensure animations respect user preferences and accessibility needs',
-            category='motion',
-            priority='medium',
-            css_modifications={
-                'accessibility_improvements': [
-                    {
-                        'type': 'motion_reduction',
-                        'reductions': {
-                            'respect_preference': {
-                                'animation': 'var(--animation, none)',
-                                'transition': 'var(--transition, none)',
-                                'transform': 'var(--transform, none)'
-                            },
-                            'reduce_motion': {
-                                'animation-duration': '0.01s',
-                                'transition-duration': '0.01s'
-                            },
-                            'disable_animations': {
-                                'animation': 'none',
-                                'transition': 'none'
-                            }
+            ]
+        },
+        js_test_scenarios=['modal_behavior', 'focus_management', 'keyboard_navigation'],
+        expected_improvements=[
+            'Focus is trapped within modal',
+            'Focus returns to trigger element on close',
+            'Modal can be closed with Escape key',
+            'Proper ARIA attributes are set'
+        ],
+        validation_criteria={
+            'modal_accessibility_score': {'min': 95},
+            'focus_trap_compliance': {'min': 100},
+            'keyboard_control_rate': {'min': 100}
+        },
+        wcag_compliance='2.1 AA'
+    )
+    
+    # Responsive Design Enhancement Scenario
+    scenarios['responsive_enhancement'] = TestScenario(
+        scenario_id='responsive_enhancement',
+        name='Responsive Design Enhancement',
+        description='Accessibility improvements across different viewport sizes',
+        category='layout',
+        priority='medium',
+        css_modifications={
+            'responsive_modifications': {
+                'viewports': [
+                    {'width': 320, 'height': 568, 'name': 'mobile'},
+                    {'width': 768, 'height': 1024, 'name': 'tablet'},
+                    {'width': 1440, 'height': 900, 'name': 'desktop'}
+                ],
+                'css_changes': {
+                    'font-size': 'clamp(16px, 4vw, 20px)',
+                    'line-height': '1.6',
+                    'padding': 'clamp(8px, 2vw, 16px)',
+                    'margin': 'clamp(4px, 1vw, 8px)'
+                }
+            }
+        },
+        js_test_scenarios=['keyboard_navigation', 'dynamic_content'],
+        expected_improvements=[
+            'Content reflows properly at 320px width',
+            'Text remains readable at all sizes',
+            'Interactive elements maintain minimum sizes',
+            'Keyboard navigation works across viewports'
+        ],
+        validation_criteria={
+            'responsive_score': {'min': 85},
+            'content_reflow_compliance': {'min': 100},
+            'minimum_size_compliance': {'min': 95}
+        },
+        wcag_compliance='2.1 AA'
+    )
+    
+    # Motion and Animation Safety Scenario
+    scenarios['motion_safety'] = TestScenario(
+        scenario_id='motion_safety',
+        name='Motion and Animation Safety',
+        description='Ensure animations respect user preferences and accessibility needs',
+        category='motion',
+        priority='medium',
+        css_modifications={
+            'accessibility_improvements': [
+                {
+                    'type': 'motion_reduction',
+                    'reductions': {
+                        'respect_preference': {
+                            'animation': 'var(--animation, none)',
+                            'transition': 'var(--transition, none)',
+                            'transform': 'var(--transform, none)'
+                        },
+                        'reduce_motion': {
+                            'animation-duration': '0.01s',
+                            'transition-duration': '0.01s'
+                        },
+                        'disable_animations': {
+                            'animation': 'none',
+                            'transition': 'none'
                         }
                     }
-                ]
-            },
-            js_test_scenarios=['loading_states', 'dynamic_content'],
-            expected_improvements=[
-                'Animations respect prefers-reduced-motion',
-                'No infinite animations without user control',
-                'Motion effects do not trigger vestibular disorders',
-                'Loading animations are accessible'
-            ],
-            validation_criteria={
-                'motion_safety_score': {'min': 90},
-                'reduced_motion_compliance': {'min': 100}
-            },
-            wcag_compliance='2.1 AAA'
-        )
-        
-        # Complete Accessibility Overhaul Scenario
-        scenarios['complete_overhaul'] = TestScenario(
-            scenario_id='complete_overhaul',
-            name='Complete Accessibility Overhaul',
-            description='Comprehensive accessibility improvements across all categories',
-            category='comprehensive',
-            priority='high',
-            css_modifications={
-                'element_modifications': [
-                    {
-                        'selector': '*',
-                        'css_changes': {
-                            'font-family': 'system-ui, -apple-system, sans-serif',
-                            'line-height': '1.6'
-                        }
-                    },
-                    {
-                        'selector': 'button, [role="button"], a, input, select, textarea',
-                        'css_changes': {
-                            'min-width': '44px',
-                            'min-height': '44px',
-                            'outline': '2px solid #007acc',
-                            'outline-offset': '2px'
-                        }
+                }
+            ]
+        },
+        js_test_scenarios=['loading_states', 'dynamic_content'],
+        expected_improvements=[
+            'Animations respect prefers-reduced-motion',
+            'No infinite animations without user control',
+            'Motion effects do not trigger vestibular disorders',
+            'Loading animations are accessible'
+        ],
+        validation_criteria={
+            'motion_safety_score': {'min': 90},
+            'reduced_motion_compliance': {'min': 100}
+        },
+        wcag_compliance='2.1 AAA'
+    )
+    
+    # Complete Accessibility Overhaul Scenario
+    scenarios['complete_overhaul'] = TestScenario(
+        scenario_id='complete_overhaul',
+        name='Complete Accessibility Overhaul',
+        description='Comprehensive accessibility improvements across all categories',
+        category='comprehensive',
+        priority='high',
+        css_modifications={
+            'element_modifications': [
+                {
+                    'selector': '*',
+                    'css_changes': {
+                        'font-family': 'system-ui, -apple-system, sans-serif',
+                        'line-height': '1.6'
                     }
-                ],
-                'global_modifications': {
-                    'css_rules': '''
+                },
+                {
+                    'selector': 'button, [role="button"], a, input, select, textarea',
+                    'css_changes': {
+                        'min-width': '44px',
+                        'min-height': '44px',
+                        'outline': '2px solid #007acc',
+                        'outline-offset': '2px'
+                    }
+                }
+            ],
+            'global_modifications': {
+                'css_rules': '''
                         :root {
                             --primary-color: #003366;
                             --primary-bg: #ffffff;
@@ -398,26 +391,72 @@ class ScenarioManager:
                             border: 0;
                         }
                     '''
-                }
-            },
-            js_test_scenarios=['keyboard_navigation', 'focus_management', 'modal_behavior', 'form_interactions', 'dynamic_content'],
-            expected_improvements=[
-                'Complete WCAG 2.1 AA compliance',
-                'All interactive elements are keyboard accessible',
-                'Proper focus management throughout',
-                'Accessible forms with error handling',
-                'Motion safety implemented'
-            ],
-            validation_criteria={
-                'overall_accessibility_score': {'min': 95},
-                'wcag_compliance_rate': {'min': 100},
-                'keyboard_accessibility_rate': {'min': 100},
-                'contrast_compliance_rate': {'min': 100}
-            },
-            wcag_compliance='2.1 AA'
-        )
+            }
+        },
+        js_test_scenarios=['keyboard_navigation', 'focus_management', 'modal_behavior', 'form_interactions', 'dynamic_content'],
+        expected_improvements=[
+            'Complete WCAG 2.1 AA compliance',
+            'All interactive elements are keyboard accessible',
+            'Proper focus management throughout',
+            'Accessible forms with error handling',
+            'Motion safety implemented'
+        ],
+        validation_criteria={
+            'overall_accessibility_score': {'min': 95},
+            'wcag_compliance_rate': {'min': 100},
+            'keyboard_accessibility_rate': {'min': 100},
+            'contrast_compliance_rate': {'min': 100}
+        },
+        wcag_compliance='2.1 AA'
+    )
+    
+    return scenarios
+
+
+# Scenario definitions are static, so every ScenarioManager shares one copy
+_SCENARIOS = _build_scenarios()
+
+# Category and priority lookups, built in the same order as _SCENARIOS
+_BY_CATEGORY: Dict[str, List[TestScenario]] = {}
+_BY_PRIORITY: Dict[str, List[TestScenario]] = {}
+for _scenario in _SCENARIOS.values():
+    _BY_CATEGORY.setdefault(_scenario.category, []).append(_scenario)
+    _BY_PRIORITY.setdefault(_scenario.priority, []).append(_scenario)
+del _scenario
+
+
+class ScenarioManager:
+    """
+    Comprehensive page modification testing scenario manager.
+    Combines CSS and JavaScript testing for complete accessibility scenarios.
+    """
+    
+    def __init__(self, driver, db_connection=None, driver_pool: Optional[List[Any]] = None):
+        """
+        Initialize scenario manager
+        
+        Args:
+            driver: Selenium WebDriver instance
+            db_connection: Optional database connection for storing results
+            driver_pool: Optional extra WebDriver sessions (e.g. Selenium Grid nodes)
+                used to run batches of scenarios in parallel
+        """
+        self.driver = driver
+        self.db_connection = db_connection
+        self.logger = logging.getLogger(__name__)
+        self.driver_pool = list(driver_pool or [])
+        self._pool_managers: List['ScenarioManager'] = []
+        # Baseline analysis per page_id while run_multiple_scenarios runs a batch, else None
+        self._baseline_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        
+        # Initialize testing components
+        self.css_analyzer = CSSAnalyzer(driver)
+        self.css_modifier = CSSModificationTester(driver, db_connection)
+        self.js_analyzer = JavaScriptAnalyzer(driver)
+        self.js_dynamic_tester = JSDynamicTester(driver, db_connection)
         
-        return scenarios
+        # Predefined scenarios are shared, not rebuilt per instance
+        self.scenarios = _SCENARIOS
     
     def get_scenario(self, scenario_id: str) -> Optional[TestScenario]:
         """Get a specific test scenario"""
@@ -425,11 +464,11 @@ class ScenarioManager:
     
     def get_scenarios_by_category(self, category: str) -> List[TestScenario]:
         """Get scenarios by category"""
-        return [scenario for scenario in self.scenarios.values() if scenario.category == category]
+        return list(_BY_CATEGORY.get(category, ()))
     
     def get_scenarios_by_priority(self, priority: str) -> List[TestScenario]:
         """Get scenarios by priority"""
-        return [scenario for scenario in self.scenarios.values() if scenario.priority == priority]
+        return list(_BY_PRIORITY.get(priority, ()))
     
     def run_scenario(self, scenario_id: str, page_id: str) -> Dict[str, Any]:
         """
@@ -447,12 +486,13 @@ class ScenarioManager:
             if not scenario:
                 return {'error': f'Scenario not found: {scenario_id}'}
             
+            started = time.perf_counter()
             test_session = {
                 'test_id': str(uuid.uuid4()),
                 'scenario_id': scenario_id,
                 'page_id': page_id,
                 'start_time': datetime.now(),
-                'scenario_info': asdict(scenario),
+                'scenario_info': scenario.as_dict(),
                 'results': {},
                 'validation': {},
                 'summary': {}
@@ -461,7 +501,7 @@ class ScenarioManager:
             self.logger.info(f"Running scenario: {scenario.name} on page {page_id}")
             
             # Run baseline analysis
-            test_session['baseline'] = self._get_baseline_analysis()
+            test_session['baseline'] = self._get_baseline_analysis(page_id)
             
             # Run CSS modifications if specified
             if scenario.css_modifications:
@@ -480,13 +520,13 @@ class ScenarioManager:
             if scenario.validation_criteria:
                 test_session['validation'] = self._validate_scenario_results(
                     test_session['results'], 
-                    scenario.validation_criteria
+                    scenario.compiled_criteria
                 )
             
             # Generate comprehensive summary
             test_session['summary'] = self._generate_scenario_summary(test_session)
             test_session['end_time'] = datetime.now()
-            test_session['duration'] = (test_session['end_time'] - test_session['start_time']).total_seconds()
+            test_session['duration'] = time.perf_counter() - started
             
             # Store results if database available
             if self.db_connection:
@@ -510,6 +550,8 @@ class ScenarioManager:
             Combined results from all scenarios
         """
         try:
+            started = time.perf_counter()
+            self._baseline_cache = {}
             batch_session = {
                 'batch_id': str(uuid.uuid4()),
                 'page_id': page_id,
@@ -519,34 +561,91 @@ class ScenarioManager:
                 'batch_summary': {}
             }
             
-            for scenario_id in scenario_ids:
-                try:
-                    scenario_result = self.run_scenario(scenario_id, page_id)
-                    batch_session['scenario_results'][scenario_id] = scenario_result
-                    
-                    # Add delay between scenarios to allow page to reset
-                    if len(scenario_ids) > 1:
-                        self.driver.refresh()
-                        import time
-                        time.sleep(2)
+            if self.driver_pool and len(scenario_ids) > 1:
+                batch_session['scenario_results'] = self._run_scenarios_in_parallel(scenario_ids, page_id)
+            else:
+                for scenario_id in scenario_ids:
+                    try:
+                        scenario_result = self.run_scenario(scenario_id, page_id)
+                        batch_session['scenario_results'][scenario_id] = scenario_result
                         
-                except Exception as e:
-                    self.logger.error(f"Error in batch scenario {scenario_id}: {e}")
-                    batch_session['scenario_results'][scenario_id] = {'error': str(e)}
+                        # Add delay between scenarios to allow page to reset
+                        if len(scenario_ids) > 1:
+                            self.driver.refresh()
+                            time.sleep(2)
+                            
+                    except Exception as e:
+                        self.logger.error(f"Error in batch scenario {scenario_id}: {e}")
+                        batch_session['scenario_results'][scenario_id] = {'error': str(e)}
             
             # Generate batch summary
             batch_session['batch_summary'] = self._generate_batch_summary(batch_session['scenario_results'])
             batch_session['end_time'] = datetime.now()
-            batch_session['total_duration'] = (batch_session['end_time'] - batch_session['start_time']).total_seconds()
+            batch_session['total_duration'] = time.perf_counter() - started
             
             return batch_session
             
         except Exception as e:
             self.logger.error(f"Error running batch scenarios: {e}")
             return {'error': str(e)}
+        finally:
+            self._baseline_cache = None
     
-    def _get_baseline_analysis(self) -> Dict[str, Any]:
-        """Get baseline accessibility analysis before modifications"""
+    def _run_scenarios_in_parallel(self, scenario_ids: List[str], page_id: str) -> Dict[str, Any]:
+        """
+        Run scenarios concurrently, one per WebDriver session
+        
+        Each session is driven by its own manager, so no WebDriver is shared between
+        threads. Pool sessions first load the page the main driver is on; a session
+        that has already run a scenario is refreshed before its next one.
+        """
+        if len(self._pool_managers) != len(self.driver_pool):
+            self._pool_managers = [ScenarioManager(driver, self.db_connection) for driver in self.driver_pool]
+        
+        page_url = self.driver.current_url
+        
+        # (manager, needs_reset, on_page) for each idle WebDriver session
+        available = queue.Queue()
+        available.put((self, False, True))
+        for manager in self._pool_managers:
+            available.put((manager, False, False))
+        
+        def run(scenario_id: str) -> Dict[str, Any]:
+            manager, needs_reset, on_page = available.get()
+            try:
+                if not on_page:
+                    manager.driver.get(page_url)
+                elif needs_reset:
+                    manager.driver.refresh()
+                return manager.run_scenario(scenario_id, page_id)
+            except Exception as e:
+                self.logger.error(f"Error in batch scenario {scenario_id}: {e}")
+                return {'error': str(e)}
+            finally:
+                available.put((manager, True, True))
+        
+        for manager in self._pool_managers:
+            manager._baseline_cache = {}
+        
+        try:
+            max_workers = min(available.qsize(), len(scenario_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(scenario_ids, executor.map(run, scenario_ids)))
+        finally:
+            for manager in self._pool_managers:
+                manager._baseline_cache = None
+    
+    def _get_baseline_analysis(self, page_id: str) -> Dict[str, Any]:
+        """
+        Get baseline accessibility analysis before modifications
+        
+        Within a batch the page is reloaded between scenarios, so every scenario sees the
+        same unmodified page; the analysis is taken once per page_id and later scenarios
+        get their own copy of it.
+        """
+        if self._baseline_cache is not None and page_id in self._baseline_cache:
+            return copy.deepcopy(self._baseline_cache[page_id])
+        
         try:
             baseline = {
                 'css_analysis': {},
@@ -560,6 +659,9 @@ class ScenarioManager:
             # Get JavaScript baseline
             baseline['js_analysis'] = self.js_analyzer.analyze_page_javascript()
             
+            if self._baseline_cache is not None:
+                self._baseline_cache[page_id] = baseline
+            
             return baseline
             
         except Exception as e:
@@ -587,8 +689,9 @@ class ScenarioManager:
             self.logger.error(f"Error getting post-modification analysis: {e}")
             return {'error': str(e)}
     
-    def _validate_scenario_results(self, results: Dict[str, Any], criteria: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate scenario results against specified criteria"""
+    def _validate_scenario_results(self, results: Dict[str, Any],
+                                   criteria: Tuple[Tuple[str, Dict[str, Any], Optional[float]], ...]) -> Dict[str, Any]:
+        """Validate scenario results against a scenario's compiled_criteria"""
         validation = {
             'passed': 0,
             'failed': 0,
@@ -597,7 +700,7 @@ class ScenarioManager:
         }
         
         try:
-            for criterion, requirements in criteria.items():
+            for criterion, requirements, minimum in criteria:
                 criterion_result = {
                     'criterion': criterion,
                     'requirements': requirements,
@@ -608,12 +711,12 @@ class ScenarioManager:
                 
                 # Extract actual value from results (simplified logic)
                 # In a full implementation, this would have sophisticated result parsing
-                if 'min' in requirements:
+                if minimum is not None:
                     # Mock validation - in real implementation, would extract actual scores
                     mock_score = 85  # Placeholder
                     criterion_result['actual_value'] = mock_score
-                    criterion_result['passed'] = mock_score >= requirements['min']
-                    criterion_result['message'] = f"Score: {mock_score}, Required: {requirements['min']}"
+                    criterion_result['passed'] = mock_score >= minimum
+                    criterion_result['message'] = f"Score: {mock_score}, Required: {minimum}"
                 
                 validation['criteria_results'][criterion] = criterion_result
                 
@@ -688,9 +791,11 @@ class ScenarioManager:
             'failed_scenarios': 0,
             'scenario_summaries': {},
             'overall_success_rate': 0,
-            'categories_tested': set(),
+            'categories_tested': [],
             'total_improvements': 0
         }
+        # Categories in the order first tested; dict keys keep that order where a set would not
+        categories_tested: Dict[str, None] = {}
         
         try:
             for scenario_id, result in scenario_results.items():
@@ -706,10 +811,9 @@ class ScenarioManager:
                     # Track categories
                     category = scenario_summary.get('category')
                     if category:
-                        batch_summary['categories_tested'].add(category)
+                        categories_tested[category] = None
             
-            # Convert set to list for JSON serialization
-            batch_summary['categories_tested'] = list(batch_summary['categories_tested'])
+            batch_summary['categories_tested'] = list(categories_tested)
             
             # Calculate success rate
             if batch_summary['total_scenarios'] > 0:
@@ -18,13 +18,19 @@
 Proper unit tests for AutoTest accessibility testing modules based on actual implementations
 """
 
+import json
+import os
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from selenium import webdriver
 
 # Import actual accessibility modules
 from autotest.testing.rules.wcag_rules import WCAGRules
-from autotest.testing.rules.rule_engine import RuleEngine, RuleDefinition, RuleConfiguration
+from autotest.testing.rules import rule_engine
+from autotest.testing.rules.rule_engine import (
+    CUSTOM_RULES_MANIFEST, RuleEngine, RuleDefinition, RuleConfiguration
+)
 from autotest.testing.css.css_rules import CSSAccessibilityRules
 from autotest.testing.javascript.js_accessibility_checker import JSAccessibilityChecker
 
@@ -147,6 +153,222 @@ class TestWCAGRules:
         # Test same color (minimum contrast)
         ratio = wcag._calculate_contrast_ratio((128, 128, 128), (128, 128, 128))
         assert ratio == 1.0
+    
+    def test_parse_font_size(self):
+        """Test font size parsing, including missing values"""
+        mock_driver = Mock(spec=webdriver.Chrome)
+        wcag = WCAGRules(mock_driver)
+        
+        assert wcag._parse_font_size("18px") == 18.0
+        assert wcag._parse_font_size("") == 16.0
+        assert wcag._parse_font_size(None) == 16.0
+    
+    def test_evaluate_keyboard_element_without_class(self):
+        """Test that a focused element with no class and no focus indicator is a violation"""
+        mock_driver = Mock(spec=webdriver.Chrome)
+        wcag = WCAGRules(mock_driver)
+        
+        scan = {
+            'count': 1,
+            'focused': [{
+                'tagName': 'a',
+                'outerHTML': '<a href="#">Link</a>',
+                'className': None,
+                'outline': 'none',
+                'outlineWidth': '0px',
+                'boxShadow': 'none'
+            }]
+        }
+        
+        result = wcag._evaluate_keyboard(scan)
+        
+        assert result['status'] == 'violation'
+        assert len(result['nodes']) == 1
+        assert result['nodes'][0]['target'] == ['a']
+
+
+class TestWCAGScanEvaluation:
+    """Test cases for building WCAG test results from in-browser page scans"""
+    
+    @pytest.fixture
+    def wcag(self):
+        return WCAGRules(Mock(spec=webdriver.Chrome))
+    
+    def test_evaluate_contrast(self, wcag):
+        """Test contrast evaluation against normal and large text thresholds"""
+        text_elements = [
+            {'tagName': 'p', 'outerHTML': '<p>Dark</p>', 'color': 'rgb(0, 0, 0)',
+             'backgroundColor': 'rgb(255, 255, 255)', 'fontSize': '16px', 'fontWeight': '400'},
+            {'tagName': 'span', 'outerHTML': '<span>Light</span>', 'color': 'rgb(120, 120, 120)',
+             'backgroundColor': 'rgb(255, 255, 255)', 'fontSize': '16px', 'fontWeight': '400'},
+            {'tagName': 'h1', 'outerHTML': '<h1>Heading</h1>', 'color': 'rgb(120, 120, 120)',
+             'backgroundColor': 'rgb(255, 255, 255)', 'fontSize': '24px', 'fontWeight': '700'}
+        ]
+        
+        result = wcag._evaluate_contrast(text_elements)
+        
+        assert result['status'] == 'violation'
+        assert [node['target'] for node in result['nodes']] == [['span']]
+        assert result['nodes'][0]['data']['required_ratio'] == 4.5
+    
+    def test_evaluate_contrast_without_text(self, wcag):
+        """Test contrast evaluation when the scan found no text elements"""
+        result = wcag._evaluate_contrast([])
+        
+        assert result['status'] == 'incomplete'
+    
+    def test_evaluate_keyboard(self, wcag):
+        """Test keyboard evaluation of focus indicators"""
+        scan = {
+            'count': 2,
+            'focused': [
+                {'tagName': 'button', 'outerHTML': '<button>Save</button>', 'className': '',
+                 'outline': 'rgb(0, 0, 255) solid 2px', 'outlineWidth': '2px', 'boxShadow': 'none'},
+                {'tagName': 'a', 'outerHTML': '<a class="focus-ring">Home</a>', 'className': 'focus-ring',
+                 'outline': 'none', 'outlineWidth': '0px', 'boxShadow': 'none'}
+            ]
+        }
+        
+        result = wcag._evaluate_keyboard(scan)
+        
+        assert result['status'] == 'pass'
+        assert len(result['nodes']) == 2
+    
+    def test_evaluate_keyboard_without_focusable_elements(self, wcag):
+        """Test keyboard evaluation when the page has nothing focusable"""
+        result = wcag._evaluate_keyboard({'count': 0, 'focused': []})
+        
+        assert result['status'] == 'pass'
+        assert result['nodes'][0]['html'] == 'No focusable elements found'
+    
+    def test_evaluate_aria(self, wcag):
+        """Test ARIA evaluation of labels, roles and accessible names"""
+        def record(tag_name, **values):
+            element = {'tagName': tag_name, 'outerHTML': f'<{tag_name}>', 'ariaLabel': None,
+                       'ariaLabelledby': None, 'role': None, 'type': None,
+                       'hasLabel': False, 'hasText': False}
+            element.update(values)
+            return element
+        
+        interactive_elements = [
+            record('input', type='text', ariaLabel='Search'),
+            record('input', type='email'),
+            record('div', role='fancy-button', hasText=True),
+            record('button'),
+            record('a', hasText=True)
+        ]
+        
+        result = wcag._evaluate_aria(interactive_elements)
+        
+        assert result['status'] == 'violation'
+        assert [node['data'] for node in result['nodes']] == [
+            {'missing': 'label or aria-label'},
+            {'invalid_role': 'fancy-button'},
+            {'missing': 'accessible name'}
+        ]
+    
+    def test_evaluate_landmarks(self, wcag):
+        """Test landmark evaluation of main and repeated navigation regions"""
+        scan = {
+            'mainCount': 1,
+            'mainHTML': '<main>',
+            'navHTML': '<nav>',
+            'repeated': [
+                {'tagName': 'nav', 'outerHTML': '<nav aria-label="Primary">', 'role': 'navigation',
+                 'ariaLabel': 'Primary', 'ariaLabelledby': None},
+                {'tagName': 'nav', 'outerHTML': '<nav>', 'role': 'navigation',
+                 'ariaLabel': None, 'ariaLabelledby': None}
+            ]
+        }
+        
+        result = wcag._evaluate_landmarks(scan)
+        
+        assert result['status'] == 'violation'
+        assert result['nodes'] == [{
+            'target': ['nav'],
+            'html': '<nav>',
+            'data': {'missing_label_for_multiple': 'navigation'}
+        }]
+    
+    def test_evaluate_landmarks_missing_main(self, wcag):
+        """Test landmark evaluation of a page without a main landmark"""
+        scan = {'mainCount': 0, 'mainHTML': None, 'navHTML': None, 'repeated': []}
+        
+        result = wcag._evaluate_landmarks(scan)
+        
+        assert result['status'] == 'violation'
+        assert result['nodes'][0]['data'] == {'missing_landmark': 'main'}
+    
+    def test_evaluate_tables(self, wcag):
+        """Test table evaluation of headers, scopes and descriptions"""
+        def record(**values):
+            table = {'outerHTML': '<table>', 'headerCount': 2, 'missingScopeCount': 0,
+                     'hasThead': True, 'hasCaption': False, 'rowCount': 3,
+                     'summary': None, 'ariaLabel': None, 'ariaLabelledby': None}
+            table.update(values)
+            return table
+        
+        tables = [
+            record(),
+            record(headerCount=0, hasThead=False),
+            record(rowCount=10),
+            record(missingScopeCount=2)
+        ]
+        
+        result = wcag._evaluate_tables(tables)
+        
+        assert result['status'] == 'violation'
+        assert [node['data'] for node in result['nodes']] == [
+            {'missing': 'table headers'},
+            {'missing': 'table caption or description'},
+            {'header_issues': ['Missing scope attribute', 'Missing scope attribute']}
+        ]
+    
+    def test_evaluate_media(self, wcag):
+        """Test media evaluation of captions and embedded content titles"""
+        media = {
+            'videos': [
+                {'tagName': 'video', 'outerHTML': '<video>', 'title': None, 'ariaLabel': None,
+                 'hasCaptions': False}
+            ],
+            'audios': [],
+            'embedded': [
+                {'tagName': 'iframe', 'outerHTML': '<iframe title="Map">', 'title': 'Map',
+                 'ariaLabel': None}
+            ]
+        }
+        
+        result = wcag._evaluate_media(media)
+        
+        assert result['status'] == 'violation'
+        assert result['nodes'][0]['data'] == {'missing': 'captions or subtitles'}
+    
+    def test_evaluate_media_without_media(self, wcag):
+        """Test media evaluation when the page has no media"""
+        result = wcag._evaluate_media({'videos': [], 'audios': [], 'embedded': []})
+        
+        assert result['status'] == 'pass'
+        assert result['nodes'][0]['html'] == 'No multimedia content found'
+    
+    def test_run_all_tests_reports_failed_scans(self, wcag):
+        """Test that a failed scan is reported as incomplete without affecting the others"""
+        wcag.driver.execute_script.return_value = [
+            {'value': []},
+            {'value': []},
+            {'error': 'TypeError: boom'},
+            {'value': []},
+            {'value': {'videos': [], 'audios': [], 'embedded': []}},
+            {'value': {'count': 0, 'focused': []}}
+        ]
+        
+        results = wcag.run_all_tests()
+        
+        wcag.driver.execute_script.assert_called_once()
+        assert results['test_landmark_regions']['status'] == 'incomplete'
+        assert 'TypeError: boom' in results['test_landmark_regions']['reason']
+        assert results['test_color_contrast_advanced']['status'] == 'incomplete'
+        assert results['test_table_accessibility']['status'] == 'pass'
+        assert results['test_keyboard_navigation']['status'] == 'pass'
 
 
 class TestRuleEngine:
@@ -227,6 +449,138 @@ class TestRuleEngine:
         assert moderate_rules[0].rule_id == "moderate_rule"
 
 
+class TestCustomRulesManifest:
+    """Test cases for loading custom rules through the consolidated manifest"""
+    
+    @pytest.fixture
+    def rules_dir(self, tmp_path, monkeypatch):
+        """Custom rules directory holding two rule files, with no saved rule configurations"""
+        rules_dir = tmp_path / 'custom'
+        rules_dir.mkdir()
+        monkeypatch.setattr(RuleEngine, '_CUSTOM_RULES_DIR', rules_dir)
+        monkeypatch.setattr(RuleEngine, '_RULE_CONFIG_FILE', tmp_path / 'rule_config.json')
+        
+        for rule_id in ('custom-one', 'custom-two'):
+            self._write_rule(rules_dir, rule_id, f'Rule {rule_id}')
+        return rules_dir
+    
+    @staticmethod
+    def _write_rule(rules_dir, rule_id, name):
+        (rules_dir / f'{rule_id}.json').write_text(json.dumps({
+            'rule_id': rule_id,
+            'name': name,
+            'description': 'A custom rule',
+            'help_text': 'Fix it',
+            'impact': 'moderate'
+        }))
+    
+    @staticmethod
+    def _engine():
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: default
+        return RuleEngine(config)
+    
+    def test_first_load_writes_manifest(self, rules_dir):
+        """Test that loading the rule files writes a manifest of them"""
+        engine = self._engine()
+        
+        assert engine.get_rule_by_id('custom-one').name == 'Rule custom-one'
+        
+        manifest = json.loads((rules_dir / CUSTOM_RULES_MANIFEST).read_text())
+        assert sorted(manifest['files']) == ['custom-one.json', 'custom-two.json']
+        assert sorted(rule['rule_id'] for rule in manifest['rules']) == ['custom-one', 'custom-two']
+    
+    def test_current_manifest_skips_rule_files(self, rules_dir):
+        """Test that a current manifest is used instead of reading each rule file"""
+        self._engine().get_rule_by_id('custom-one')
+        
+        with patch('autotest.testing.rules.rule_engine._read_json_file',
+                   wraps=rule_engine._read_json_file) as read_json_file:
+            engine = self._engine()
+            assert engine.get_rule_by_id('custom-two').name == 'Rule custom-two'
+        
+        read_files = [call.args[0].name for call in read_json_file.call_args_list]
+        assert read_files == [CUSTOM_RULES_MANIFEST]
+    
+    def test_changed_rule_file_invalidates_manifest(self, rules_dir):
+        """Test that editing, adding or removing a rule file bypasses the stale manifest"""
+        self._engine().get_rule_by_id('custom-one')
+        
+        self._write_rule(rules_dir, 'custom-one', 'Renamed rule')
+        # Make sure the edit is seen even on filesystems with coarse timestamps
+        stat = os.stat(rules_dir / 'custom-one.json')
+        os.utime(rules_dir / 'custom-one.json', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self._write_rule(rules_dir, 'custom-three', 'Rule custom-three')
+        (rules_dir / 'custom-two.json').unlink()
+        
+        engine = self._engine()
+        
+        assert engine.get_rule_by_id('custom-one').name == 'Renamed rule'
+        assert engine.get_rule_by_id('custom-three') is not None
+        assert engine.get_rule_by_id('custom-two') is None
+        
+        manifest = json.loads((rules_dir / CUSTOM_RULES_MANIFEST).read_text())
+        assert sorted(manifest['files']) == ['custom-one.json', 'custom-three.json']
+    
+    @staticmethod
+    def _rule_definition(rule_id):
+        return {
+            'rule_id': rule_id,
+            'name': f'Rule {rule_id}',
+            'description': 'A custom rule',
+            'help_text': 'Fix it',
+            'impact': 'minor'
+        }
+    
+    def test_created_rule_is_loaded_after_manifest_rebuild(self, rules_dir):
+        """Test that creating a custom rule drops the manifest, which the next load rebuilds"""
+        engine = self._engine()
+        assert engine.create_custom_rule(self._rule_definition('custom-new'))
+        
+        assert not (rules_dir / CUSTOM_RULES_MANIFEST).exists()
+        assert self._engine().get_rule_by_id('custom-new') is not None
+        
+        with patch('autotest.testing.rules.rule_engine._read_json_file',
+                   wraps=rule_engine._read_json_file) as read_json_file:
+            reloaded = self._engine()
+            assert reloaded.get_rule_by_id('custom-new').name == 'Rule custom-new'
+        
+        read_files = [call.args[0].name for call in read_json_file.call_args_list]
+        assert read_files == [CUSTOM_RULES_MANIFEST]
+    
+    def test_engines_sharing_a_directory_keep_each_others_rules(self, rules_dir):
+        """Test that rules created by one engine survive another engine's changes"""
+        engine_a = self._engine()
+        engine_a.get_rule_by_id('custom-one')
+        engine_b = self._engine()
+        
+        assert engine_b.create_custom_rule(self._rule_definition('rule-b'))
+        assert engine_a.create_custom_rule(self._rule_definition('rule-a'))
+        
+        for _ in range(2):
+            engine = self._engine()
+            assert engine.get_rule_by_id('rule-a') is not None
+            assert engine.get_rule_by_id('rule-b') is not None
+            assert engine.get_rule_by_id('custom-one') is not None
+        
+        assert engine_b.delete_custom_rule('custom-two')
+        assert self._engine().get_rule_by_id('custom-two') is None
+    
+    def test_unreadable_rule_file_is_not_hidden_by_manifest(self, rules_dir):
+        """Test that a rule file that fails to parse is retried and reported on every load"""
+        (rules_dir / 'broken.json').write_text('{not json')
+        
+        self._engine().get_rule_by_id('custom-one')
+        manifest = json.loads((rules_dir / CUSTOM_RULES_MANIFEST).read_text())
+        assert 'broken.json' not in manifest['files']
+        
+        engine = self._engine()
+        with patch.object(engine.logger, 'warning') as warning:
+            assert engine.get_rule_by_id('custom-one') is not None
+        
+        assert any('broken.json' in str(call.args) for call in warning.call_args_list)
+
+
 class TestRuleDefinition:
     """Test cases for Rule Definition"""
     
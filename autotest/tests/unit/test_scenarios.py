@@ -0,0 +1,134 @@
+# AutoTest - Accessibility Testing Platform
+# Copyright (C) 2025 Bob Dodd
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Unit tests for AutoTest page modification testing scenarios
+"""
+
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+from selenium import webdriver
+
+# Import actual scenario modules
+from autotest.testing.scenarios import ScenarioManager, AccessibilityScenarios
+from autotest.testing.scenarios.accessibility_scenarios import PhaseResult
+
+
+def _mock_scenario_manager(driver=None):
+    """Create a scenario manager whose CSS and JavaScript testers are mocked"""
+    manager = ScenarioManager(driver or Mock(spec=webdriver.Chrome))
+    manager.css_analyzer = Mock()
+    manager.css_analyzer.get_stylesheet_rules.return_value = {}
+    manager.js_analyzer = Mock()
+    manager.js_analyzer.analyze_page_javascript.return_value = {}
+    manager.css_modifier = Mock()
+    manager.css_modifier.test_css_changes.return_value = {'results': {}}
+    manager.js_dynamic_tester = Mock()
+    manager.js_dynamic_tester.run_dynamic_tests.return_value = {'summary': {}}
+    return manager
+
+
+class TestScenarioManager:
+    """Test cases for Scenario Manager"""
+    
+    def test_run_scenario_info_is_per_session(self):
+        """Test that editing one run's scenario_info does not affect other runs"""
+        manager = _mock_scenario_manager()
+        
+        first = manager.run_scenario('keyboard_enhancement', 'page_1')
+        second = manager.run_scenario('keyboard_enhancement', 'page_1')
+        
+        assert first['scenario_info'] is not second['scenario_info']
+        
+        first['scenario_info']['name'] = 'Edited'
+        first['scenario_info']['expected_improvements'].append('Edited')
+        
+        assert second['scenario_info']['name'] == 'Keyboard Accessibility Enhancement'
+        assert 'Edited' not in second['scenario_info']['expected_improvements']
+        assert 'Edited' not in manager.get_scenario('keyboard_enhancement').as_dict()['expected_improvements']
+    
+    def test_batch_takes_baseline_once(self):
+        """Test that scenarios in a batch share one baseline analysis, and later runs do not"""
+        manager = _mock_scenario_manager()
+        scenario_ids = ['keyboard_enhancement', 'contrast_enhancement', 'form_enhancement']
+        
+        with patch('autotest.testing.scenarios.scenario_manager.time.sleep'):
+            batch = manager.run_multiple_scenarios(scenario_ids, 'page_1')
+        
+        # One baseline plus one post-modification analysis per scenario
+        assert manager.css_analyzer.get_stylesheet_rules.call_count == len(scenario_ids) + 1
+        assert manager.js_analyzer.analyze_page_javascript.call_count == len(scenario_ids) + 1
+        results = batch['scenario_results']
+        assert results['keyboard_enhancement']['baseline'] is not results['contrast_enhancement']['baseline']
+        
+        manager.css_analyzer.get_stylesheet_rules.reset_mock()
+        manager.run_scenario('keyboard_enhancement', 'page_1')
+        manager.run_scenario('keyboard_enhancement', 'page_1')
+        
+        assert manager.css_analyzer.get_stylesheet_rules.call_count == 4
+    
+    def test_parallel_batch_keeps_scenario_order(self):
+        """Test that a batch run across a driver pool returns results in scenario_ids order"""
+        main_driver = Mock(spec=webdriver.Chrome)
+        main_driver.current_url = 'https://example.com/page'
+        pool = [Mock(spec=webdriver.Chrome), Mock(spec=webdriver.Chrome)]
+        manager = ScenarioManager(main_driver, driver_pool=pool)
+        
+        scenario_ids = [
+            'keyboard_enhancement', 'contrast_enhancement', 'form_enhancement',
+            'modal_enhancement', 'responsive_enhancement', 'motion_safety'
+        ]
+        
+        def run_scenario(self, scenario_id, page_id):
+            # Earlier scenarios take longer, so they finish out of order
+            time.sleep(0.01 * (len(scenario_ids) - scenario_ids.index(scenario_id)))
+            return {'scenario_id': scenario_id, 'driver': self.driver, 'summary': {}}
+        
+        with patch.object(ScenarioManager, 'run_scenario', autospec=True, side_effect=run_scenario):
+            batch = manager.run_multiple_scenarios(scenario_ids, 'page_1')
+        
+        results = batch['scenario_results']
+        assert list(results) == scenario_ids
+        assert all(results[scenario_id]['scenario_id'] == scenario_id for scenario_id in scenario_ids)
+        # Every WebDriver session in the pool, plus the manager's own, ran scenarios
+        assert len({id(result['driver']) for result in results.values()}) == len(pool) + 1
+        for driver in pool:
+            driver.get.assert_called_once_with('https://example.com/page')
+        assert batch['batch_summary']['successful_scenarios'] == len(scenario_ids)
+
+
+class TestAccessibilityScenarios:
+    """Test cases for Accessibility Scenarios"""
+    
+    def test_store_results(self):
+        """Test that stored results are written immediately, with phases as plain dicts"""
+        mock_driver = Mock(spec=webdriver.Chrome)
+        mock_db = Mock()
+        scenarios = AccessibilityScenarios(mock_driver, mock_db)
+        
+        scenarios._store_accessibility_scenario_results({
+            'scenario_id': 'first',
+            'page_id': 'page_1',
+            'scenario_info': {'name': 'Not stored'},
+            'phases': {'baseline': PhaseResult(phase='baseline', status='skipped')}
+        })
+        
+        mock_db.db.accessibility_scenarios.insert_one.assert_called_once()
+        document = mock_db.db.accessibility_scenarios.insert_one.call_args.args[0]
+        assert document['scenario_id'] == 'first'
+        assert 'scenario_info' not in document
+        assert document['phases']['baseline']['status'] == 'skipped'
@@ -0,0 +1,62 @@
+# AutoTest - Accessibility Testing Platform
+# Copyright (C) 2025 Bob Dodd
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Unit tests for AutoTest violation severity scoring
+"""
+
+from autotest.models.test_result import AccessibilityViolation, TestResult
+from autotest.testing.reporters.severity_manager import SeverityManager
+
+
+def _violations(impact, count):
+    return [
+        AccessibilityViolation(f'{impact}-{i}', impact, 'description', 'help')
+        for i in range(count)
+    ]
+
+
+class TestSeverityManager:
+    """Test severity scoring against the configured thresholds"""
+    
+    def test_score_follows_threshold_changes(self):
+        """Test changes to severity_thresholds are applied when scoring"""
+        manager = SeverityManager()
+        violations = _violations('serious', 2)
+        
+        assert manager._calculate_severity_score(violations) == 10.0
+        
+        manager.severity_thresholds['serious']['max_allowed'] = 0
+        assert manager._calculate_severity_score(violations) == 20.0
+        
+        manager.severity_thresholds['info'] = {'max_allowed': 4, 'weight': 2.0}
+        assert manager._calculate_severity_score(_violations('info', 2)) == 10.0
+    
+    def test_unknown_impact_uses_default_weight(self):
+        """Test impact levels without thresholds fall back to weight 1.0"""
+        manager = SeverityManager()
+        
+        assert manager._calculate_severity_score(_violations('unknown', 3)) == 30.0
+        assert manager._calculate_severity_score([]) == 0.0
+    
+    def test_trend_score_follows_threshold_changes(self):
+        """Test cached trend counts are rescored with the current thresholds"""
+        manager = SeverityManager()
+        result = TestResult(result_id='r1', page_id='p1', violations=_violations('serious', 2))
+        
+        assert manager._get_result_severity(result) == (10.0, {'serious': 2})
+        
+        manager.severity_thresholds['serious']['max_allowed'] = 0
+        assert manager._get_result_severity(result) == (20.0, {'serious': 2})
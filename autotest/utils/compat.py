@@ -0,0 +1,25 @@
+# AutoTest - Accessibility Testing Platform
+# Copyright (C) 2025 Bob Dodd
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Python version compatibility helpers for AutoTest
+"""
+
+import sys
+
+# Keyword arguments for @dataclass giving instances __slots__. dataclass(slots=True)
+# needs Python 3.10; on older interpreters instances keep a per-instance __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}